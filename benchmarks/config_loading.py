@@ -0,0 +1,55 @@
+"""Benchmark loading of instrument, acquisition and gui yaml configs with and without the parse cache.
+Run with python benchmarks/config_loading.py [yaml files]. Defaults to configs in instruments and examples/resources"""
+
+import sys
+import tempfile
+import os
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("VIEW_CACHE_DIR", tempfile.mkdtemp())  # start from a cold cache
+
+from view import config_loader  # noqa: E402
+from view.config_loader import load_config  # noqa: E402
+
+ROOT = Path(__file__).parent.parent
+REPEATS = 20
+
+
+def best_of(function, repeats: int = REPEATS) -> float:
+    """Fastest time of function in ms"""
+
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    return min(times) * 1e3
+
+
+def main(paths: list[Path]) -> None:
+    print(f"{'config':<80}{'lines':>7}{'rt parse':>11}{'safe parse':>12}{'rt disk':>10}{'safe disk':>11}{'memory':>9}")
+    for path in paths:
+        lines = len(path.read_text().splitlines())
+        rt = best_of(lambda: load_config(path, round_trip=True, use_cache=False))
+        safe = best_of(lambda: load_config(path, use_cache=False))
+        load_config(path, round_trip=True)  # populate cache on disk
+        load_config(path)
+
+        def from_disk(round_trip: bool):
+            config_loader._loaded.clear()  # like a new launch
+            load_config(path, round_trip=round_trip)
+
+        rt_disk = best_of(lambda: from_disk(True))
+        safe_disk = best_of(lambda: from_disk(False))
+        memory = best_of(lambda: load_config(path))
+        name = str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path)
+        print(f"{name:<80}{lines:>7}{rt:>11.2f}{safe:>12.2f}{rt_disk:>10.2f}{safe_disk:>11.2f}{memory:>9.2f}")
+    print("times are best of", REPEATS, "in ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([Path(arg).resolve() for arg in sys.argv[1:]])
+    else:
+        main(sorted([*ROOT.glob("instruments/*/*.yaml"), *ROOT.glob("examples/resources/*.yaml")]))
@@ -0,0 +1,97 @@
+"""Benchmark building and repainting the VolumeModel tile grid for growing grid sizes.
+Run with python benchmarks/volume_model_rendering.py [--2d] [grid sizes]. Moving the fov within the grid should cost
+the same for any number of tiles, and the number of boxes drawn stops growing once tiles are merged for level of
+detail. With --2d the VolumeModel2D renderer is measured instead. Repaint times of the OpenGL renderer need an OpenGL
+context, on machines without one only build times and the number of items are reported"""
+
+import sys
+from time import perf_counter
+import numpy as np
+from qtpy.QtWidgets import QApplication
+
+app = QApplication(sys.argv[:1])
+
+
+REPEATS = 5
+
+
+def best_of(function, repeats: int = REPEATS) -> float:
+    """Fastest time of function in ms"""
+
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    return min(times) * 1e3
+
+
+def grid(size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Coordinates and scan volumes of a size x size grid"""
+
+    rows, columns = np.meshgrid(np.arange(size), np.arange(size), indexing="ij")
+    coords = np.stack([columns * 1.0, rows * 1.0, np.zeros_like(rows, dtype=float)], axis=-1)
+    return coords, np.full((size, size), 10.0)
+
+
+def main(sizes: list[int], two_d: bool = False) -> None:
+    if two_d:
+        from view.widgets.acquisition_widgets.volume_model_2d import VolumeModel2D as VolumeModel
+    else:
+        from view.widgets.acquisition_widgets.volume_model import VolumeModel
+    model = VolumeModel(
+        limits=[[0, 200], [0, 200], [0, 20]], fov_dimensions=[1.0, 1.0, 0], coordinate_plane=["x", "y", "z"]
+    )
+    model.resize(800, 600)
+    model.show()
+    app.processEvents()
+    can_paint = two_d or model.isValid()
+    repaint = model.grab if two_d else model.grabFramebuffer
+    items = model.view_box.addedItems if two_d else model.items
+
+    columns = ["build", "toggle 1", "fov move", "frame", "repaint"]
+    print(f"{'grid':>9}{'tiles':>8}{'items':>10}{'boxes':>8}" + "".join(f"{column:>10}" for column in columns))
+    for size in sizes:
+        coords, volumes = grid(size)
+
+        def build():
+            model.grid_coords = coords
+            model.scan_volumes = volumes
+            model.tile_visibility = np.ones((size, size), dtype=bool)
+            model.render_model()
+
+        build_ms = best_of(build)
+
+        def toggle():  # hide or show a single tile
+            visibility = model.tile_visibility.copy()
+            visibility[0, 0] = not visibility[0, 0]
+            model.tile_visibility = visibility
+            model.render_model()
+
+        toggle_ms = best_of(toggle)
+        positions = iter(np.random.default_rng(0).uniform(0, size - 1, (REPEATS, 3)) * [1, 1, 0])
+
+        def move():  # stage poll within grid
+            model.fov_position = list(next(positions))
+            model.render_model()
+
+        move_ms = best_of(move)
+        model.fov_position = [size / 2, size / 2, 0]
+        model.render_model()
+
+        def frame():  # reframe view from scratch
+            model.framing_key = None
+            model._update_opts()
+
+        frame_ms = best_of(frame)
+        repaint_ms = best_of(repaint) if can_paint else float("nan")
+        name = f"{size}x{size}"
+        times = f"{build_ms:>10.2f}{toggle_ms:>10.2f}{move_ms:>10.2f}{frame_ms:>10.2f}{repaint_ms:>10.2f}"
+        boxes = model.tile_lod.tileCount() if model.tile_lod.visible() else model.tile_grid.tileCount()
+        print(f"{name:>9}{size * size:>8}{len(items):>10}{boxes:>8}{times}")
+    print("times are best of", REPEATS, "in ms" + ("" if can_paint else ", no OpenGL context for repaints"))
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    main([int(arg) for arg in arguments if arg != "--2d"] or [1, 10, 25, 50, 100, 300], "--2d" in arguments)
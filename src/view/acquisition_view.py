@@ -1,6 +1,12 @@
 import logging
 import importlib
-from view.widgets.base_device_widget import BaseDeviceWidget, scan_for_properties, create_widget, label_maker
+from view.widgets.base_device_widget import (
+    BaseDeviceWidget,
+    scan_for_properties,
+    create_widget,
+    label_maker,
+    type_coercer,
+)
 from view.widgets.acquisition_widgets.metadata_widget import MetadataWidget
 from view.widgets.acquisition_widgets.volume_plan_widget import (
     VolumePlanWidget,
@@ -8,11 +14,10 @@ from view.widgets.acquisition_widgets.volume_plan_widget import (
     GridWidthHeight,
     GridRowsColumns,
 )
-from view.widgets.acquisition_widgets.volume_model import VolumeModel
 from view.widgets.acquisition_widgets.channel_plan_widget import ChannelPlanWidget
-from qtpy.QtCore import Slot, Qt
+from qtpy.QtCore import Slot, Qt, QTimer
 import inflection
-from time import sleep
+from time import sleep, monotonic
 from qtpy.QtWidgets import (
     QGridLayout,
     QWidget,
@@ -39,6 +44,10 @@ from napari.qt.threading import thread_worker, create_worker
 from view.widgets.miscellaneous_widgets.q_dock_widget_title_bar import QDockWidgetTitleBar
 from view.widgets.miscellaneous_widgets.q_scrollable_float_slider import QScrollableFloatSlider
 from view.widgets.miscellaneous_widgets.q_scrollable_line_edit import QScrollableLineEdit
+from view.property_refresh_planner import PropertyRefreshPlanner
+from view.motion_estimator import MotionEstimator
+from view.startup_profiler import StartupProfiler
+from view.config_persister import ConfigPersister
 from pathlib import Path
 from typing import Literal, Union, Iterator
 import numpy as np
@@ -55,14 +64,21 @@ class AcquisitionView(QWidget):
         acquisition,
         instrument_view,
         log_level: Literal["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO",
+        profile_startup: bool = None,
+        headless: bool = None,
     ):
         """
         :param acquisition: voxel acquisition object
         :param instrument_view: view object relating to instrument. Needed to lock stage
         :param log_level: level to set logger at
+        :param profile_startup: record and log timing of startup. If None, enabled by VIEW_PROFILE_STARTUP env variable
+        :param headless: build view with no display and skip queries on quit. If None, enabled when qt is running on
+        the offscreen platform
         """
 
         super().__init__()
+        self.profiler = StartupProfiler("acquisition_view", profile_startup)
+        self.headless = QApplication.platformName() == "offscreen" if headless is None else headless
         self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.log.setLevel(log_level)
         self.setStyleSheet(napari.qt.get_current_stylesheet())
@@ -78,26 +94,55 @@ class AcquisitionView(QWidget):
         self.grab_fov_positions_worker = None
         self.property_workers = []
 
+        # predict fov position between stage polls so fov moves smoothly. Without motion limits, polled positions are
+        # shown as they arrive
+        fov_motion = self.config["acquisition_view"].get("fov_motion", {})
+        self.fov_poll_interval = fov_motion.get("poll_interval_s", 0.1)
+        self.fov_estimator = None
+        self.fov_timer = QTimer(timeout=self.show_predicted_fov_position)
+        if "max_velocity" in fov_motion and "max_acceleration" in fov_motion:
+            self.fov_estimator = MotionEstimator(fov_motion["max_velocity"], fov_motion["max_acceleration"])
+            self.fov_timer.setInterval(int(1000 / fov_motion.get("frame_rate", 30)))
+
+        # planners deciding which properties to re-read after an operation property is changed
+        self.refresh_planners = {}
+
+        # save operation changes in the background and recover changes from a session that crashed
+        self.acquisition_persister = None
+        if isinstance(getattr(self.acquisition, "config_path", None), (str, Path)):
+            self.acquisition_persister = ConfigPersister(
+                self.acquisition.config_path,
+                self.acquisition.config,
+                self.config["acquisition_view"].get("autosave", False),
+            )
+        self.operation_config_paths = {}  # id of operation to path of keys to its specs in acquisition config
+
         # create workers for latest image taken by cameras
-        for camera_name, camera in self.instrument.cameras.items():
-            worker = self.grab_property_value(camera, "latest_frame", camera_name)
-            worker.yielded.connect(lambda args: self.update_acquisition_layer(*args))
-            worker.start()
-            worker.pause()  # start and pause, so we can resume when acquisition starts and pause when over
-            self.property_workers.append(worker)
+        with self.profiler.section("latest frame workers"):
+            for camera_name, camera in self.instrument.cameras.items():
+                worker = self.grab_property_value(camera, "latest_frame", camera_name)
+                worker.yielded.connect(lambda args: self.update_acquisition_layer(*args))
+                worker.start()
+                worker.pause()  # start and pause, so we can resume when acquisition starts and pause when over
+                self.property_workers.append(worker)
 
-        for device_name, operation_dictionary in self.acquisition.config["acquisition"]["operations"].items():
-            for operation_name, operation_specs in operation_dictionary.items():
-                self.create_operation_widgets(device_name, operation_name, operation_specs)
+        with self.profiler.section("create_operation_widgets"):
+            for device_name, operation_dictionary in self.acquisition.config["acquisition"]["operations"].items():
+                for operation_name, operation_specs in operation_dictionary.items():
+                    with self.profiler.section(f"{device_name} {operation_name}"):
+                        self.create_operation_widgets(device_name, operation_name, operation_specs)
 
         # setup additional widgets
-        self.metadata_widget = self.create_metadata_widget()
-        self.acquisition_widget = self.create_acquisition_widget()
+        with self.profiler.section("create_metadata_widget"):
+            self.metadata_widget = self.create_metadata_widget()
+        with self.profiler.section("create_acquisition_widget"):
+            self.acquisition_widget = self.create_acquisition_widget()
         self.start_button = self.create_start_button()
         self.stop_button = self.create_stop_button()
 
         # setup stage thread
-        self.setup_fov_position()
+        with self.profiler.section("setup_fov_position"):
+            self.setup_fov_position()
 
         # Set up main window
         self.main_layout = QGridLayout()
@@ -153,6 +198,8 @@ class AcquisitionView(QWidget):
         self.config_save_to = self.acquisition.config_path
         app.lastWindowClosed.connect(self.close)  # shut everything down when closing
 
+        self.profiler.finish()
+
     def create_start_button(self) -> QPushButton:
         """
         Create button to start acquisition
@@ -336,23 +383,33 @@ class AcquisitionView(QWidget):
 
         fov_dimensions = self.config["acquisition_view"]["fov_dimensions"]
 
+        # deferred so OpenGL and pyqtgraph.opengl only load once the volume model is built. The 2d renderer doesn't
+        # need OpenGL at all
+        volume_model_config = self.config["acquisition_view"]["acquisition_widgets"].get("volume_model", {})
+        if volume_model_config.get("renderer", "opengl") == "2d":
+            from view.widgets.acquisition_widgets.volume_model_2d import VolumeModel2D as VolumeModel
+        else:
+            from view.widgets.acquisition_widgets.volume_model import VolumeModel
+
         acquisition_widget = QSplitter(Qt.Vertical)
         acquisition_widget.setChildrenCollapsible(False)
 
         # create volume plan
-        self.volume_plan = VolumePlanWidget(
-            limits=limits, fov_dimensions=fov_dimensions, coordinate_plane=self.coordinate_plane, unit=self.unit
-        )
+        with self.profiler.section("VolumePlanWidget"):
+            self.volume_plan = VolumePlanWidget(
+                limits=limits, fov_dimensions=fov_dimensions, coordinate_plane=self.coordinate_plane, unit=self.unit
+            )
         self.volume_plan.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Minimum)
 
         # create volume model
-        self.volume_model = VolumeModel(
-            limits=limits,
-            fov_dimensions=fov_dimensions,
-            coordinate_plane=self.coordinate_plane,
-            unit=self.unit,
-            **self.config["acquisition_view"]["acquisition_widgets"].get("volume_model", {}).get("init", {}),
-        )
+        with self.profiler.section("VolumeModel"):
+            self.volume_model = VolumeModel(
+                limits=limits,
+                fov_dimensions=fov_dimensions,
+                coordinate_plane=self.coordinate_plane,
+                unit=self.unit,
+                **volume_model_config.get("init", {}),
+            )
         # combine floating volume_model widget with glwindow
         combined_layout = QGridLayout()
         combined_layout.addWidget(self.volume_model, 0, 0, 3, 1)
@@ -362,12 +419,13 @@ class AcquisitionView(QWidget):
         acquisition_widget.addWidget(create_widget("H", self.volume_plan, combined))
 
         # create channel plan
-        self.channel_plan = ChannelPlanWidget(
-            instrument_view=self.instrument_view,
-            channels=self.instrument.config["instrument"]["channels"],
-            unit=self.unit,
-            **self.config["acquisition_view"]["acquisition_widgets"].get("channel_plan", {}).get("init", {}),
-        )
+        with self.profiler.section("ChannelPlanWidget"):
+            self.channel_plan = ChannelPlanWidget(
+                instrument_view=self.instrument_view,
+                channels=self.instrument.config["instrument"]["channels"],
+                unit=self.unit,
+                **self.config["acquisition_view"]["acquisition_widgets"].get("channel_plan", {}).get("init", {}),
+            )
         # place volume_plan.tile_table and channel plan table side by side
         table_splitter = QSplitter(Qt.Horizontal)
         table_splitter.setChildrenCollapsible(False)
@@ -400,6 +458,7 @@ class AcquisitionView(QWidget):
         self.volume_plan.valueChanged.connect(self.volume_plan_changed)
         self.channel_plan.channelAdded.connect(self.channel_plan_changed)
         self.channel_plan.channelChanged.connect(self.update_tiles)
+        self.instrument_view.profileChanged.connect(self.apply_profile)
 
         # TODO: This feels like a clunky connection. Works for now but could probably be improved
         self.volume_plan.header.startChanged.connect(lambda i: self.create_tile_list())
@@ -407,6 +466,21 @@ class AcquisitionView(QWidget):
 
         return acquisition_widget
 
+    def apply_profile(self, diff) -> None:
+        """
+        Update acquisition widgets after instrument view switched profile. Only channels that changed are rebuilt
+        :param diff: ProfileDiff of changes that were applied
+        """
+
+        if diff.channels:
+            self.channel_plan.update_channels(sorted(diff.channels, key=str), self.instrument_view)
+        if ("acquisition_view", "fov_dimensions") in diff.gui_keys:
+            fov_dimensions = list(self.config["acquisition_view"]["fov_dimensions"])
+            self.volume_plan.fov_dimensions = fov_dimensions
+            self.volume_model.fov_dimensions = fov_dimensions[:2] + [0]
+        if ("acquisition_view", "autosave") in diff.gui_keys and self.acquisition_persister is not None:
+            self.acquisition_persister.autosave = self.config["acquisition_view"]["autosave"]
+
     def channel_plan_changed(self, channel: str) -> None:
         """
         Handle channel being added to scan
@@ -426,14 +500,12 @@ class AcquisitionView(QWidget):
 
         tile_volumes = self.volume_plan.scan_ends - self.volume_plan.scan_starts
 
-        # update volume model
-        self.volume_model.blockSignals(True)  # only trigger update once
-        # self.volume_model.fov_dimensions = self.volume_plan.fov_dimensions
+        # update volume model. Changes are applied together on next frame
         self.volume_model.grid_coords = self.volume_plan.tile_positions
         self.volume_model.scan_volumes = tile_volumes
-        self.volume_model.blockSignals(False)
         self.volume_model.tile_visibility = self.volume_plan.tile_visibility
-        self.volume_model.set_path_pos([self.volume_model.grid_coords[t.row][t.col] for t in value])
+        order = np.array([[t.row, t.col] for t in value], dtype=int).reshape(-1, 2)
+        self.volume_model.set_path_pos(self.volume_model.grid_coords[order[:, 0], order[:, 1]])
 
         # update channel plan
         self.channel_plan.apply_all = self.volume_plan.apply_all
@@ -456,6 +528,9 @@ class AcquisitionView(QWidget):
         """
         scalar_coord_plane = [x.strip("-") for x in self.coordinate_plane]
         stage_names = {stage.instrument_axis: name for name, stage in self.instrument.tiling_stages.items()}
+        if self.fov_estimator is not None:
+            self.fov_estimator.set_target(fov_position)
+            self.fov_timer.start()
         # Move stages
         for axis, position in zip(scalar_coord_plane[:2], fov_position[:2]):
             self.instrument.tiling_stages[stage_names[axis]].move_absolute_mm(position, wait=False)
@@ -472,6 +547,8 @@ class AcquisitionView(QWidget):
             **getattr(self.instrument, "tiling_stages", {}),
         }.items():  # combine stage
             stage.halt()
+        if self.fov_estimator is not None:
+            self.fov_estimator.stop()
 
     def setup_fov_position(self) -> None:
         """
@@ -479,14 +556,42 @@ class AcquisitionView(QWidget):
         """
 
         self.grab_fov_positions_worker = self.grab_fov_positions()
-        self.grab_fov_positions_worker.yielded.connect(lambda pos: setattr(self.volume_plan, "fov_position", pos))
-        self.grab_fov_positions_worker.yielded.connect(lambda pos: setattr(self.volume_model, "fov_position", pos))
+        self.grab_fov_positions_worker.yielded.connect(self.fov_position_polled)
         self.grab_fov_positions_worker.start()
 
+    def fov_position_polled(self, sample: tuple[list[float, float, float], float]) -> None:
+        """
+        Show polled stage position or correct predicted position with it. The volume plan is only updated with polled
+        positions since updating it recalculates the grid
+        :param sample: polled position of fov and time it was read
+        """
+
+        fov_position, timestamp = sample
+        self.volume_plan.fov_position = fov_position
+        if self.fov_estimator is None:
+            self.volume_model.fov_position = fov_position
+            return
+        self.fov_estimator.add_sample(fov_position, timestamp)
+        self.show_predicted_fov_position()
+        if self.fov_estimator.moving():
+            self.fov_timer.start()
+
+    def show_predicted_fov_position(self) -> None:
+        """
+        Show predicted fov position in volume model at display time. Timer stops once stages are predicted to be at rest
+        """
+
+        fov_position = self.fov_estimator.predict()
+        if fov_position is None:
+            return
+        self.volume_model.fov_position = fov_position.tolist()
+        if not self.fov_estimator.moving():
+            self.fov_timer.stop()
+
     @thread_worker
-    def grab_fov_positions(self) -> Iterator[list[float, float, float]]:
+    def grab_fov_positions(self) -> Iterator[tuple[list[float, float, float], float]]:
         """
-        Grab stage position from all stage objects and yield positions
+        Grab stage position from all stage objects and yield positions with the mean time they were read at
         """
         scalar_coord_plane = [x.strip("-") for x in self.coordinate_plane]
         while True:  # best way to do this or have some sort of break?
@@ -495,16 +600,18 @@ class AcquisitionView(QWidget):
                 self.volume_plan.fov_position[1],
                 self.volume_plan.fov_position[2],
             ]
+            read_times = []
             for name, stage in {**self.instrument.tiling_stages, **self.instrument.scanning_stages}.items():
                 if stage.instrument_axis in scalar_coord_plane:
                     index = scalar_coord_plane.index(stage.instrument_axis)
                     try:
                         pos = stage.position_mm
+                        read_times.append(monotonic())
                         fov_pos[index] = pos if pos is not None else self.volume_plan.fov_position[index]
                     except ValueError as e:  # Tigerbox sometime coughs up garbage. Locking issue?
                         pass
-                    sleep(0.1)
-            yield fov_pos
+                    sleep(self.fov_poll_interval)
+            yield fov_pos, sum(read_times) / len(read_times) if read_times else monotonic()
 
     def create_operation_widgets(self, device_name: str, operation_name: str, operation_specs: dict) -> None:
         """
@@ -516,20 +623,32 @@ class AcquisitionView(QWidget):
 
         operation_type = operation_specs["type"]
         operation = getattr(self.acquisition, inflection.pluralize(operation_type))[device_name][operation_name]
+        self.operation_config_paths[id(operation)] = ("acquisition", "operations", device_name, operation_name)
 
         specs = self.config["acquisition_view"]["operation_widgets"].get(device_name, {}).get(operation_name, {})
         if specs.get("type", "") == operation_type and "driver" in specs.keys() and "module" in specs.keys():
-            gui_class = getattr(importlib.import_module(specs["driver"]), specs["module"])
-            gui = gui_class(operation, **specs.get("init", {}))  # device gets passed into widget
+            with self.profiler.section("import"):
+                gui_class = getattr(importlib.import_module(specs["driver"]), specs["module"])
+            with self.profiler.section("read and build"):  # custom widgets read operation while building
+                gui = gui_class(operation, **specs.get("init", {}))  # device gets passed into widget
         else:
-            properties = scan_for_properties(operation)
-            gui = BaseDeviceWidget(type(operation), properties)  # create label
+            with self.profiler.section("read"):
+                properties = scan_for_properties(operation)
+            with self.profiler.section("build"):
+                gui = BaseDeviceWidget(type(operation), properties)  # create label
 
         # if gui is BaseDeviceWidget or inherits from it
         if type(gui) == BaseDeviceWidget or BaseDeviceWidget in type(gui).__bases__:
+            # dependencies can be declared by the operation class or in the gui yaml
+            dependencies = {
+                **getattr(type(operation), "property_dependencies", {}),
+                **specs.get("property_dependencies", {}),
+            }
+            planner = PropertyRefreshPlanner(dependencies)
+            self.refresh_planners[f"{device_name} {operation_name}"] = planner
             # Hook up widgets to device_property_changed
             gui.ValueChangedInside[str].connect(
-                lambda value, op=operation, widget=gui: self.operation_property_changed(value, op, widget)
+                lambda value, op=operation, widget=gui, p=planner: self.operation_property_changed(value, op, widget, p)
             )
 
             updating_props = specs.get("updating_properties", [])
@@ -624,13 +743,55 @@ class AcquisitionView(QWidget):
         except (RuntimeError, AttributeError):  # Pass when window's closed or widget doesn't have position_mm_widget
             pass
 
+    @thread_worker
+    def refresh_property_values(self, operation: object, property_names: list[str], operation_widget) -> Iterator:
+        """
+        Read values of properties off the gui thread and yield
+        :param operation: operation to grab properties from
+        :param property_names: names of properties to read
+        :param operation_widget: widget of entire operation that is the parent of property widgets
+        :return: value of property, widget to update, and name of property
+        """
+
+        for property_name in property_names:
+            try:
+                value = getattr(operation, property_name)
+            except ValueError:  # Some attributes in processes raise ValueError if not started
+                continue
+            yield value, operation_widget, property_name
+
+    def update_refreshed_property_value(
+        self, value, operation_widget, property_name: str, changed_name: str, planner: PropertyRefreshPlanner
+    ) -> None:
+        """
+        Update widget with re-read property value and let planner know if the value changed
+        :param value: value to update with
+        :param operation_widget: widget of entire operation that is the parent of property widget
+        :param property_name: name of property re-read
+        :param changed_name: name of property the user changed
+        :param planner: planner that scheduled the re-read
+        """
+
+        try:
+            changed = bool(getattr(operation_widget, property_name, None) != value)
+        except ValueError:  # array like values
+            changed = True
+        planner.observe(changed_name, property_name, changed)
+        try:
+            setattr(operation_widget, property_name, value)  # setting attribute value will update widget
+        except (RuntimeError, AttributeError):  # Pass when window's closed
+            pass
+
     @Slot(str)
-    def operation_property_changed(self, attr_name: str, operation: object, widget) -> None:
+    def operation_property_changed(
+        self, attr_name: str, operation: object, widget, planner: PropertyRefreshPlanner = None
+    ) -> None:
         """
         Slot to signal when operation widget has been changed
         :param widget: widget object relating to operation
         :param operation: operation object
         :param attr_name: name of attribute
+        :param planner: planner deciding which properties to re-read. If None, all properties are re-read
         """
 
         name_lst = attr_name.split(".")
@@ -641,13 +802,24 @@ class AcquisitionView(QWidget):
             for k in name_lst[1:]:
                 dictionary = dictionary[k]
             setattr(operation, name_lst[0], value)
+            self.persist_operation_setting(operation, name_lst[0], value)
             self.log.info(f"Device changed to {getattr(operation, name_lst[0])}")
             # Update ui with new operation values that might have changed
             # WARNING: Infinite recursion might occur if operation property not set correctly
-            for k, v in widget.property_widgets.items():
-                if getattr(widget, k, False):
-                    operation_value = getattr(operation, k)
-                    setattr(widget, k, operation_value)
+            planner = PropertyRefreshPlanner() if planner is None else planner
+            candidates = [k for k in widget.property_widgets.keys() if getattr(widget, k, False)]
+            property_names, full_refresh = planner.plan(name_lst[0], candidates)
+            self.log.debug(
+                f"Refreshing {property_names} after {attr_name} changed"
+                f"{' to learn dependencies' if full_refresh else ''}"
+            )
+            worker = self.refresh_property_values(operation, property_names, widget)
+            worker.yielded.connect(
+                lambda args, name=name_lst[0]: self.update_refreshed_property_value(*args, name, planner)
+            )
+            if full_refresh:  # observations of full refresh are learned once all properties are re-read
+                worker.finished.connect(lambda name=name_lst[0]: planner.finish(name))
+            worker.start()
 
         except (KeyError, TypeError) as e:
             self.log.warning(f"{attr_name} can't be mapped into operation properties due to {e}")
@@ -701,35 +873,50 @@ class AcquisitionView(QWidget):
                         column_name = label_maker(f"{device_name}_{prop}")
                         if getattr(self.channel_plan, column_name, None) is not None:
                             array = getattr(self.channel_plan, column_name)[channel]
-                            input_type = self.channel_plan.column_data_types[column_name]
-                            if input_type is not None:
-                                tile_dict[device_name][prop] = input_type(array[row, column])
-                            else:
-                                tile_dict[device_name][prop] = array[row, column]
+                            coerce = type_coercer(self.channel_plan.column_data_types[column_name])
+                            tile_dict[device_name][prop] = coerce(array[row, column])
             else:
                 column_name = label_maker(f"{device_type}")
                 if getattr(self.channel_plan, column_name, None) is not None:
                     array = getattr(self.channel_plan, column_name)[channel]
-                    input_type = self.channel_plan.column_data_types[column_name]
-                    if input_type is not None:
-                        tile_dict[device_type] = input_type(array[row, column])
-                    else:
-                        tile_dict[device_type] = array[row, column]
+                    coerce = type_coercer(self.channel_plan.column_data_types[column_name])
+                    tile_dict[device_type] = coerce(array[row, column])
 
         for name in ["steps", "step_size", "prefix"]:
             array = getattr(self.channel_plan, name)[channel]
             tile_dict[name] = array[row, column]
         return tile_dict
 
+    def persist_operation_setting(self, operation: object, property_name: str, value) -> None:
+        """
+        Record changed operation property in settings of acquisition config so it is autosaved and journaled
+        :param operation: operation that was changed
+        :param property_name: name of property
+        :param value: value property was set to
+        """
+
+        path = self.operation_config_paths.get(id(operation), None)
+        if self.acquisition_persister is None or path is None:
+            return
+        operation_specs = self.acquisition.config
+        for key in path:
+            operation_specs = operation_specs[key]
+        if property_name in operation_specs.get("settings", {}):
+            operation_specs["settings"][property_name] = value
+            self.acquisition_persister.mark_dirty(path + ("settings", property_name))
+
     def update_config_on_quit(self) -> None:
         """
         Add functionality to close function to save device properties to instrument config
         """
 
-        return_value = self.update_config_query()
-        if return_value == QMessageBox.Ok:
-            self.acquisition.update_current_state_config()
-            self.acquisition.save_config(self.config_save_to)
+        if not self.headless:  # no one to answer query if headless
+            return_value = self.update_config_query()
+            if return_value == QMessageBox.Ok:
+                self.acquisition.update_current_state_config()
+                self.acquisition.save_config(self.config_save_to)
+        if self.acquisition_persister is not None:
+            self.acquisition_persister.discard_journal()  # changes have been saved or deliberately discarded
 
     def update_config_query(self) -> None:
         """
@@ -771,9 +958,16 @@ class AcquisitionView(QWidget):
         Close operations and end threads
         """
 
+        if self.acquisition_persister is not None:
+            self.acquisition_persister.stop()
+            if self.acquisition_persister.autosave:
+                self.acquisition_persister.flush()
+
         for worker in self.property_workers:
             worker.quit()
         self.grab_fov_positions_worker.quit()
+        self.fov_timer.stop()
+        self.volume_model.clear_fov_images()
         for device_name, operation_dictionary in self.acquisition.config["acquisition"]["operations"].items():
             for operation_name, operation_specs in operation_dictionary.items():
                 operation_type = operation_specs["type"]
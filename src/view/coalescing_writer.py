@@ -0,0 +1,112 @@
+import logging
+import threading
+from time import monotonic
+
+
+class CoalescingWriter:
+    """Class to run a slow function, like writing to hardware, on a worker thread at a limited rate. Calls submitted
+    while the worker is busy or rate limited are coalesced per key so only the latest arguments are used. The last
+    submitted call for every key is always run, so a burst of edits converges to the final value"""
+
+    def __init__(self, function, max_rate_hz: float = 10.0, name: str = "writer"):
+        """
+        :param function: function to run
+        :param max_rate_hz: maximum number of times function is run per second for each key. 0 means no limit
+        :param name: name of worker thread
+        """
+
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.function = function
+        self.max_rate_hz = max_rate_hz
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._pending = {}  # key to latest arguments
+        self._last_run = {}  # key to time function was last run
+        self._running = 0  # number of calls in progress
+        self._stopped = False
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    @property
+    def interval(self) -> float:
+        """Minimum time between runs for a key in seconds"""
+
+        return 1 / self.max_rate_hz if self.max_rate_hz else 0.0
+
+    def submit(self, key, *args, **kwargs) -> None:
+        """
+        Submit call of function. Replaces any pending call with same key
+        :param key: key calls are coalesced by, like name of device
+        :param args: arguments of function
+        :param kwargs: keyword arguments of function
+        """
+
+        with self._lock:
+            self._pending[key] = (args, kwargs)
+            self._wake.notify_all()
+
+    def _next_due(self) -> tuple:
+        """
+        Find pending key that can run soonest. Must hold lock
+        :return: key and time it can run
+        """
+
+        due = {key: self._last_run.get(key, float("-inf")) + self.interval for key in self._pending}
+        key = min(due, key=due.get)
+        return key, due[key]
+
+    def _run(self) -> None:
+        """
+        Run pending calls as they become due
+        """
+
+        while True:
+            with self._lock:
+                while True:
+                    if self._stopped:
+                        return
+                    if self._pending:
+                        key, due = self._next_due()
+                        now = monotonic()
+                        if now >= due:
+                            break
+                        self._wake.wait(due - now)
+                    else:
+                        self._wake.wait()
+                args, kwargs = self._pending.pop(key)
+                self._last_run[key] = now
+                self._running += 1
+            try:
+                self.function(*args, **kwargs)
+            except Exception:  # keep worker alive for later writes
+                self.log.exception(f"{getattr(self.function, '__name__', self.function)} failed for {key}")
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._wake.notify_all()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until all submitted calls have run. Rate limits still apply
+        :param timeout: maximum time to wait in seconds
+        :return: whether all calls have run
+        """
+
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._lock:
+            while self._pending or self._running:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._wake.wait(remaining)
+        return True
+
+    def stop(self) -> None:
+        """
+        Stop worker thread. Pending calls are dropped
+        """
+
+        with self._lock:
+            self._stopped = True
+            self._wake.notify_all()
+        self._worker.join(timeout=5)
@@ -0,0 +1,83 @@
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Union
+from view.gui_state_cache import cache_directory
+
+log = logging.getLogger(__name__)
+
+# parsed configs of this process keyed by path and mode, stored pickled so every caller gets its own copy
+_loaded = {}
+
+
+def config_cache_key(path: Path, round_trip: bool) -> tuple:
+    """
+    Key identifying a version of a config file. Parsing is skipped while path, modification time and size match
+    :param path: resolved path of config
+    :param round_trip: whether config is parsed in round trip mode
+    :return: key
+    """
+
+    from ruamel.yaml import __version__ as ruamel_version
+
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size, "rt" if round_trip else "safe", ruamel_version
+
+
+def parse_config(path: Path, round_trip: bool):
+    """
+    Parse yaml config
+    :param path: path of config
+    :param round_trip: parse in round trip mode, keeping comments and formatting so config can be saved again
+    :return: parsed config
+    """
+
+    from ruamel.yaml import YAML  # deferred since ruamel is slow to import
+
+    yaml = YAML() if round_trip else YAML(typ="safe", pure=True)
+    return yaml.load(path)
+
+
+def load_config(path: Union[Path, str], round_trip: bool = False, use_cache: bool = True):
+    """
+    Load yaml config, reusing a cached parse of the same file if it hasn't changed. Parsed configs are cached in
+    memory and pickled to the view cache directory so later launches skip parsing too
+    :param path: path of config
+    :param round_trip: return ruamel round trip structure that keeps comments. Only needed if config will be saved,
+    otherwise plain dictionaries and lists are returned
+    :param use_cache: whether to use cached parses
+    :return: parsed config
+    """
+
+    path = Path(path).resolve()
+    if not use_cache:
+        return parse_config(path, round_trip)
+
+    key = config_cache_key(path, round_trip)
+    if key in _loaded:  # in memory
+        return pickle.loads(_loaded[key])
+
+    cache_path = cache_directory() / "configs" / f"{hashlib.sha1(f'{key[0]} {key[3]}'.encode()).hexdigest()}.pickle"
+    try:
+        with open(cache_path, "rb") as file:
+            cached_key, data = pickle.load(file)
+        if cached_key == key:
+            _loaded[key] = data
+            return pickle.loads(data)
+    except Exception:  # missing, corrupt or written by incompatible version
+        pass
+
+    config = parse_config(path, round_trip)
+    data = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    _loaded[key] = data
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = cache_path.with_suffix(".tmp")
+        with open(temporary, "wb") as file:
+            pickle.dump((key, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+    except OSError as e:
+        log.debug(f"could not cache {path}: {e}")
+    return config
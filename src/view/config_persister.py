@@ -0,0 +1,312 @@
+import copy
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from time import monotonic
+from typing import Union
+from view.config_loader import load_config
+
+
+def write_yaml_atomic(path: Union[Path, str], data, yaml=None) -> None:
+    """
+    Write yaml so the file is either fully old or fully new if the process dies mid write. Data is dumped to a
+    temporary file next to path, flushed to disk and renamed over path
+    :param path: path of yaml file
+    :param data: data to dump
+    :param yaml: ruamel YAML instance to dump with. Defaults to round trip YAML
+    """
+
+    if yaml is None:
+        from ruamel.yaml import YAML
+
+        yaml = YAML()
+    path = Path(path)
+    temporary = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(temporary, "w") as file:
+            yaml.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    try:  # make rename durable
+        directory = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+    except OSError:  # directories can't be opened on some platforms
+        pass
+
+
+def path_get(data, path: tuple):
+    """
+    Get value at path of keys within nested dictionaries and lists
+    :param data: nested dictionaries and lists
+    :param path: tuple of keys
+    :return: value
+    """
+
+    for key in path:
+        data = data[key]
+    return data
+
+
+def path_set(data, path: tuple, value) -> None:
+    """
+    Set value at path of keys within nested dictionaries and lists
+    :param data: nested dictionaries and lists
+    :param path: tuple of keys
+    :param value: value to set
+    """
+
+    path_get(data, path[:-1])[path[-1]] = value
+
+
+class ConfigPersister:
+    """Class to save a configuration in the background. Changed subtrees are marked dirty and copied on the gui
+    thread. A writer thread journals them to disk shortly after, with one entry per changed subtree, debounces changes
+    and, if autosave is on, atomically rewrites the yaml. If the process crashes, changes in the journal are recovered
+    on the next launch"""
+
+    def __init__(
+        self,
+        path: Union[Path, str],
+        data,
+        autosave: bool = False,
+        debounce_s: float = 1.0,
+        max_delay_s: float = 60.0,
+        journal_path: Union[Path, str] = None,
+        journal_delay_s: float = 0.1,
+    ):
+        """
+        :param path: path of yaml file data was loaded from
+        :param data: loaded configuration that is changed during gui use
+        :param autosave: whether to write changes to path in the background
+        :param debounce_s: time without changes to wait before writing
+        :param max_delay_s: longest time changes wait to be written while changes keep coming in
+        :param journal_path: path of journal. Defaults to hidden file next to path
+        :param journal_delay_s: time changes are collected before journal is rewritten
+        """
+
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.path = Path(path)
+        self.data = data
+        self.autosave = autosave
+        self.debounce_s = debounce_s
+        self.max_delay_s = max_delay_s
+        self.journal_delay_s = journal_delay_s
+        self.journal_path = (
+            Path(journal_path) if journal_path is not None else self.path.with_name(f".{self.path.name}.journal")
+        )
+
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # serializes writes from writer thread and flush
+        self._wake = threading.Condition(self._lock)
+        self._pending = {}  # path of dirty subtree to copy of subtree
+        self._first_change = None
+        self._last_change = None
+        self._journal_due = None  # time journal is rewritten with pending changes
+        self._stopped = False
+        self._shadow = None  # round trip copy of file only touched by writer, loaded on first write
+
+        self.recovered = self.recover()
+
+        self._writer = threading.Thread(target=self._write_loop, name=f"persist {self.path.name}", daemon=True)
+        self._writer.start()
+
+    def recover(self) -> list[tuple]:
+        """
+        Apply changes from journal left by a session that didn't shut down cleanly
+        :return: list of recovered paths
+        """
+
+        try:
+            lines = self.journal_path.read_text().splitlines()
+        except OSError:
+            return []
+
+        recovered = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                path = tuple(entry["path"])
+                path_set(self.data, path, entry["value"])
+            except (ValueError, KeyError, IndexError, TypeError):  # partially written line or config has changed
+                continue
+            recovered.append(path)
+        if recovered:
+            self.log.warning(f"recovered {len(recovered)} unsaved changes to {self.path} from {self.journal_path}")
+            for path in dict.fromkeys(recovered):
+                self.mark_dirty(path, journal=False)
+        return recovered
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes that haven't been written"""
+
+        with self._lock:
+            return bool(self._pending)
+
+    def mark_dirty(self, path: tuple, journal: bool = True) -> None:
+        """
+        Mark subtree of data as changed. Only the subtree is copied so marking is cheap for large configs. Journaling
+        is left to the writer thread
+        :param path: tuple of keys to changed subtree
+        :param journal: whether to journal change
+        """
+
+        path = tuple(path)
+        value = copy.deepcopy(path_get(self.data, path))
+        with self._lock:
+            self._merge(path, value)
+            now = monotonic()
+            if journal and self._journal_due is None:
+                self._journal_due = now + self.journal_delay_s
+            self._first_change = self._first_change or now
+            self._last_change = now
+            self._wake.notify()
+
+    def _merge(self, path: tuple, value) -> None:
+        """
+        Add changed subtree to pending changes, replacing changes it covers. Must hold lock
+        :param path: tuple of keys to changed subtree
+        :param value: copy of subtree
+        """
+
+        parent = next((p for p in self._pending if p != path and path[: len(p)] == p), None)
+        if parent is not None:  # change is within a subtree that is already pending
+            path_set(self._pending[parent], path[len(parent) :], value)
+        else:
+            for child in [p for p in self._pending if p[: len(path)] == path]:
+                del self._pending[child]  # covered by this subtree
+            self._pending[path] = value
+
+    def _write_journal(self) -> None:
+        """
+        Rewrite journal with pending changes. Superseded changes are dropped, so the journal holds one entry per
+        changed subtree no matter how often it was edited
+        """
+
+        with self._write_lock:
+            with self._lock:
+                self._journal_due = None
+                lines = []
+                for path, value in self._pending.items():
+                    try:
+                        lines.append(json.dumps({"path": list(path), "value": value}))
+                    except (TypeError, ValueError):
+                        self.log.debug(f"change to {path} can't be journaled")
+            if not lines:
+                self.discard_journal()
+                return
+            temporary = self.journal_path.with_name(f"{self.journal_path.name}.tmp")
+            try:
+                temporary.write_text("\n".join(lines) + "\n")
+                os.replace(temporary, self.journal_path)
+            except OSError as e:
+                self.log.warning(f"could not journal changes to {self.journal_path}: {e}")
+
+    def _write_loop(self) -> None:
+        """
+        Journal changes shortly after they're made and wait for changes to settle, then write them
+        """
+
+        while True:
+            with self._lock:
+                action = None
+                while not self._stopped:
+                    now = monotonic()
+                    dues = []
+                    if self._journal_due is not None:
+                        dues.append((self._journal_due, "journal"))
+                    if self._pending and self.autosave:
+                        save_due = min(self._last_change + self.debounce_s, self._first_change + self.max_delay_s)
+                        dues.append((save_due, "save"))
+                    if not dues:
+                        self._wake.wait()
+                        continue
+                    due, action = min(dues)
+                    if now >= due:
+                        break
+                    self._wake.wait(due - now)
+                stopped = self._stopped
+            if stopped:
+                if self._journal_due is not None:  # changes made since journal was last written
+                    self._write_journal()
+                return
+            if action == "journal":
+                self._write_journal()
+            else:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Write pending changes to path now
+        """
+
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                first_change, self._first_change = self._first_change, None
+            if not pending:
+                return
+            if self._shadow is None:
+                self._shadow = self.load_shadow()
+            for path, value in pending.items():
+                try:
+                    path_set(self._shadow, path, value)
+                except (KeyError, IndexError, TypeError):
+                    self.log.warning(f"{path} is not in saved copy of {self.path} and won't be saved")
+            try:
+                write_yaml_atomic(self.path, self._shadow)
+            except Exception as e:  # keep writer alive if data can't be written or represented in yaml
+                self.log.warning(f"could not save {self.path}: {e}")
+                with self._lock:  # keep changes pending so they stay journaled, newer changes take precedence
+                    newer, self._pending = self._pending, {}
+                    for path, value in [*pending.items(), *newer.items()]:
+                        self._merge(path, value)
+                    self._first_change = first_change or self._first_change
+                return
+        self.log.debug(f"saved {len(pending)} changed sections of {self.path}")
+        with self._lock:
+            if not self._pending:  # journal is only needed until its changes are written
+                self.discard_journal()
+
+    def load_shadow(self):
+        """
+        Load copy of file changes are written into. Data may have been loaded as plain dictionaries, so file is loaded
+        again in round trip mode to keep its comments and formatting
+        :return: round trip copy of file or copy of data if file doesn't exist yet
+        """
+
+        try:
+            return load_config(self.path, round_trip=True, use_cache=False)  # parsed once per persister
+        except FileNotFoundError:  # no formatting to keep
+            return copy.deepcopy(self.data)
+
+    def discard_journal(self) -> None:
+        """
+        Remove journal, like when changes have been saved or deliberately thrown away
+        """
+
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.log.warning(f"could not remove {self.journal_path}: {e}")
+
+    def stop(self) -> None:
+        """
+        Stop writer thread
+        """
+
+        with self._lock:
+            self._stopped = True
+            self._wake.notify()
+        self._writer.join(timeout=5)
@@ -0,0 +1,250 @@
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from math import ceil, sqrt
+from pathlib import Path
+from typing import Union
+import numpy as np
+
+
+def fingerprint(image: np.ndarray, samples: int = 4096) -> str:
+    """
+    Cheap key identifying an image. Hashes shape, dtype and a strided sample of pixels instead of whole image
+    :param image: image to identify
+    :param samples: approximate number of pixels to sample
+    :return: hex digest
+    """
+
+    image = np.asarray(image)
+    step = max(1, ceil(sqrt(image.size / samples)))
+    digest = hashlib.sha1(f"{image.shape} {image.dtype}".encode())
+    digest.update(np.ascontiguousarray(image[::step, ::step]).tobytes())
+    return digest.hexdigest()
+
+
+class MosaicTile:
+    """Snapshot stored in a FovMosaic"""
+
+    def __init__(self, handle: int, key: str, position: list[float], shape: tuple, data: np.ndarray):
+        """
+        :param handle: handle of snapshot
+        :param key: fingerprint of original image
+        :param position: position of fov when snapshot was taken
+        :param shape: shape of original image
+        :param data: downsampled image
+        """
+
+        self.handle = handle
+        self.key = key
+        self.position = position
+        self.shape = shape
+        self.data = data
+        self.levels = None  # contrast levels of texture
+        self.texture = None  # rgba texture of downsampled image
+        self.original_path = None  # path of memory mapped original if spilled
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by downsampled image and texture"""
+
+        return self.data.nbytes + self.texture.nbytes
+
+
+class FovMosaic:
+    """Class to store fov snapshots shown in the volume model within a memory budget. Every snapshot gets an integer
+    handle and is downsampled so its texture has at most max_texels texels. When the stored snapshots use more than
+    max_bytes, the least recently used are evicted. Originals can be spilled to memory mapped files so full resolution
+    data stays available without being held in memory"""
+
+    def __init__(
+        self,
+        max_texels: int = 512 * 512,
+        max_bytes: int = 512 * 1024**2,
+        spill_directory: Union[Path, str] = None,
+        alpha: int = 255,
+        evicted=None,
+    ):
+        """
+        :param max_texels: maximum number of texels of each snapshot texture
+        :param max_bytes: maximum memory used by downsampled snapshots and their textures
+        :param spill_directory: directory to spill originals to. If None, originals aren't kept
+        :param alpha: alpha of textures where 255 is fully opaque
+        :param evicted: function called with handle of every evicted snapshot
+        """
+
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.max_texels = max_texels
+        self.max_bytes = max_bytes
+        self.spill_directory = Path(spill_directory) if spill_directory is not None else None
+        self.alpha = alpha
+        self.evicted = evicted
+        self.tiles = OrderedDict()  # handle to tile in order of least to most recently used
+        self.handles = {}  # fingerprint of original to handle
+        self.nbytes = 0
+        self._next_handle = 0
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self.tiles
+
+    def downsample(self, image: np.ndarray) -> np.ndarray:
+        """
+        Downsample image by an integer stride so it has at most max_texels pixels
+        :param image: image to downsample
+        :return: downsampled copy of image
+        """
+
+        step = max(1, ceil(sqrt(image.shape[0] * image.shape[1] / self.max_texels)))
+        return np.array(image[::step, ::step])
+
+    def add(self, image: np.ndarray, levels: list[float], position: list[float]) -> int:
+        """
+        Store snapshot and evict least recently used snapshots if over budget
+        :param image: snapshot
+        :param levels: contrast levels of snapshot
+        :param position: position of fov when snapshot was taken
+        :return: handle of snapshot
+        """
+
+        image = np.asarray(image)
+        handle = self._next_handle
+        self._next_handle += 1
+        tile = MosaicTile(handle, fingerprint(image), list(position), image.shape, self.downsample(image))
+        self.render(tile, levels)
+        if self.spill_directory is not None:
+            tile.original_path = self.spill(handle, image)
+
+        self.tiles[handle] = tile
+        self.handles[tile.key] = handle
+        self.nbytes += tile.nbytes
+        self.evict()
+        return handle
+
+    def render(self, tile: MosaicTile, levels: list[float]) -> None:
+        """
+        Compute texture of snapshot. Texture is allocated once and rewritten in place when levels change
+        :param tile: snapshot
+        :param levels: contrast levels
+        """
+
+        tile.levels = list(levels)
+        if tile.texture is None:
+            tile.texture = np.empty(tile.data.shape + (4,), dtype=np.ubyte)
+            tile.texture[:, :, 3] = self.alpha
+
+        # map intensities to gray values in place so texture is never reallocated
+        low, high = levels
+        span = max(high - low, 1e-12)
+        gray = tile.texture[:, :, 0]
+        if tile.data.dtype.kind == "u" and tile.data.dtype.itemsize <= 2:  # look up every possible intensity
+            lut = np.clip((np.arange(2 ** (8 * tile.data.dtype.itemsize)) - low) * 255 / span, 0, 255).astype(np.ubyte)
+            np.take(lut, tile.data, out=gray, mode="clip")
+        else:
+            gray[:] = np.clip((tile.data.astype(float) - low) * 255 / span, 0, 255)
+        tile.texture[:, :, 1] = gray
+        tile.texture[:, :, 2] = gray
+
+    def spill(self, handle: int, image: np.ndarray) -> Union[Path, None]:
+        """
+        Write original image to a memory mapped file
+        :param handle: handle of snapshot
+        :param image: original image
+        :return: path of file or None if it couldn't be written
+        """
+
+        try:
+            self.spill_directory.mkdir(parents=True, exist_ok=True)
+            file, path = tempfile.mkstemp(prefix=f"snapshot_{handle}_", suffix=".npy", dir=self.spill_directory)
+            os.close(file)
+            original = np.lib.format.open_memmap(path, mode="w+", dtype=image.dtype, shape=image.shape)
+            original[:] = image
+            original.flush()
+            del original
+            return Path(path)
+        except OSError as e:
+            self.log.warning(f"could not spill snapshot {handle} to {self.spill_directory}: {e}")
+            return None
+
+    def evict(self) -> None:
+        """
+        Evict least recently used snapshots until within budget. The newest snapshot is always kept
+        """
+
+        while self.nbytes > self.max_bytes and len(self.tiles) > 1:
+            handle = next(iter(self.tiles))
+            self.log.info(f"evicting snapshot {handle} to stay within {self.max_bytes} bytes")
+            self.remove(handle)
+            if self.evicted is not None:
+                self.evicted(handle)
+
+    def remove(self, handle: int) -> None:
+        """
+        Remove snapshot and delete its spilled original
+        :param handle: handle of snapshot
+        """
+
+        tile = self.tiles.pop(handle)
+        if self.handles.get(tile.key) == handle:
+            del self.handles[tile.key]
+        self.nbytes -= tile.nbytes
+        if tile.original_path is not None:
+            try:
+                tile.original_path.unlink()
+            except OSError:  # still mapped on some platforms
+                self.log.debug(f"could not delete {tile.original_path}")
+
+    def clear(self) -> None:
+        """
+        Remove all snapshots
+        """
+
+        for handle in list(self.tiles):
+            self.remove(handle)
+
+    def find(self, image: np.ndarray) -> Union[int, None]:
+        """
+        Find handle of snapshot taken from image
+        :param image: original image
+        :return: handle or None if image isn't stored
+        """
+
+        return self.handles.get(fingerprint(image))
+
+    def get(self, handle: int) -> MosaicTile:
+        """
+        Get snapshot and mark it as recently used
+        :param handle: handle of snapshot
+        :return: stored snapshot
+        """
+
+        self.tiles.move_to_end(handle)
+        return self.tiles[handle]
+
+    def set_levels(self, handle: int, levels: list[float]) -> MosaicTile:
+        """
+        Recompute texture of snapshot in place with new contrast levels
+        :param handle: handle of snapshot
+        :param levels: contrast levels
+        :return: updated snapshot
+        """
+
+        tile = self.get(handle)
+        if list(levels) != tile.levels:
+            self.render(tile, levels)
+        return tile
+
+    def original(self, handle: int) -> np.ndarray:
+        """
+        Full resolution snapshot if it was spilled, otherwise downsampled snapshot
+        :param handle: handle of snapshot
+        :return: read only memory map of original or downsampled image
+        """
+
+        tile = self.get(handle)
+        if tile.original_path is not None:
+            return np.load(tile.original_path, mmap_mode="r")
+        return tile.data
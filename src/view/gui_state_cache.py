@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Union
+
+CACHE_ENV_VAR = "VIEW_CACHE_DIR"
+
+
+def cache_directory() -> Path:
+    """
+    Directory caches are kept in
+    :return: directory in VIEW_CACHE_DIR environment variable or ~/.cache/view
+    """
+
+    return Path(os.environ.get(CACHE_ENV_VAR, Path.home() / ".cache" / "view"))
+
+
+def module_version(module_name: str) -> str:
+    """
+    Version string of a driver module. Combines the package __version__ with size and modification time of the
+    module's source so edits to an installed driver are noticed too
+    :param module_name: name of module
+    :return: version string
+    """
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        return "missing"
+    package = sys.modules.get(module_name.split(".")[0], module)
+    version = str(getattr(package, "__version__", ""))
+    try:
+        stat = os.stat(module.__file__)
+        version += f" {stat.st_size} {stat.st_mtime_ns}"
+    except (TypeError, AttributeError, OSError):  # built in or namespace module without a file
+        pass
+    return version
+
+
+class GuiStateCache:
+    """Class to persist derived gui state between launches so a warm start can skip introspection. The cache is keyed
+    by a hash of config files and driver module versions and is discarded when any of them change"""
+
+    def __init__(
+        self,
+        name: Union[Path, str],
+        config_paths: list[Union[Path, str]] = None,
+        modules: list[str] = None,
+        directory: Union[Path, str] = None,
+    ):
+        """
+        :param name: name identifying cache, like path of gui config
+        :param config_paths: config files whose contents key the cache
+        :param modules: names of driver modules whose versions key the cache
+        :param directory: directory to store cache in. Defaults to directory in VIEW_CACHE_DIR environment
+        variable or ~/.cache/view
+        """
+
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        directory = cache_directory() if directory is None else Path(directory)
+        self.path = directory / f"{hashlib.sha1(str(name).encode()).hexdigest()}.json"
+        self.key = self.compute_key(config_paths or [], modules or [])
+        self.sections = {}
+        self.warm = False
+        self.load()
+
+    @staticmethod
+    def compute_key(config_paths: list[Union[Path, str]], modules: list[str]) -> str:
+        """
+        Hash contents of config files and versions of modules
+        :param config_paths: config files to hash
+        :param modules: names of modules to hash versions of
+        :return: hex digest
+        """
+
+        digest = hashlib.sha256()
+        for path in config_paths:
+            try:
+                digest.update(Path(path).read_bytes())
+            except (OSError, TypeError):
+                digest.update(f"missing {path}".encode())
+        for module_name in sorted(set(modules)):
+            digest.update(f"{module_name} {module_version(module_name)}".encode())
+        return digest.hexdigest()
+
+    def load(self) -> None:
+        """
+        Load cache from disk if it was written with the same key
+        """
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("key") == self.key:
+            self.sections = data.get("sections", {})
+            self.warm = True
+        else:
+            self.log.info("gui state cache is out of date and will be rebuilt")
+
+    def get(self, section: str, default=None):
+        """
+        Get cached section
+        :param section: name of section
+        :param default: value if section isn't cached
+        :return: cached value
+        """
+
+        return self.sections.get(section, default)
+
+    def set(self, section: str, value) -> None:
+        """
+        Set section. Value must be serializable to json
+        :param section: name of section
+        :param value: value to cache
+        """
+
+        self.sections[section] = value
+
+    def save(self) -> None:
+        """
+        Write cache to disk
+        """
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_suffix(".tmp")
+            temporary.write_text(json.dumps({"key": self.key, "sections": self.sections}))
+            os.replace(temporary, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            self.log.warning(f"could not save gui state cache to {self.path}: {e}")
@@ -0,0 +1,186 @@
+from collections import deque
+from time import perf_counter
+from types import SimpleNamespace
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QMainWindow, QDockWidget, QWidget
+import numpy as np
+
+AREAS = {
+    "left": Qt.LeftDockWidgetArea,
+    "right": Qt.RightDockWidgetArea,
+    "top": Qt.TopDockWidgetArea,
+    "bottom": Qt.BottomDockWidgetArea,
+}
+
+
+class HeadlessEmitter:
+    """Minimal stand-in for a napari event emitter"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def connect(self, callback) -> None:
+        """
+        Connect callback to emitter
+        :param callback: function called with event when emitted
+        """
+
+        self.callbacks.append(callback)
+
+    def __call__(self, **kwargs) -> None:
+        """
+        Emit event to connected callbacks
+        """
+
+        for callback in self.callbacks:
+            callback(kwargs)
+
+
+class HeadlessImageLayer:
+    """Stand-in for a napari image layer that records when its data is updated"""
+
+    def __init__(self, data: np.ndarray, name: str, viewer):
+        """
+        :param data: image data
+        :param name: name of layer
+        :param viewer: viewer layer belongs to
+        """
+
+        self.name = name
+        self.viewer = viewer
+        self.multiscale = isinstance(data, (list, tuple))
+        self.mouse_drag_callbacks = []
+        self.events = SimpleNamespace(data=HeadlessEmitter(), contrast_limits=HeadlessEmitter())
+        self.updates = 0
+        self._data = data
+        image = data[-1] if self.multiscale else data
+        self._contrast_limits = [float(np.min(image)), float(np.max(image))] if np.size(image) else [0.0, 1.0]
+
+    @property
+    def data(self):
+        """Image data of layer"""
+
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        """
+        Set image data of layer and record update
+        :param value: image data
+        """
+
+        self._data = value
+        self.updates += 1
+        self.viewer.record(self.name)
+        self.events.data(value=value)
+
+    @property
+    def contrast_limits(self) -> list[float]:
+        """Contrast limits of layer"""
+
+        return self._contrast_limits
+
+    @contrast_limits.setter
+    def contrast_limits(self, value: list[float]):
+        """
+        Set contrast limits of layer
+        :param value: minimum and maximum of contrast limits
+        """
+
+        self._contrast_limits = list(value)
+        self.events.contrast_limits(value=self._contrast_limits)
+
+
+class HeadlessLayerList(dict):
+    """Stand-in for napari layer list, a dictionary of layers by name"""
+
+
+class HeadlessWindow:
+    """Stand-in for napari window that docks widgets in a plain QMainWindow"""
+
+    def __init__(self, title: str):
+        """
+        :param title: title of window
+        """
+
+        self._qt_window = QMainWindow()
+        self._qt_window.setWindowTitle(title)
+        self._qt_window.setCentralWidget(QWidget())
+
+    def add_dock_widget(
+        self, widget: QWidget, area: str = "right", name: str = "", add_vertical_stretch: bool = True
+    ) -> QDockWidget:
+        """
+        Dock widget in window
+        :param widget: widget to dock
+        :param area: side of window to dock in
+        :param name: name of dock
+        :param add_vertical_stretch: unused, kept to match napari
+        :return: dock widget
+        """
+
+        dock = QDockWidget(name, self._qt_window)
+        dock.setObjectName(name)
+        dock.setWidget(widget)
+        self._qt_window.addDockWidget(AREAS.get(area, Qt.RightDockWidgetArea), dock)
+        return dock
+
+    def remove_dock_widget(self, dock: QDockWidget) -> None:
+        """
+        Remove docked widget from window
+        :param dock: dock widget returned by add_dock_widget
+        """
+
+        self._qt_window.removeDockWidget(dock)
+        dock.deleteLater()
+
+
+class HeadlessViewer:
+    """Light stand-in for napari.Viewer used to build views with no display or GPU, like on CI. Layer updates are
+    recorded so benchmarks can measure how often frames reach the viewer"""
+
+    def __init__(self, title: str = "View", max_records: int = 10000, **kwargs):
+        """
+        :param title: title of window
+        :param max_records: number of layer updates to keep
+        :param kwargs: napari.Viewer arguments, ignored
+        """
+
+        self.theme = "dark"
+        self.window = HeadlessWindow(title)
+        self.layers = HeadlessLayerList()
+        self.updates = deque(maxlen=max_records)  # layer name and time of each update
+
+    def add_image(self, data: np.ndarray, name: str, **kwargs) -> HeadlessImageLayer:
+        """
+        Add image layer
+        :param data: image data
+        :param name: name of layer
+        :param kwargs: napari add_image arguments, ignored
+        :return: layer
+        """
+
+        layer = HeadlessImageLayer(data, name, self)
+        self.layers[name] = layer
+        self.record(name)
+        return layer
+
+    def record(self, name: str) -> None:
+        """
+        Record layer update
+        :param name: name of layer that was updated
+        """
+
+        self.updates.append((name, perf_counter()))
+
+    def update_rate(self, name: str = None) -> float:
+        """
+        Rate of recorded layer updates
+        :param name: name of layer. If None, updates of all layers are counted
+        :return: updates per second
+        """
+
+        times = [time for layer_name, time in self.updates if name is None or layer_name == name]
+        if len(times) < 2 or times[-1] == times[0]:
+            return 0.0
+        return (len(times) - 1) / (times[-1] - times[0])
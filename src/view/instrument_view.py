@@ -1,14 +1,17 @@
-from ruamel.yaml import YAML
-from qtpy.QtCore import Slot, Signal, Qt
+from qtpy.QtCore import Slot, Signal, Qt, QByteArray, QTimer
 from qtpy.QtGui import QMouseEvent
 from pathlib import Path
 import importlib
 from view.widgets.base_device_widget import (
     BaseDeviceWidget,
     create_widget,
-    pathGet,
+    PathRegistry,
     scan_for_properties,
     disable_button,
+    export_introspection,
+    load_introspection,
+    property_snapshot,
+    setter_coercer,
 )
 from qtpy.QtWidgets import (
     QStyle,
@@ -31,19 +34,26 @@ from qtpy.QtWidgets import (
     QFileDialog,
     QScrollArea,
 )
-import tifffile
 from napari.qt.threading import thread_worker, create_worker
 from napari.utils.theme import get_theme
 import napari
-import datetime
-from time import sleep
+from time import sleep, perf_counter
 import logging
 import inflection
-import inspect
 from view.widgets.miscellaneous_widgets.q_scrollable_line_edit import QScrollableLineEdit
 from view.widgets.miscellaneous_widgets.q_scrollable_float_slider import QScrollableFloatSlider
 from view.widgets.miscellaneous_widgets.q_dock_widget_title_bar import QDockWidgetTitleBar
+from view.property_refresh_planner import PropertyRefreshPlanner
+from view.startup_profiler import StartupProfiler
+from view.gui_state_cache import GuiStateCache
+from view.headless_viewer import HeadlessViewer
+from view.config_persister import ConfigPersister, path_get
+from view.config_loader import load_config
+from view.coalescing_writer import CoalescingWriter
+from view.profile_manager import ProfileManager, ProfileDiff, ProfileSwitchError
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from typing import Literal, Union, Iterator
 
 
@@ -52,19 +62,26 @@ class InstrumentView(QWidget):
 
     snapshotTaken = Signal((np.ndarray, list))
     contrastChanged = Signal((np.ndarray, list))
+    profileChanged = Signal(object)
 
     def __init__(
         self,
         instrument,
         config_path: Path,
         log_level: Literal["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO",
+        profile_startup: bool = None,
+        headless: bool = None,
     ):
         """
         :param instrument: voxel like instrument object
         :param config_path: path to gui config yaml
         :param log_level: level to set logger
+        :param profile_startup: record and log timing of startup. If None, enabled by VIEW_PROFILE_STARTUP env variable
+        :param headless: replace napari viewer with a stand-in that records layer updates. If None, enabled when qt
+        is running on the offscreen platform
         """
         super().__init__()
+        self.profiler = StartupProfiler("instrument_view", profile_startup)
 
         self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.log.setLevel(log_level)
@@ -87,44 +104,108 @@ class InstrumentView(QWidget):
         self.grab_frames_worker = create_worker(lambda: None)  # dummy thread
         self.property_workers = []  # list of property workers
 
+        # planners deciding which properties to re-read after a device property is changed
+        self.refresh_planners = {}
+        # compiled accessors into data acquisition tasks for each daq
+        self.config_paths = {}
+
         # Eventual attributes
         self.livestream_channel = None
         self.snapshot = False  # flag to signal snapshot has been taken
+        self.daqs_live = False  # flag to signal daq tasks are set up and started for livestream
 
         self.instrument = instrument
         self.config_path = config_path
-        self.config = YAML().load(config_path)
+        with self.profiler.section("load config"):
+            self.config = load_config(config_path)
+            if self.config["instrument_view"].get("autosave", False):  # config will be saved so keep its formatting
+                self.config = load_config(config_path, round_trip=True)
 
         # Convenient config maps
         self.channels = self.instrument.config["instrument"]["channels"]
 
+        # save changes made in gui in the background and recover changes from a session that crashed
+        autosave = self.config["instrument_view"].get("autosave", False)
+        self.config_persister = ConfigPersister(config_path, self.config, autosave)
+        self.instrument_persister = None  # instrument config may not be backed by a file
+        if isinstance(getattr(self.instrument, "config_path", None), (str, Path)):
+            self.instrument_persister = ConfigPersister(self.instrument.config_path, self.instrument.config, autosave)
+        self.device_config_paths = {id(device): path for name, device, path in self.iterate_devices()}
+
+        # switch to other gui and instrument profiles without restarting
+        self.profile_manager = ProfileManager(self.config, self.instrument.config)
+
+        # coalesce waveform edits so dragging a slider doesn't rewrite daqs and config on every event
+        max_rate_hz = self.config["instrument_view"].get("max_waveform_write_rate_hz", 10)
+        self.waveform_writer = CoalescingWriter(self.write_waveforms, max_rate_hz, "waveform writer")
+        self.waveform_write_timeout_s = self.config["instrument_view"].get("waveform_write_timeout_s", 5)
+        self.daq_lock = threading.Lock()  # daqs are driven by gui thread and waveform writer, one at a time
+        self.pending_config_waveforms = {}  # daq name and attribute name to daq widget
+        self.config_waveforms_timer = QTimer(self)
+        self.config_waveforms_timer.setSingleShot(True)
+        self.config_waveforms_timer.setInterval(int(1000 / max_rate_hz) if max_rate_hz else 0)
+        self.config_waveforms_timer.timeout.connect(self.apply_config_waveforms)
+
+        # Load state derived on previous launch so device classes and drivers don't need to be introspected again
+        with self.profiler.section("load gui state cache"):
+            self.state_cache = GuiStateCache(
+                config_path,
+                [config_path, getattr(self.instrument, "config_path", None)],
+                self.driver_modules(),
+            )
+            load_introspection(self.state_cache.get("introspection", {}))
+
         # Setup napari window
-        self.viewer = napari.Viewer(title="View", ndisplay=2, axis_labels=("x", "y"))
+        self.headless = QApplication.platformName() == "offscreen" if headless is None else headless
+        with self.profiler.section("napari viewer"):
+            if self.headless:
+                self.viewer = HeadlessViewer(title="View", ndisplay=2, axis_labels=("x", "y"))
+            else:
+                self.viewer = napari.Viewer(title="View", ndisplay=2, axis_labels=("x", "y"))
 
         # setup daq with livestreaming tasks
-        self.setup_daqs()
+        with self.profiler.section("setup_daqs"):
+            self.setup_daqs()
+
+        # Read devices concurrently then build widgets on gui thread from what was read
+        with self.profiler.section("prefetch_device_properties"):
+            snapshot = self.prefetch_device_properties()
 
         # Set up instrument widgets
-        for device_name, device_specs in self.instrument.config["instrument"]["devices"].items():
-            self.create_device_widgets(device_name, device_specs)
+        with self.profiler.section("create_device_widgets"), property_snapshot(snapshot):
+            for device_name, device_specs in self.instrument.config["instrument"]["devices"].items():
+                self.create_device_widgets(device_name, device_specs)
 
         # setup widget additional functionalities
-        self.setup_camera_widgets()
-        self.setup_channel_widget()
-        self.setup_stage_widgets()
-        self.setup_laser_widgets()
-        self.setup_daq_widgets()
-        self.setup_filter_wheel_widgets()
+        for setup in [
+            self.setup_camera_widgets,
+            self.setup_channel_widget,
+            self.setup_stage_widgets,
+            self.setup_laser_widgets,
+            self.setup_daq_widgets,
+            self.setup_filter_wheel_widgets,
+        ]:
+            with self.profiler.section(setup.__name__):
+                setup()
 
         # add undocked widget so everything closes together
-        self.add_undocked_widgets()
+        with self.profiler.section("add_undocked_widgets"):
+            self.add_undocked_widgets()
+
+        # restore dock layout of previous launch and store what was introspected
+        if dock_state := self.state_cache.get("dock_state"):
+            self.viewer.window._qt_window.restoreState(QByteArray.fromBase64(dock_state.encode()))
+        self.state_cache.set("introspection", export_introspection())
+        self.state_cache.save()
 
         # Set app events
         app = QApplication.instance()
         app.aboutToQuit.connect(self.update_config_on_quit)  # query if config should be saved and where
-        self.config_save_to = self.instrument.config_path
+        self.config_save_to = getattr(self.instrument, "config_path", None)
         app.lastWindowClosed.connect(self.close)  # shut everything down when closing
 
+        self.profiler.finish()
+
     def setup_daqs(self) -> None:
         """
         Initialize daqs with livestreaming tasks if different from data acquisition tasks
@@ -201,18 +282,33 @@ class InstrumentView(QWidget):
             # if daq_widget is BaseDeviceWidget or inherits from it, update waveforms when gui is changed
             if type(daq_widget) == BaseDeviceWidget or BaseDeviceWidget in type(daq_widget).__bases__:
                 daq_widget.ValueChangedInside[str].connect(
-                    lambda value, daq=self.instrument.daqs[daq_name]: self.write_waveforms(daq)
+                    lambda value, name=daq_name: self.waveform_writer.submit(name, self.instrument.daqs[name])
                 )
                 # update tasks if livestreaming task is different from data acquisition task
                 if daq_name in self.config["instrument_view"].get("livestream_tasks", {}).keys():
                     daq_widget.ValueChangedInside[str].connect(
-                        lambda attr, widget=daq_widget, name=daq_name: self.update_config_waveforms(
-                            widget, daq_name, attr
-                        )
+                        lambda attr, widget=daq_widget, name=daq_name: self.queue_config_waveforms(widget, name, attr)
                     )
 
         stacked = self.stack_device_widgets("daq")
-        self.viewer.window.add_dock_widget(stacked, area="right", name="DAQs", add_vertical_stretch=False)
+        self.daq_dock = self.viewer.window.add_dock_widget(
+            stacked, area="right", name="DAQs", add_vertical_stretch=False
+        )
+
+    def rebuild_daq_widgets(self) -> None:
+        """
+        Replace daq widgets with widgets built from current daq tasks, like after tasks are replaced by a new profile
+        """
+
+        old_widgets, self.daq_widgets = self.daq_widgets, {}
+        for device_name, device, path in self.iterate_devices():
+            if device_name in old_widgets:
+                device_specs = {**path_get(self.instrument.config, path), "subdevices": {}}  # keep subdevice widgets
+                self._create_device_widgets(device_name, device_specs)
+        self.viewer.window.remove_dock_widget(self.daq_dock)
+        for widget in old_widgets.values():
+            widget.deleteLater()
+        self.setup_daq_widgets()
 
     def stack_device_widgets(self, device_type: str) -> QWidget:
         """
@@ -255,17 +351,40 @@ class InstrumentView(QWidget):
 
     def write_waveforms(self, daq) -> None:
         """
-        Write waveforms if livestreaming is on
+        Write waveforms if livestreaming is on. Runs on waveform_writer thread, use waveform_writer.submit to call
         :param daq: daq object
         """
 
-        if self.grab_frames_worker.is_running:  # if currently livestreaming
-            if daq.ao_task is not None:
-                daq.generate_waveforms("ao", self.livestream_channel)
-                daq.write_ao_waveforms(rereserve_buffer=False)
-            if daq.do_task is not None:
-                daq.generate_waveforms("do", self.livestream_channel)
-                daq.write_do_waveforms(rereserve_buffer=False)
+        with self.daq_lock:
+            if self.daqs_live:  # if currently livestreaming
+                if daq.ao_task is not None:
+                    daq.generate_waveforms("ao", self.livestream_channel)
+                    daq.write_ao_waveforms(rereserve_buffer=False)
+                if daq.do_task is not None:
+                    daq.generate_waveforms("do", self.livestream_channel)
+                    daq.write_do_waveforms(rereserve_buffer=False)
+
+    def queue_config_waveforms(self, daq_widget, daq_name: str, attr_name: str) -> None:
+        """
+        Queue waveform change to be applied to config. Repeated changes of an attribute, like while dragging a slider,
+        are applied once at most max_waveform_write_rate_hz times a second
+        :param daq_widget: widget pertaining to daq object
+        :param daq_name: name of daq
+        :param attr_name: waveform attribute to update
+        """
+
+        self.pending_config_waveforms[(daq_name, attr_name)] = daq_widget
+        if not self.config_waveforms_timer.isActive():
+            self.config_waveforms_timer.start()
+
+    def apply_config_waveforms(self) -> None:
+        """
+        Apply queued waveform changes to config
+        """
+
+        pending, self.pending_config_waveforms = self.pending_config_waveforms, {}
+        for (daq_name, attr_name), daq_widget in pending.items():
+            self.update_config_waveforms(daq_widget, daq_name, attr_name)
 
     def update_config_waveforms(self, daq_widget, daq_name: str, attr_name: str) -> None:
         """
@@ -276,20 +395,23 @@ class InstrumentView(QWidget):
         :param attr_name: waveform attribute to update
         """
 
-        path = attr_name.split(".")
         value = getattr(daq_widget, attr_name)
-        self.log.debug(f"{daq_name} {attr_name} changed to {getattr(daq_widget, path[0])}")
+        self.log.debug(f"{daq_name} {attr_name} changed to {value}")
 
         # update livestream_task
         self.config["instrument_view"]["livestream_tasks"][daq_name]["tasks"] = daq_widget.tasks
+        self.config_persister.mark_dirty(("instrument_view", "livestream_tasks", daq_name, "tasks"))
 
         # update data_acquisition_tasks if value correlates
-        key = path[-1]
         try:
-            dictionary = pathGet(self.config["acquisition_view"]["data_acquisition_tasks"][daq_name], path[:-1])
-            if key not in dictionary.keys():
+            daq_tasks = self.config["acquisition_view"]["data_acquisition_tasks"][daq_name]
+            if getattr(self.config_paths.get(daq_name, None), "container", None) is not daq_tasks:
+                self.config_paths[daq_name] = PathRegistry(daq_tasks)  # recompile if tasks have been replaced
+            accessor = self.config_paths[daq_name].accessor(attr_name)
+            if accessor.key not in accessor.parent.keys():
                 raise KeyError
-            dictionary[key] = value
+            accessor.set(value)
+            self.config_persister.mark_dirty(("acquisition_view", "data_acquisition_tasks", daq_name))
             self.log.info(
                 f"Data acquisition tasks parameters updated to "
                 f"{self.config['acquisition_view']['data_acquisition_tasks'][daq_name]}"
@@ -388,20 +510,22 @@ class InstrumentView(QWidget):
             self.log.info(f"Enabling filter {filter}")
             self.instrument.filters[filter].enable()
 
-        for daq_name, daq in self.instrument.daqs.items():
-            if daq.tasks.get("ao_task", None) is not None:
-                daq.add_task("ao")
-                daq.generate_waveforms("ao", self.livestream_channel)
-                daq.write_ao_waveforms()
-            if daq.tasks.get("do_task", None) is not None:
-                daq.add_task("do")
-                daq.generate_waveforms("do", self.livestream_channel)
-                daq.write_do_waveforms()
-            if daq.tasks.get("co_task", None) is not None:
-                pulse_count = daq.tasks["co_task"]["timing"].get("pulse_count", None)
-                daq.add_task("co", pulse_count)
-
-            daq.start()
+        with self.daq_lock:  # waveform writer waits until tasks are rebuilt
+            for daq_name, daq in self.instrument.daqs.items():
+                if daq.tasks.get("ao_task", None) is not None:
+                    daq.add_task("ao")
+                    daq.generate_waveforms("ao", self.livestream_channel)
+                    daq.write_ao_waveforms()
+                if daq.tasks.get("do_task", None) is not None:
+                    daq.add_task("do")
+                    daq.generate_waveforms("do", self.livestream_channel)
+                    daq.write_do_waveforms()
+                if daq.tasks.get("co_task", None) is not None:
+                    pulse_count = daq.tasks["co_task"]["timing"].get("pulse_count", None)
+                    daq.add_task("co", pulse_count)
+
+                daq.start()
+            self.daqs_live = True
 
     def dismantle_live(self, camera_name: str) -> None:
         """
@@ -410,8 +534,10 @@ class InstrumentView(QWidget):
         """
 
         self.instrument.cameras[camera_name].abort()
-        for daq_name, daq in self.instrument.daqs.items():
-            daq.stop()
+        with self.daq_lock:  # waveforms queued while stopping are dropped by write_waveforms
+            self.daqs_live = False
+            for daq_name, daq in self.instrument.daqs.items():
+                daq.stop()
         for laser_name in self.channels[self.livestream_channel].get("lasers", []):
             self.instrument.lasers[laser_name].disable()
 
@@ -474,6 +600,9 @@ class InstrumentView(QWidget):
         """
 
         if event.button == 2:  # Left click
+            import datetime
+            import tifffile  # deferred since saving images is rarely used
+
             if layer.multiscale:
                 image = layer.data[0]
             else:
@@ -493,19 +622,34 @@ class InstrumentView(QWidget):
         Create widget to select which laser to livestream with
         """
 
-        widget = QWidget()
-        widget_layout = QVBoxLayout()
+        self.channel_widget = QWidget()
+        self.channel_widget.setLayout(QVBoxLayout())
+        self.channel_button_group = None
+        self.populate_channel_widget()
+        self.channel_widget.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Minimum)
+        self.viewer.window.add_dock_widget(self.channel_widget, area="bottom", name="Channels")
+
+    def populate_channel_widget(self) -> None:
+        """
+        Add a button for each channel to channel widget, replacing buttons of previous channels
+        """
+
+        widget_layout = self.channel_widget.layout()
+        while widget_layout.count():
+            widget_layout.takeAt(0).widget().deleteLater()
+        if self.channel_button_group is not None:
+            self.channel_button_group.deleteLater()
 
-        laser_button_group = QButtonGroup(widget)
+        self.channel_button_group = QButtonGroup(self.channel_widget)
+        buttons = {}
         for channel, specs in self.channels.items():
             button = QRadioButton(str(channel))
             button.toggled.connect(lambda value, ch=channel: self.change_channel(value, ch))
-            laser_button_group.addButton(button)
+            self.channel_button_group.addButton(button)
             widget_layout.addWidget(button)
-        button.setChecked(True)  # Arbitrarily set last button checked
-        widget.setLayout(widget_layout)
-        widget.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Minimum)
-        self.viewer.window.add_dock_widget(widget, area="bottom", name="Channels")
+            buttons[channel] = button
+        if buttons:  # keep livestream channel if it still exists, otherwise arbitrarily set last button checked
+            buttons.get(self.livestream_channel, button).setChecked(True)
 
     def change_channel(self, checked: bool, channel: str) -> None:
         """
@@ -521,16 +665,199 @@ class InstrumentView(QWidget):
                     self.instrument.lasers[old_laser_name].disable()
                 for daq_name, daq in self.instrument.daqs.items():
                     self.log.info(f"Writing new waveforms for {daq_name}")
-                    self.write_waveforms(daq)
-                for new_laser_name in self.channels[channel].get("lasers", []):
-                    self.log.info(f"Enabling laser {new_laser_name}")
-                    self.instrument.lasers[new_laser_name].enable()
+                    self.waveform_writer.submit(daq_name, daq)
+                # waveforms must be written before new lasers are enabled
+                if self.waveform_writer.wait(self.waveform_write_timeout_s):
+                    for new_laser_name in self.channels[channel].get("lasers", []):
+                        self.log.info(f"Enabling laser {new_laser_name}")
+                        self.instrument.lasers[new_laser_name].enable()
+                else:
+                    self.log.error(
+                        f"Waveforms were not written within {self.waveform_write_timeout_s} s so lasers of channel "
+                        f"{channel} were not enabled"
+                    )
             self.livestream_channel = channel
             # change filter
             for filter in self.channels[self.livestream_channel].get("filters", []):
                 self.log.info(f"Enabling filter {filter}")
                 self.instrument.filters[filter].enable()
 
+    def switch_profile(
+        self, config_path: Union[Path, str] = None, instrument_config_path: Union[Path, str] = None
+    ) -> ProfileDiff:
+        """
+        Switch to another gui and/or instrument profile without restarting. Only differences to the loaded profile are
+        applied: settings of changed devices are written to the devices, daq tasks are replaced and the daq and channel
+        widgets are rebuilt if tasks or channels changed. Other widgets and device connections are kept. Unsaved
+        changes to the previous configs are saved, or the user is asked whether to save them if autosave is off. Raises
+        ProfileSwitchError without changing configs if the profile can't be applied, restoring devices that were
+        already set if a device rejects a setting
+        :param config_path: path of new gui config. If None, gui config is unchanged
+        :param instrument_config_path: path of new instrument config. If None, instrument config is unchanged
+        :return: differences that were applied
+        """
+
+        if self.grab_frames_worker.is_running:
+            raise ProfileSwitchError("Stop livestream before switching profiles")
+
+        if not self.waveform_writer.wait(self.waveform_write_timeout_s):
+            raise ProfileSwitchError("Waveforms of current profile are still being written")
+        self.apply_config_waveforms()  # finish edits of the current profile before it's compared to the new one
+
+        start = perf_counter()
+        diff = self.profile_manager.diff(
+            config_path, instrument_config_path, round_trip=self.config["instrument_view"].get("autosave", False)
+        )
+        if diff.empty:
+            return diff
+
+        # check that whole profile can be applied before anything is changed
+        self.profile_manager.validate(diff)  # raises if devices would need to be reconnected
+        if diff.livestream_tasks:
+            gui_config = diff.gui_config
+            for daq_name in gui_config["instrument_view"].get("livestream_tasks", {}).keys() & self.instrument.daqs:
+                if not gui_config["acquisition_view"].get("data_acquisition_tasks", {}).get(daq_name, False):
+                    raise ProfileSwitchError(f"Daq {daq_name} has a livestreaming task but no data acquisition task")
+        devices = {path: (name, device) for name, device, path in self.iterate_devices()}
+        writes = []  # device name, device, widget of device, setting and coerced value
+        for path, settings in diff.device_settings.items():
+            device_name, device = devices[path]
+            device_specs = path_get(diff.instrument_config, path)
+            widget = getattr(self, f"{device_specs['type']}_widgets", {}).get(device_name, None)
+            for setting in sorted(settings):
+                try:
+                    value = setter_coercer(type(device), setting)(device_specs["settings"][setting])
+                except (TypeError, ValueError, KeyError) as e:
+                    raise ProfileSwitchError(f"{setting} of {device_name} can't be set from new profile: {e}") from e
+                writes.append((device_name, device, widget, setting, value))
+
+        # reconfigure devices whose settings changed, restoring previous settings if a device rejects a value
+        written = []  # device, setting and previous value
+        try:
+            for device_name, device, widget, setting, value in writes:
+                previous = getattr(device, setting)
+                self.log.info(f"Setting {setting} of {device_name} to {value}")
+                setattr(device, setting, value)
+                written.append((device, setting, previous))
+        except Exception as e:
+            for device, setting, previous in reversed(written):
+                try:
+                    setattr(device, setting, previous)
+                except Exception:
+                    self.log.exception(f"could not restore {setting} of {device}")
+            raise ProfileSwitchError(f"{setting} of {device_name} could not be set to {value}: {e}") from e
+
+        # devices accepted new profile so configs are changed from here on
+        self.profile_manager.apply(diff)
+
+        # save changes to files of new profile from now on
+        autosave = self.config["instrument_view"].get("autosave", False)
+        if config_path is not None:
+            self.close_persister(self.config_persister)
+            self.config_path = config_path
+            self.config_persister = ConfigPersister(self.config_path, self.config, autosave)
+        if instrument_config_path is not None:
+            if self.instrument_persister is not None:
+                self.close_persister(self.instrument_persister)
+            self.instrument.config_path = instrument_config_path
+            self.config_save_to = instrument_config_path
+            self.instrument_persister = ConfigPersister(self.instrument.config_path, self.instrument.config, autosave)
+        for persister in [self.config_persister, self.instrument_persister]:
+            if persister is not None:
+                persister.autosave = autosave
+
+        # cache derived gui state under new configs
+        self.state_cache = GuiStateCache(
+            self.config_path,
+            [self.config_path, getattr(self.instrument, "config_path", None)],
+            self.driver_modules(),
+        )
+        self.state_cache.set("introspection", export_introspection())
+        self.state_cache.save()
+
+        # show new settings in device widgets
+        for device_name, device, widget, setting, value in writes:
+            if widget is not None:
+                self.update_property_value(getattr(device, setting), widget, setting)
+
+        if diff.livestream_tasks or diff.acquisition_tasks:
+            self.setup_daqs()
+            self.config_paths.clear()  # tasks have been replaced
+        if diff.livestream_tasks:  # widgets would write tasks of previous profile back to config on next edit
+            self.rebuild_daq_widgets()
+
+        if ("instrument_view", "max_waveform_write_rate_hz") in diff.gui_keys:
+            max_rate_hz = self.config["instrument_view"]["max_waveform_write_rate_hz"]
+            self.waveform_writer.max_rate_hz = max_rate_hz
+            self.config_waveforms_timer.setInterval(int(1000 / max_rate_hz) if max_rate_hz else 0)
+
+        if diff.channels:
+            self.populate_channel_widget()
+
+        self.profileChanged.emit(diff)
+        self.log.info(f"Switched profile in {perf_counter() - start:.2f} s")
+        return diff
+
+    def driver_modules(self) -> list[str]:
+        """
+        Names of driver modules of all devices and subdevices in instrument
+        :return: list of module names
+        """
+
+        modules = ["view.widgets.base_device_widget"]  # introspection depends on this module too
+        modules.extend(type(device).__module__ for name, device, path in self.iterate_devices())
+        return modules
+
+    def iterate_devices(self) -> Iterator[tuple[str, object, tuple]]:
+        """
+        Iterate through all devices and subdevices in instrument
+        :return: name of device, device object and path of keys to device specs in instrument config
+        """
+
+        def walk(devices: dict, path: tuple) -> Iterator[tuple[str, object, tuple]]:
+            for device_name, device_specs in devices.items():
+                device = getattr(self.instrument, inflection.pluralize(device_specs["type"]))[device_name]
+                yield device_name, device, path + (device_name,)
+                yield from walk(device_specs.get("subdevices", {}), path + (device_name, "subdevices"))
+
+        yield from walk(self.instrument.config["instrument"]["devices"], ("instrument", "devices"))
+
+    def prefetch_device_properties(self) -> dict:
+        """
+        Read properties of all devices concurrently so slow links are read in parallel instead of one after another.
+        A device and its subdevices, and devices with the same lock_group in the gui yaml, are read sequentially on
+        one thread since they share a connection. Subdevices are always read with their parent, so a lock_group of a
+        subdevice is ignored
+        :return: dictionary mapping id of device to dictionary of its properties
+        """
+
+        groups = {}
+
+        def group_devices(device_name: str, device_specs: dict, group: str) -> None:
+            device = getattr(self.instrument, inflection.pluralize(device_specs["type"]))[device_name]
+            groups.setdefault(group, []).append((device_name, device))
+            for subdevice_name, subdevice_specs in device_specs.get("subdevices", {}).items():
+                group_devices(subdevice_name, subdevice_specs, group)
+
+        device_widgets = self.config["instrument_view"]["device_widgets"]
+        for name, specs in self.instrument.config["instrument"]["devices"].items():
+            group_devices(name, specs, device_widgets.get(name, {}).get("lock_group", name))
+
+        def read_group(devices: list) -> dict:
+            properties = {}
+            for device_name, device in devices:
+                try:
+                    properties[id(device)] = scan_for_properties(device)
+                except Exception as e:  # device is read again when its widget is built
+                    self.log.warning(f"could not prefetch properties of {device_name}: {e}")
+            return properties
+
+        snapshot = {}
+        with ThreadPoolExecutor(max_workers=max(len(groups), 1), thread_name_prefix="prefetch") as pool:
+            for properties in pool.map(read_group, groups.values()):
+                snapshot.update(properties)
+        return snapshot
+
     def create_device_widgets(self, device_name: str, device_specs: dict) -> None:
         """
         Create widgets based on device dictionary attributes from instrument or acquisition
@@ -538,22 +865,43 @@ class InstrumentView(QWidget):
          :param device_specs: dictionary dictating how device should be set up
         """
 
+        with self.profiler.section(device_name):
+            self._create_device_widgets(device_name, device_specs)
+
+    def _create_device_widgets(self, device_name: str, device_specs: dict) -> None:
+        """
+        Create widgets of device and its subdevices
+         :param device_name: name of device
+         :param device_specs: dictionary dictating how device should be set up
+        """
+
         device_type = device_specs["type"]
         device = getattr(self.instrument, inflection.pluralize(device_type))[device_name]
 
         specs = self.config["instrument_view"]["device_widgets"].get(device_name, {})
         if specs != {} and specs.get("type", "") == device_type:
-            gui_class = getattr(importlib.import_module(specs["driver"]), specs["module"])
-            gui = gui_class(device, **specs.get("init", {}))  # device gets passed into widget
+            with self.profiler.section("import"):
+                gui_class = getattr(importlib.import_module(specs["driver"]), specs["module"])
+            with self.profiler.section("read and build"):  # custom widgets read device while building
+                gui = gui_class(device, **specs.get("init", {}))  # device gets passed into widget
         else:
-            properties = scan_for_properties(device)
-            gui = BaseDeviceWidget(type(device), properties)
+            with self.profiler.section("read"):
+                properties = scan_for_properties(device)
+            with self.profiler.section("build"):
+                gui = BaseDeviceWidget(type(device), properties)
 
         # if gui is BaseDeviceWidget or inherits from it,
         # hook up widgets to device_property_changed when user changes value
         if type(gui) == BaseDeviceWidget or BaseDeviceWidget in type(gui).__bases__:
+            # dependencies can be declared by the device class or in the gui yaml
+            dependencies = {
+                **getattr(type(device), "property_dependencies", {}),
+                **specs.get("property_dependencies", {}),
+            }
+            planner = PropertyRefreshPlanner(dependencies)
+            self.refresh_planners[device_name] = planner
             gui.ValueChangedInside[str].connect(
-                lambda value, dev=device, widget=gui: self.device_property_changed(value, dev, widget)
+                lambda value, dev=device, widget=gui, p=planner: self.device_property_changed(value, dev, widget, p)
             )
 
             updating_props = specs.get("updating_properties", [])
@@ -605,13 +953,52 @@ class InstrumentView(QWidget):
         except (RuntimeError, AttributeError):  # Pass when window's closed or widget doesn't have position_mm_widget
             pass
 
+    @thread_worker
+    def refresh_property_values(self, device: object, property_names: list[str], device_widget) -> Iterator:
+        """
+        Read values of properties off the gui thread and yield
+        :param device: device to grab properties from
+        :param property_names: names of properties to read
+        :param device_widget: widget of entire device that is the parent of property widgets
+        :return: value of property, widget to update, and name of property
+        """
+
+        for property_name in property_names:
+            try:
+                value = getattr(device, property_name)
+            except ValueError:  # Tigerbox sometime coughs up garbage. Locking issue?
+                continue
+            yield value, device_widget, property_name
+
+    def update_refreshed_property_value(
+        self, value, device_widget, property_name: str, changed_name: str, planner: PropertyRefreshPlanner
+    ) -> None:
+        """
+        Update widget with re-read property value and let planner know if the value changed
+        :param value: value to update with
+        :param device_widget: widget of entire device that is the parent of property widget
+        :param property_name: name of property re-read
+        :param changed_name: name of property the user changed
+        :param planner: planner that scheduled the re-read
+        """
+
+        try:
+            changed = bool(getattr(device_widget, property_name, None) != value)
+        except ValueError:  # array like values
+            changed = True
+        planner.observe(changed_name, property_name, changed)
+        self.update_property_value(value, device_widget, property_name)
+
     @Slot(str)
-    def device_property_changed(self, attr_name: str, device: object, widget) -> None:
+    def device_property_changed(
+        self, attr_name: str, device: object, widget, planner: PropertyRefreshPlanner = None
+    ) -> None:
         """
         Slot to signal when device widget has been changed
         :param widget: widget object relating to device
         :param device: device object
         :param attr_name: name of attribute
+        :param planner: planner deciding which properties to re-read. If None, all properties are re-read
         """
 
         name_lst = attr_name.split(".")
@@ -623,21 +1010,27 @@ class InstrumentView(QWidget):
                 dictionary = dictionary[k]
 
             # attempt to pass in correct value of correct type
-            descriptor = getattr(type(device), name_lst[0])
-            fset = getattr(descriptor, "fset")
-            input_type = list(inspect.signature(fset).parameters.values())[-1].annotation
-            if input_type != inspect._empty:
-                setattr(device, name_lst[0], input_type(value))
-            else:
-                setattr(device, name_lst[0], value)
+            value = setter_coercer(type(device), name_lst[0])(value)
+            setattr(device, name_lst[0], value)
+            self.persist_device_setting(device, name_lst[0], value)
 
             self.log.info(f"Device changed to {getattr(device, name_lst[0])}")
             # Update ui with new device values that might have changed
             # WARNING: Infinite recursion might occur if device property not set correctly
-            for k, v in widget.property_widgets.items():
-                if getattr(widget, k, False):
-                    device_value = getattr(device, k)
-                    setattr(widget, k, device_value)
+            planner = PropertyRefreshPlanner() if planner is None else planner
+            candidates = [k for k in widget.property_widgets.keys() if getattr(widget, k, False)]
+            property_names, full_refresh = planner.plan(name_lst[0], candidates)
+            self.log.debug(
+                f"Refreshing {property_names} after {attr_name} changed"
+                f"{' to learn dependencies' if full_refresh else ''}"
+            )
+            worker = self.refresh_property_values(device, property_names, widget)
+            worker.yielded.connect(
+                lambda args, name=name_lst[0]: self.update_refreshed_property_value(*args, name, planner)
+            )
+            if full_refresh:  # observations of full refresh are learned once all properties are re-read
+                worker.finished.connect(lambda name=name_lst[0]: planner.finish(name))
+            worker.start()
 
         except (KeyError, TypeError):
             self.log.warning(f"{attr_name} can't be mapped into device properties")
@@ -676,15 +1069,69 @@ class InstrumentView(QWidget):
             except AttributeError:
                 pass
 
+    def persist_device_setting(self, device: object, property_name: str, value) -> None:
+        """
+        Record changed device property in settings of instrument config so it is autosaved and journaled
+        :param device: device that was changed
+        :param property_name: name of property
+        :param value: value property was set to
+        """
+
+        path = self.device_config_paths.get(id(device), None)
+        if self.instrument_persister is None or path is None:
+            return
+        device_specs = self.instrument.config
+        for key in path:
+            device_specs = device_specs[key]
+        if property_name in device_specs.get("settings", {}):
+            device_specs["settings"][property_name] = value
+            self.instrument_persister.mark_dirty(path + ("settings", property_name))
+
     def update_config_on_quit(self) -> None:
         """
         Add functionality to close function to save device properties to instrument config
         """
 
-        return_value = self.update_config_query()
-        if return_value == QMessageBox.Ok:
-            self.instrument.update_current_state_config()
-            self.instrument.save_config(self.config_save_to)
+        if not self.headless:  # no one to answer query if headless
+            return_value = self.update_config_query()
+            if return_value == QMessageBox.Ok:
+                self.instrument.update_current_state_config()
+                self.instrument.save_config(self.config_save_to)
+            if self.instrument_persister is not None:
+                self.instrument_persister.discard_journal()  # changes have been saved or deliberately discarded
+
+    def save_changes_query(self, path: Path) -> Literal[0, 1]:
+        """
+        Pop up message asking if changes made in gui should be saved to config
+        :param path: path of config changes would be saved to
+        :return: user reply to message box
+        """
+
+        msgBox = QMessageBox()
+        msgBox.setIcon(QMessageBox.Question)
+        msgBox.setText(f"Do you want to save changes made in the gui to {path}?")
+        msgBox.setWindowTitle("Saving Changes")
+        msgBox.setStandardButtons(QMessageBox.Ok | QMessageBox.Cancel)
+
+        return msgBox.exec()
+
+    def close_persister(self, persister: ConfigPersister, query: bool = True) -> None:
+        """
+        Stop persister and write its pending changes if autosave is on. If autosave is off, user is asked whether to
+        save them. The journal is only removed once changes are written or the user declines, so changes no one
+        answered for are recovered the next time the config is loaded
+        :param persister: persister to close
+        :param query: whether to ask user about unsaved changes
+        """
+
+        persister.stop()
+        if persister.autosave:
+            persister.flush()  # removes journal once changes are written
+        elif query and persister.dirty and not self.headless:
+            if self.save_changes_query(persister.path) == QMessageBox.Ok:
+                persister.flush()
+            else:
+                persister.discard_journal()
 
     def update_config_query(self) -> Literal[0, 1]:
         """
@@ -727,6 +1174,19 @@ class InstrumentView(QWidget):
         Close instruments and end threads
         """
 
+        try:
+            dock_state = self.viewer.window._qt_window.saveState()
+            self.state_cache.set("dock_state", bytes(dock_state.toBase64()).decode())
+            self.state_cache.save()
+        except RuntimeError:  # window has already been deleted
+            pass
+
+        self.waveform_writer.stop()
+        self.apply_config_waveforms()
+        self.close_persister(self.config_persister)
+        if self.instrument_persister is not None:  # user is asked to save instrument config when app quits
+            self.close_persister(self.instrument_persister, query=False)
+
         for worker in self.property_workers:
             worker.quit()
         self.grab_frames_worker.quit()
@@ -0,0 +1,169 @@
+from time import monotonic
+from typing import Callable
+import numpy as np
+
+
+class MotionEstimator:
+    """Class to estimate position of stages between polls. Positions are measured every few hundred milliseconds, so
+    the position shown at display time is predicted from the latest measured position and velocity. Axes with a
+    commanded target follow a trapezoidal profile limited by the maximum velocity and acceleration of each axis and
+    never overshoot their target. Axes without a target brake from their measured velocity until they stop. Every
+    measured position corrects the prediction"""
+
+    def __init__(
+        self,
+        max_velocity: list[float],
+        max_acceleration: list[float],
+        tolerance: float = 1e-3,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """
+        :param max_velocity: maximum velocity of each axis in units per second
+        :param max_acceleration: maximum acceleration of each axis in units per second squared
+        :param tolerance: distance from target within which an axis is considered arrived
+        :param clock: function returning current time in seconds
+        """
+
+        self.max_velocity = np.abs(np.asarray(max_velocity, dtype=float))
+        self.max_acceleration = np.abs(np.asarray(max_acceleration, dtype=float))
+        self.tolerance = tolerance
+        self.clock = clock
+
+        axes = len(self.max_velocity)
+        self.position = None  # latest measured position
+        self.velocity = np.zeros(axes)  # velocity estimated from latest measured positions
+        self.timestamp = None  # time latest position was measured
+        self.target = np.full(axes, np.nan)  # commanded position of each axis or nan if axis has no target
+        self.target_timestamp = -np.inf  # time target was commanded
+        self._previous_timestamp = None
+
+    def add_sample(self, position: list[float], timestamp: float = None) -> None:
+        """
+        Correct estimate with a measured position
+        :param position: measured position
+        :param timestamp: time position was measured. Defaults to now
+        """
+
+        timestamp = self.clock() if timestamp is None else timestamp
+        position = np.asarray(position, dtype=float)
+        if self.position is not None and timestamp > self.timestamp:
+            velocity = (position - self.position) / (timestamp - self.timestamp)
+            self.velocity = np.clip(velocity, -self.max_velocity, self.max_velocity)
+        self._previous_timestamp, self.timestamp = self.timestamp, timestamp
+        self.position = position
+
+        # targets are done when reached, or when an axis stood still over a whole poll after the move was commanded
+        arrived = np.abs(self.target - position) <= self.tolerance
+        if self._previous_timestamp is not None and self._previous_timestamp >= self.target_timestamp:
+            arrived |= self.velocity == 0
+        self.target[arrived] = np.nan
+
+    def set_target(self, target: list[float], timestamp: float = None) -> None:
+        """
+        Set position stages were commanded to move to
+        :param target: commanded position
+        :param timestamp: time move was commanded. Defaults to now
+        """
+
+        self.target = np.asarray(target, dtype=float).copy()
+        self.target_timestamp = self.clock() if timestamp is None else timestamp
+
+    def stop(self) -> None:
+        """
+        Drop targets so stages are predicted to brake and stop
+        """
+
+        self.target[:] = np.nan
+
+    def predict(self, timestamp: float = None) -> np.ndarray:
+        """
+        Predict position at time
+        :param timestamp: time to predict position at. Defaults to now
+        :return: predicted position or None if no position has been measured
+        """
+
+        return self.state(timestamp)[0]
+
+    def moving(self, timestamp: float = None) -> bool:
+        """
+        Whether any axis is predicted to be moving or to have a target it hasn't reached
+        :param timestamp: time to check. Defaults to now
+        """
+
+        position, velocity = self.state(timestamp)
+        if position is None:
+            return False
+        return bool(np.any(velocity != 0) or np.any(np.abs(self.target - position) > self.tolerance))
+
+    def state(self, timestamp: float = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Predict position and velocity at time
+        :param timestamp: time to predict at. Defaults to now
+        :return: predicted position and velocity or None, None if no position has been measured
+        """
+
+        if self.position is None:
+            return None, None
+        timestamp = self.clock() if timestamp is None else timestamp
+        duration = max(0.0, timestamp - self.timestamp)
+        position, velocity = self.position.copy(), self.velocity.copy()
+        for axis in range(len(position)):
+            position[axis], velocity[axis] = self._integrate(
+                position[axis],
+                velocity[axis],
+                self.target[axis],
+                self.max_velocity[axis],
+                self.max_acceleration[axis],
+                duration,
+            )
+        return position, velocity
+
+    @staticmethod
+    def _integrate(
+        position: float, velocity: float, target: float, max_velocity: float, max_acceleration: float, duration: float
+    ) -> tuple[float, float]:
+        """
+        Move one axis along its velocity profile for a duration. The profile is split into phases of constant
+        acceleration: braking, accelerating towards target, cruising at max velocity and braking onto target
+        :param position: position at start
+        :param velocity: velocity at start
+        :param target: target of axis or nan if axis has no target
+        :param max_velocity: maximum velocity of axis
+        :param max_acceleration: maximum acceleration of axis
+        :param duration: time to move for
+        :return: position and velocity after duration
+        """
+
+        if max_acceleration == 0:  # axis can't change speed so it keeps moving at measured velocity
+            return position + velocity * duration, velocity
+
+        remaining = duration
+        for _ in range(6):  # a profile has at most four phases, some of which may be empty
+            if remaining <= 0:
+                break
+            distance = target - position
+            speed = abs(velocity)
+            end = None  # whether phase ends at rest, either stopped or on target
+            if np.isnan(target) or velocity * distance < 0:  # brake until stopped
+                if speed == 0:
+                    break
+                acceleration, phase, end = -np.sign(velocity) * max_acceleration, speed / max_acceleration, "stop"
+            elif speed**2 / (2 * max_acceleration) >= abs(distance) * (1 - 1e-9):  # brake exactly onto target
+                if speed == 0 or distance == 0:
+                    return target, 0.0
+                acceleration, phase, end = -velocity**2 / (2 * distance), 2 * abs(distance) / speed, "target"
+            elif speed < max_velocity:  # accelerate until at max velocity or until it's time to brake
+                peak = min(max_velocity, np.sqrt(max_acceleration * abs(distance) + speed**2 / 2))
+                acceleration, phase = np.sign(distance) * max_acceleration, (peak - speed) / max_acceleration
+            else:  # cruise until it's time to brake
+                velocity = np.sign(distance) * max_velocity
+                acceleration = 0.0
+                phase = (abs(distance) - max_velocity**2 / (2 * max_acceleration)) / max_velocity
+
+            step = min(max(phase, 0.0), remaining)
+            remaining -= step
+            if end == "target" and step == phase:
+                return target, 0.0
+            position += velocity * step + acceleration * step**2 / 2
+            velocity = 0.0 if end == "stop" and step == phase else velocity + acceleration * step
+        return position, velocity
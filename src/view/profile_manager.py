@@ -0,0 +1,184 @@
+import logging
+from pathlib import Path
+from typing import Union
+from view.config_loader import load_config
+from view.config_persister import path_get, path_set
+
+MISSING = object()  # marks keys that were added or removed
+
+# keys of gui config that are applied to a running view. Changes to other keys need a restart
+GUI_HOT_KEYS = {
+    ("instrument_view", "livestream_tasks"),
+    ("instrument_view", "autosave"),
+    ("instrument_view", "max_waveform_write_rate_hz"),
+    ("acquisition_view", "data_acquisition_tasks"),
+    ("acquisition_view", "fov_dimensions"),
+    ("acquisition_view", "autosave"),
+}
+
+
+class ProfileSwitchError(ValueError):
+    """Raised when a profile can't be applied without restarting"""
+
+
+def diff_config(old, new, path: tuple = ()) -> dict:
+    """
+    Find changed values between two configs. Dictionaries are compared key by key, other values, like lists, as a whole
+    :param old: old config
+    :param new: new config
+    :param path: path of keys to old and new within whole config
+    :return: dictionary mapping path of each changed value to its old and new value. Added or removed values are MISSING
+    """
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key in list(old.keys()) + [key for key in new.keys() if key not in old]:
+            changes.update(diff_config(old.get(key, MISSING), new.get(key, MISSING), path + (key,)))
+        return changes
+    return {} if old == new else {path: (old, new)}
+
+
+def apply_changes(data, changes: dict) -> None:
+    """
+    Apply changes found by diff_config in place, so objects holding references into data see the new values
+    :param data: config to change
+    :param changes: dictionary mapping path to old and new value
+    """
+
+    for path, (old, new) in changes.items():
+        if new is MISSING:
+            del path_get(data, path[:-1])[path[-1]]
+        else:
+            path_set(data, path, new)
+
+
+class ProfileDiff:
+    """Class sorting changes between two profiles by what needs to be reconfigured to apply them"""
+
+    def __init__(self, gui_changes: dict, instrument_changes: dict, gui_config=None, instrument_config=None):
+        """
+        :param gui_changes: changes to gui config found by diff_config
+        :param instrument_changes: changes to instrument config found by diff_config
+        :param gui_config: new gui config, if loaded
+        :param instrument_config: new instrument config, if loaded
+        """
+
+        self.gui_changes = gui_changes
+        self.instrument_changes = instrument_changes
+        self.gui_config = gui_config
+        self.instrument_config = instrument_config
+        self.device_settings = {}  # path of device specs to names of changed settings
+        self.channels = set()  # names of added, removed or changed channels
+        self.livestream_tasks = set()  # names of daqs with changed livestream tasks
+        self.acquisition_tasks = set()  # names of daqs with changed data acquisition tasks
+        self.gui_keys = set()  # other hot keys of gui config that changed
+        self.restart = []  # dotted paths of changes that can't be applied without restarting
+
+        for path, (old, new) in gui_changes.items():
+            self.sort_gui_change(path)
+        for path, (old, new) in instrument_changes.items():
+            self.sort_instrument_change(path, new)
+
+    def sort_gui_change(self, path: tuple) -> None:
+        """
+        Sort change of gui config
+        :param path: path of changed value
+        """
+
+        key = path[:2]
+        if key not in GUI_HOT_KEYS:
+            self.restart.append(".".join(map(str, path)))
+        elif key == ("instrument_view", "livestream_tasks"):
+            self.livestream_tasks.update(path[2:3] or ["*"])
+        elif key == ("acquisition_view", "data_acquisition_tasks"):
+            self.acquisition_tasks.update(path[2:3] or ["*"])
+        else:
+            self.gui_keys.add(key)
+
+    def sort_instrument_change(self, path: tuple, new) -> None:
+        """
+        Sort change of instrument config. Only settings of existing devices can change without reconnecting devices
+        :param path: path of changed value
+        :param new: new value
+        """
+
+        if path[:2] == ("instrument", "channels") and len(path) > 2:
+            self.channels.add(path[2])
+            return
+        if path[:2] == ("instrument", "devices") and len(path) > 2:
+            device_path, rest = path[:3], path[3:]
+            while len(rest) > 2 and rest[0] == "subdevices":
+                device_path, rest = device_path + rest[:2], rest[2:]
+            if len(rest) > 1 and rest[0] == "settings":
+                if new is not MISSING:  # removed settings are left as they are on device
+                    self.device_settings.setdefault(device_path, set()).add(rest[1])
+                return
+        self.restart.append(".".join(map(str, path)))
+
+    @property
+    def empty(self) -> bool:
+        """Whether profiles are the same"""
+
+        return not self.gui_changes and not self.instrument_changes
+
+
+class ProfileManager:
+    """Class to switch a running view to another gui and instrument profile. New profiles are compared to the loaded
+    configs and applied as a diff in place, so widgets, device connections and objects holding references into the
+    configs are kept"""
+
+    def __init__(self, gui_config, instrument_config):
+        """
+        :param gui_config: loaded gui config
+        :param instrument_config: loaded instrument config
+        """
+
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.gui_config = gui_config
+        self.instrument_config = instrument_config
+
+    def diff(
+        self,
+        gui_config_path: Union[Path, str] = None,
+        instrument_config_path: Union[Path, str] = None,
+        round_trip: bool = False,
+    ) -> ProfileDiff:
+        """
+        Load profile and compare it to loaded configs
+        :param gui_config_path: path of new gui config. If None, gui config is unchanged
+        :param instrument_config_path: path of new instrument config. If None, instrument config is unchanged
+        :param round_trip: load configs keeping comments so they can be saved
+        :return: differences between profiles
+        """
+
+        gui_changes, instrument_changes = {}, {}
+        gui_config, instrument_config = None, None
+        if gui_config_path is not None:
+            gui_config = load_config(gui_config_path, round_trip)
+            gui_changes = diff_config(self.gui_config, gui_config)
+        if instrument_config_path is not None:
+            instrument_config = load_config(instrument_config_path, round_trip)
+            instrument_changes = diff_config(self.instrument_config, instrument_config)
+        return ProfileDiff(gui_changes, instrument_changes, gui_config, instrument_config)
+
+    def validate(self, diff: ProfileDiff) -> None:
+        """
+        Check that differences can be applied without restarting
+        :param diff: differences found by diff
+        """
+
+        if diff.restart:
+            raise ProfileSwitchError(f"profile can't be applied without restarting, changes to {diff.restart}")
+
+    def apply(self, diff: ProfileDiff) -> None:
+        """
+        Apply differences to loaded configs
+        :param diff: differences found by diff
+        """
+
+        self.validate(diff)
+        apply_changes(self.gui_config, diff.gui_changes)
+        apply_changes(self.instrument_config, diff.instrument_changes)
+        self.log.info(
+            f"applied {len(diff.gui_changes)} gui and {len(diff.instrument_changes)} instrument config changes"
+        )
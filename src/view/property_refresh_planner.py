@@ -0,0 +1,72 @@
+class PropertyRefreshPlanner:
+    """Class to decide which properties of a device need to be re-read after one of its properties is changed.
+    Dependencies can be declared up front (e.g. exposure_time_ms affects frame_time_ms) or learned by observing which
+    property values actually changed after a full refresh"""
+
+    def __init__(self, dependencies: dict = None, relearn_interval: int = 10):
+        """
+        :param dependencies: dictionary mapping a property name to a list of property names it affects
+        :param relearn_interval: number of edits of a property after which a full refresh is done again so
+        learned dependencies that only show up for certain values are eventually caught. 0 disables relearning
+        """
+
+        self.declared = {name: set(dependents) for name, dependents in (dependencies or {}).items()}
+        self.learned = {}  # property name to set of properties observed to change with it
+        self.relearn_interval = relearn_interval
+        self._observed = {}  # properties observed changing during in progress full refreshes
+        self._refreshes = {}  # number of in progress full refreshes of each property
+        self._edit_counts = {}
+
+    def declare(self, property_name: str, dependents: list[str]) -> None:
+        """
+        Declare properties that are affected when property_name is changed
+        :param property_name: name of property
+        :param dependents: list of property names that depend on property_name
+        """
+
+        self.declared.setdefault(property_name, set()).update(dependents)
+
+    def plan(self, property_name: str, candidates: list[str]) -> tuple[list[str], bool]:
+        """
+        Return properties to re-read after property_name has been changed
+        :param property_name: name of property that was changed
+        :param candidates: all property names that could be re-read
+        :return: list of properties to re-read and whether the plan is a full refresh used for learning
+        """
+
+        count = self._edit_counts.get(property_name, 0)
+        self._edit_counts[property_name] = count + 1
+        relearn = self.relearn_interval != 0 and count != 0 and count % self.relearn_interval == 0
+        if property_name not in self.learned or relearn:
+            # overlapping full refreshes of a property share observations until the last one finishes
+            self._observed.setdefault(property_name, set())
+            self._refreshes[property_name] = self._refreshes.get(property_name, 0) + 1
+            return list(candidates), True
+
+        affected = {property_name} | self.declared.get(property_name, set()) | self.learned[property_name]
+        return [name for name in candidates if name in affected], False
+
+    def observe(self, property_name: str, updated_name: str, changed: bool) -> None:
+        """
+        Record result of re-reading a property during a full refresh
+        :param property_name: name of property that was changed by the user
+        :param updated_name: name of property that was re-read
+        :param changed: whether the re-read value differed from the value in the widget
+        """
+
+        if changed and property_name in self._observed:
+            self._observed[property_name].add(updated_name)
+
+    def finish(self, property_name: str) -> None:
+        """
+        Mark a full refresh for property_name as done and merge observed dependencies into learned ones. Only call
+        for plans that were full refreshes
+        :param property_name: name of property that was changed by the user
+        """
+
+        if property_name in self._refreshes:
+            self.learned.setdefault(property_name, set()).update(self._observed[property_name] - {property_name})
+            self._refreshes[property_name] -= 1
+            if self._refreshes[property_name] == 0:
+                del self._refreshes[property_name]
+                del self._observed[property_name]
@@ -0,0 +1,18 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def points_in_box(tree: cKDTree, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """
+    Find points of k-d tree within box. Box is searched as the smallest cube around it and candidates outside the box
+    are filtered out
+    :param tree: k-d tree of points
+    :param low: lower corner of box
+    :param high: upper corner of box
+    :return: sorted indices of points within box
+    """
+
+    low, high = np.asarray(low, dtype=float), np.asarray(high, dtype=float)
+    candidates = np.asarray(tree.query_ball_point((low + high) / 2, np.max(high - low) / 2, p=np.inf), dtype=int)
+    points = tree.data[candidates]
+    return np.sort(candidates[np.all((low <= points) & (points <= high), axis=1)])
@@ -0,0 +1,141 @@
+import contextlib
+import logging
+import os
+from pathlib import Path
+from time import perf_counter
+from typing import Union
+
+PROFILE_ENV_VAR = "VIEW_PROFILE_STARTUP"
+
+
+class TimingNode:
+    """Class to hold accumulated timing of one section of a startup profile and its nested sections"""
+
+    def __init__(self, name: str):
+        """
+        :param name: name of section
+        """
+
+        self.name = name
+        self.total = 0.0  # seconds
+        self.calls = 0
+        self.children = {}
+
+    @property
+    def self_time(self) -> float:
+        """Time spent in section not accounted for by nested sections"""
+
+        return max(self.total - sum(child.total for child in self.children.values()), 0.0)
+
+
+class StartupProfiler:
+    """Class to record a hierarchical timing tree of view startup. Enabled by passing enabled=True or by setting the
+    VIEW_PROFILE_STARTUP environment variable to 1 or to a directory to write profiles to. When disabled, sections
+    are no-ops"""
+
+    def __init__(self, name: str, enabled: bool = None, output_directory: Union[Path, str] = None):
+        """
+        :param name: name of root section and prefix of profile file
+        :param enabled: whether to profile. If None, enabled when environment variable is set
+        :param output_directory: directory to write flame graph file to. Defaults to directory in environment variable
+        or current working directory
+        """
+
+        self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        env = os.environ.get(PROFILE_ENV_VAR, "")
+        self.enabled = env not in ["", "0"] if enabled is None else enabled
+        if output_directory is None:
+            output_directory = env if env not in ["", "0", "1"] else Path.cwd()
+        self.output_directory = Path(output_directory)
+
+        self.root = TimingNode(name)
+        self._stack = [self.root]
+        self._start = perf_counter()
+
+    def section(self, name: str) -> contextlib.AbstractContextManager:
+        """
+        Context manager timing a nested section of startup
+        :param name: name of section. Sections with the same name under the same parent are accumulated
+        :return: context manager
+        """
+
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str):
+        """
+        Time section and add to tree
+        :param name: name of section
+        """
+
+        parent = self._stack[-1]
+        node = parent.children.setdefault(name, TimingNode(name))
+        self._stack.append(node)
+        start = perf_counter()
+        try:
+            yield node
+        finally:
+            node.total += perf_counter() - start
+            node.calls += 1
+            self._stack.pop()
+
+    def folded(self) -> list[str]:
+        """
+        Format tree as folded stacks (one line per section of ; joined path and self time in microseconds) that
+        flamegraph.pl, speedscope and similar tools read
+        :return: list of lines
+        """
+
+        lines = []
+
+        def walk(node: TimingNode, path: str):
+            frame = node.name.replace(";", ",")  # ; separates frames
+            path = f"{path};{frame}" if path else frame
+            lines.append(f"{path} {round(node.self_time * 1e6)}")
+            for child in node.children.values():
+                walk(child, path)
+
+        walk(self.root, "")
+        return lines
+
+    def summary(self) -> str:
+        """
+        Format tree as table with total time, self time, calls and percent of startup of each section
+        :return: table
+        """
+
+        total = self.root.total or 1.0
+        rows = [f"{'section':<60}{'total ms':>12}{'self ms':>12}{'calls':>8}{'%':>8}"]
+
+        def walk(node: TimingNode, depth: int):
+            name = f"{'  ' * depth}{node.name}"
+            rows.append(
+                f"{name:<60}{node.total * 1e3:>12.1f}{node.self_time * 1e3:>12.1f}{node.calls:>8}"
+                f"{100 * node.total / total:>8.1f}"
+            )
+            for child in node.children.values():
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return "\n".join(rows)
+
+    def finish(self) -> Union[Path, None]:
+        """
+        Stop timing root section, log summary table and write flame graph file
+        :return: path of flame graph file or None if profiler is disabled
+        """
+
+        if not self.enabled:
+            return None
+        self.root.total = perf_counter() - self._start
+        self.root.calls = 1
+        self.log.info(f"{self.root.name} startup took {self.root.total:.3f} s\n{self.summary()}")
+        path = self.output_directory / f"{self.root.name}_startup.folded"
+        try:
+            path.write_text("\n".join(self.folded()) + "\n")
+            self.log.info(f"startup flame graph written to {path}")
+        except OSError as e:
+            self.log.warning(f"could not write startup flame graph to {path}: {e}")
+        return path
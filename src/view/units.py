@@ -0,0 +1,13 @@
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def unit_registry():
+    """Process wide pint unit registry. Building a registry is slow and quantities from different registries can't be
+    combined, so widgets should share this one instead of creating their own
+    :return: pint UnitRegistry
+    """
+
+    import pint  # deferred since pint is slow to import and only needed once a widget with units is built
+
+    return pint.UnitRegistry()
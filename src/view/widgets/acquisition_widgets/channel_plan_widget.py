@@ -2,13 +2,12 @@ from qtpy.QtWidgets import QTabWidget, QTabBar, QWidget, QPushButton, \
     QMenu, QToolButton, QAction, QTableWidget, QTableWidgetItem, QComboBox, QSpinBox
 from view.widgets.miscellaneous_widgets.q_item_delegates import QSpinItemDelegate, QTextItemDelegate, QComboItemDelegate
 from view.widgets.miscellaneous_widgets.q_scrollable_line_edit import QScrollableLineEdit
-from view.widgets.base_device_widget import label_maker
+from view.widgets.base_device_widget import label_maker, setter_input_type
 import numpy as np
 from qtpy.QtCore import Signal, Qt
 from inflection import singularize
 from math import isnan
-import pint
-import inspect
+from view.units import unit_registry
 
 
 class ChannelPlanWidget(QTabWidget):
@@ -35,9 +34,9 @@ class ChannelPlanWidget(QTabWidget):
         self.column_data_types = {'step size [um]': float, 'steps': int, 'prefix': str}
 
         # setup units for step size and step calculation
-        unit_registry = pint.UnitRegistry()
-        self.unit = getattr(unit_registry, unit)   # TODO: How to check if unit is in pint?
-        self.micron = unit_registry.um
+        registry = unit_registry()
+        self.unit = getattr(registry, unit)   # TODO: How to check if unit is in pint?
+        self.micron = registry.um
 
         self.steps = {}  # dictionary of number of steps for each tile in each channel
         self.step_size = {}  # dictionary of step size for each tile in each channel
@@ -85,79 +84,87 @@ class ChannelPlanWidget(QTabWidget):
         # TODO: Checks here if prop or device isn't part of the instrument? Or go in instrument validation?
 
         for channel in self.possible_channels:
+            self.initialize_table(instrument_view, channel)
 
-            setattr(self, f'{channel}_table', QTableWidget())
-            table = getattr(self, f'{channel}_table')
-            table.cellChanged.connect(self.cell_edited)
-
-            columns = ['step size [um]', 'steps', 'prefix']
-            delegates = [QSpinItemDelegate(), QSpinItemDelegate(minimum=0, step=1), QTextItemDelegate()]
-            for device_type, properties in self.properties.items():
-                if device_type in self.possible_channels[channel].keys():
-                    for device_name in self.possible_channels[channel][device_type]:
-                        device_widget = getattr(instrument_view, f'{singularize(device_type)}_widgets')[device_name]
-                        device_object = getattr(instrument_view.instrument, device_type)[device_name]
-                        for prop in properties:
-                            # select delegate to use based on type
-                            column_name = label_maker(f'{device_name}_{prop}')
-                            descriptor = getattr(type(device_object), prop)
-                            if not isinstance(descriptor, property) or getattr(descriptor, 'fset', None) is None:
-                                self.column_data_types[column_name] = None
-                                continue
-                            # try and correctly type properties based on setter
-                            fset = getattr(descriptor, 'fset')
-                            input_type = list(inspect.signature(fset).parameters.values())[-1].annotation
-                            self.column_data_types[column_name] = input_type if input_type != inspect._empty else None
+    def initialize_table(self, instrument_view, channel: str) -> None:
+        """
+        Initialize table for a channel with proper columns and delegates
+        :param instrument_view: view object that contains all widget for devices in an instrument
+        :param channel: name of channel
+        """
+
+        setattr(self, f'{channel}_table', QTableWidget())
+        table = getattr(self, f'{channel}_table')
+        table.cellChanged.connect(self.cell_edited)
+
+        columns = ['step size [um]', 'steps', 'prefix']
+        delegates = [QSpinItemDelegate(), QSpinItemDelegate(minimum=0, step=1), QTextItemDelegate()]
+        for device_type, properties in self.properties.items():
+            if device_type in self.possible_channels[channel].keys():
+                for device_name in self.possible_channels[channel][device_type]:
+                    device_widget = getattr(instrument_view, f'{singularize(device_type)}_widgets')[device_name]
+                    device_object = getattr(instrument_view.instrument, device_type)[device_name]
+                    for prop in properties:
+                        # select delegate to use based on type
+                        column_name = label_maker(f'{device_name}_{prop}')
+                        descriptor = getattr(type(device_object), prop)
+                        if not isinstance(descriptor, property) or getattr(descriptor, 'fset', None) is None:
+                            self.column_data_types[column_name] = None
+                            continue
+                        # try and correctly type properties based on setter
+                        self.column_data_types[column_name] = setter_input_type(type(device_object), prop)
+                        if getattr(self, column_name, None) is None:  # keep values of other channels
                             setattr(self, column_name, {})
-                            columns.append(column_name)
-                            prop_widget = getattr(device_widget, f'{prop}_widget')
-                            if type(prop_widget) in [QScrollableLineEdit, QSpinBox]:
-                                minimum = getattr(descriptor, 'minimum', float('-inf'))
-                                maximum = getattr(descriptor, 'maximum', float('inf'))
-                                step = getattr(descriptor, 'step', .1)
-                                delegates.append(QSpinItemDelegate(minimum=minimum, maximum=maximum, step=step))
-                                setattr(self, column_name + '_value_function', prop_widget.value)
-                            elif type(getattr(device_widget, f'{prop}_widget')) == QComboBox:
-                                widget = getattr(device_widget, f'{prop}_widget')
-                                items = [widget.itemText(i) for i in range(widget.count())]
-                                delegates.append(QComboItemDelegate(items=items))
-                                setattr(self, column_name + '_value_function', prop_widget.currentText)
-                            else:  # TODO: How to handle dictionary values
-                                delegates.append(QTextItemDelegate())
-                                setattr(self, column_name + '_value_function', prop_widget.text)
-                elif dict in type(properties).__mro__:     # TODO: how to validate the GUI yaml?
-                    column_name = label_maker(device_type)
+                        columns.append(column_name)
+                        prop_widget = getattr(device_widget, f'{prop}_widget')
+                        if type(prop_widget) in [QScrollableLineEdit, QSpinBox]:
+                            minimum = getattr(descriptor, 'minimum', float('-inf'))
+                            maximum = getattr(descriptor, 'maximum', float('inf'))
+                            step = getattr(descriptor, 'step', .1)
+                            delegates.append(QSpinItemDelegate(minimum=minimum, maximum=maximum, step=step))
+                            setattr(self, column_name + '_value_function', prop_widget.value)
+                        elif type(getattr(device_widget, f'{prop}_widget')) == QComboBox:
+                            widget = getattr(device_widget, f'{prop}_widget')
+                            items = [widget.itemText(i) for i in range(widget.count())]
+                            delegates.append(QComboItemDelegate(items=items))
+                            setattr(self, column_name + '_value_function', prop_widget.currentText)
+                        else:  # TODO: How to handle dictionary values
+                            delegates.append(QTextItemDelegate())
+                            setattr(self, column_name + '_value_function', prop_widget.text)
+            elif dict in type(properties).__mro__:     # TODO: how to validate the GUI yaml?
+                column_name = label_maker(device_type)
+                if getattr(self, column_name, None) is None:  # keep values of other channels
                     setattr(self, column_name, {})
-                    setattr(self, column_name + '_initial_value', properties.get('initial_value', None))
-                    columns.append(column_name)
-                    if properties['delegate'] == 'spin':
-                        minimum = properties.get('minimum', None)
-                        maximum = properties.get('maximum', None)
-                        step = properties.get('step', .1 if properties['type'] == 'float' else 1 )
-                        delegates.append(QSpinItemDelegate(minimum=minimum, maximum=maximum, step=step))
-                        self.column_data_types[column_name] = float if properties['type'] == 'float' else int
-                    elif properties['delegate'] == 'combo':
-                        items = properties['items']
-                        delegates.append(QComboItemDelegate(items=items))
-                        type_mapping = {'int':int, 'float':float, 'str': str}
-                        self.column_data_types[column_name] = type_mapping[properties['type']]
-                    else:
-                        delegates.append(QTextItemDelegate())
-                        self.column_data_types[column_name] = str
-
-            columns.append('row, column')
-
-            for i, delegate in enumerate(delegates):
-                # table does not take ownership of the delegates, so they are removed from memory as they
-                # are local variables causing a Segmentation fault. Need to be attributes
-                setattr(self, f'{columns[i]}_{channel}_delegate', delegate)
-                table.setItemDelegateForColumn(i, delegate)
-            table.setColumnCount(len(columns))
-            table.setHorizontalHeaderLabels(columns)
-            table.resizeColumnsToContents()
-            table.setColumnHidden(len(columns) - 1, True)  # hide row, column since it will only be used internally
-
-            table.verticalHeader().hide()
+                setattr(self, column_name + '_initial_value', properties.get('initial_value', None))
+                columns.append(column_name)
+                if properties['delegate'] == 'spin':
+                    minimum = properties.get('minimum', None)
+                    maximum = properties.get('maximum', None)
+                    step = properties.get('step', .1 if properties['type'] == 'float' else 1 )
+                    delegates.append(QSpinItemDelegate(minimum=minimum, maximum=maximum, step=step))
+                    self.column_data_types[column_name] = float if properties['type'] == 'float' else int
+                elif properties['delegate'] == 'combo':
+                    items = properties['items']
+                    delegates.append(QComboItemDelegate(items=items))
+                    type_mapping = {'int':int, 'float':float, 'str': str}
+                    self.column_data_types[column_name] = type_mapping[properties['type']]
+                else:
+                    delegates.append(QTextItemDelegate())
+                    self.column_data_types[column_name] = str
+
+        columns.append('row, column')
+
+        for i, delegate in enumerate(delegates):
+            # table does not take ownership of the delegates, so they are removed from memory as they
+            # are local variables causing a Segmentation fault. Need to be attributes
+            setattr(self, f'{columns[i]}_{channel}_delegate', delegate)
+            table.setItemDelegateForColumn(i, delegate)
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.resizeColumnsToContents()
+        table.setColumnHidden(len(columns) - 1, True)  # hide row, column since it will only be used internally
+
+        table.verticalHeader().hide()
 
     @property
     def apply_all(self) -> bool:
@@ -344,6 +351,34 @@ class ChannelPlanWidget(QTabWidget):
 
         self.channelChanged.emit()
 
+    def update_channels(self, changed: list[str], instrument_view) -> None:
+        """Rebuild tables of channels that were added, removed or changed in possible channels. Tables of other
+        channels are kept. Changed channels that were in acquisition are added again with default values
+        :param changed: names of channels that changed
+        :param instrument_view: view object that contains all widget for devices in an instrument
+        """
+
+        menu = self.add_tool.menu()
+        for channel in changed:
+            active = channel in self.channels
+            if active:
+                self.remove_channel(channel)
+            for action in menu.actions():
+                if action.text() == channel:
+                    menu.removeAction(action)
+            if hasattr(self, f'{channel}_table'):
+                getattr(self, f'{channel}_table').deleteLater()
+                delattr(self, f'{channel}_table')
+
+            if channel in self.possible_channels:
+                self.initialize_table(instrument_view, channel)
+                action = QAction(str(channel), self)
+                action.triggered.connect(lambda clicked, ch=channel: self.add_channel(ch))
+                menu.addAction(action)
+                if active:
+                    self.add_channel(channel)
+        self.add_tool.setMenu(menu)
+
     def cell_edited(self, row: int, column: int, channel: str = None) -> None:
         """
         Update table based on cell edit
@@ -1,39 +1,19 @@
 from pyqtgraph.opengl import GLImageItem
-from qtpy.QtWidgets import QMessageBox, QCheckBox, QGridLayout, QButtonGroup, QLabel, QRadioButton, QPushButton, QWidget
-from qtpy.QtCore import Signal, Qt
+from qtpy.QtCore import Signal
 from qtpy.QtGui import QMatrix4x4, QVector3D, QQuaternion
 from math import tan, radians, sqrt
 import numpy as np
-from scipy import spatial
-from pyqtgraph import makeRGBA
+from view.widgets.acquisition_widgets.volume_model_base import VolumeModelBase
 from view.widgets.miscellaneous_widgets.gl_ortho_view_widget import GLOrthoViewWidget
 from view.widgets.miscellaneous_widgets.gl_shaded_box_item import GLShadedBoxItem
 from view.widgets.miscellaneous_widgets.gl_path_item import GLPathItem
+from view.widgets.miscellaneous_widgets.gl_tile_grid_item import GLTileGridItem
 
 
-class SignalChangeVar:
-
-    def __set_name__(self, owner, name):
-        self.name = f"_{name}"
-
-    def __set__(self, instance, value):
-        setattr(instance, self.name, value)  # initially setting attr
-        instance.valueChanged.emit(self.name[1:])
-
-    def __get__(self, instance, value):
-        return getattr(instance, self.name)
-
-
-class VolumeModel(GLOrthoViewWidget):
+class VolumeModel(VolumeModelBase, GLOrthoViewWidget):
     """Widget to display configured acquisition grid.  Note that the x and y refer to the tiling
     dimensions and z is the scanning dimension"""
 
-    fov_dimensions = SignalChangeVar()
-    fov_position = SignalChangeVar()
-    grid_coords = SignalChangeVar()
-    view_plane = SignalChangeVar()
-    scan_volumes = SignalChangeVar()
-    tile_visibility = SignalChangeVar()
     valueChanged = Signal((str))
     fovMove = Signal((list))
     fovHalt = Signal()
@@ -63,7 +43,14 @@ class VolumeModel(GLOrthoViewWidget):
         limits_line_width: int = 2,
         limits_color: str = "white",
         limits_opacity: float = 0.1,
+        hover_tile_color: str = "white",
+        hover_tile_opacity: float = 0.1,
         dual_sided: bool = True,
+        lod_tile_pixels: float = 4,
+        max_fps: float = 60,
+        fov_image_max_texels: int = 512 * 512,
+        fov_image_memory_mb: float = 512,
+        fov_image_spill_directory: str = None,
     ):
         """
         GLViewWidget to display proposed grid of acquisition
@@ -89,41 +76,49 @@ class VolumeModel(GLOrthoViewWidget):
         :param limits_line_width: width of limits box
         :param limits_color: color of limits box
         :param limits_opacity: opacity of limits box
+        :param lod_tile_pixels: size of tiles in pixels below which neighbouring tiles are drawn merged
+        :param max_fps: maximum number of times per second model is updated. 0 means changes are applied as soon as
+        control returns to event loop
+        :param hover_tile_color: color of tile under mouse
+        :param hover_tile_opacity: opacity of tile under mouse where 1 is fully opaque
+        :param fov_image_max_texels: maximum number of texels of each snapshot placed in model
+        :param fov_image_memory_mb: memory budget of snapshots placed in model. Least recently used are removed first
+        :param fov_image_spill_directory: directory to keep full resolution snapshots in as memory mapped files
         """
 
         super().__init__(rotationMethod="quaternion")
+        self.setup_model(
+            unit=unit,
+            limits=limits,
+            fov_dimensions=fov_dimensions,
+            fov_position=fov_position,
+            coordinate_plane=coordinate_plane,
+            active_tile_color=active_tile_color,
+            active_tile_opacity=active_tile_opacity,
+            dual_active_tile_color=dual_active_tile_color,
+            dual_active_tile_opacity=dual_active_tile_opacity,
+            inactive_tile_color=inactive_tile_color,
+            inactive_tile_opacity=inactive_tile_opacity,
+            tile_line_width=tile_line_width,
+            limits_line_width=limits_line_width,
+            limits_color=limits_color,
+            limits_opacity=limits_opacity,
+            dual_sided=dual_sided,
+            lod_tile_pixels=lod_tile_pixels,
+            max_fps=max_fps,
+            fov_image_max_texels=fov_image_max_texels,
+            fov_image_memory_mb=fov_image_memory_mb,
+            fov_image_spill_directory=fov_image_spill_directory,
+        )
+
+        # all tiles are drawn by one item
+        self.tile_grid = GLTileGridItem(width=tile_line_width, glOptions="additive")
+        self.addItem(self.tile_grid)
 
-        # initialize attributes
-        self.unit = unit
-        self.coordinate_plane = [x.replace("-", "") for x in coordinate_plane] if coordinate_plane else ["x", "y", "z"]
-        self.polarity = [1 if "-" not in x else -1 for x in coordinate_plane]
-        self.fov_dimensions = fov_dimensions[:2] + [0] if fov_dimensions else [1.0, 1.0, 0]  # add 0 in the scanning dim
-        self.fov_position = fov_position if fov_position else [0.0, 0.0, 0.0]
-        self.view_plane = (self.coordinate_plane[0], self.coordinate_plane[1])  # plane currently being viewed
-
-        self.scan_volumes = np.zeros([1, 1])  # 2d list detailing volume of tiles
-        self.grid_coords = np.zeros([1, 1, 3])  # 2d list detailing start position of tiles
-        self.start_tile_coord = np.zeros([1, 1, 3])
-        self.end_tile_coord = np.zeros([1, 1, 3])
-        self.grid_box_items = []  # 2D list detailing box items in grid
-        self.tile_visibility = np.array([[True]])  # 2d list detailing visibility of tiles
-
-        # tile aesthetic properties
-        self.dual_sided = dual_sided
-        self.active_tile_color = active_tile_color
-        self.active_tile_opacity = active_tile_opacity
-        self.dual_active_tile_color = dual_active_tile_color
-        self.dual_active_tile_opacity = dual_active_tile_opacity
-        self.inactive_tile_color = inactive_tile_color
-        self.inactive_tile_opacity = inactive_tile_opacity
-        self.tile_line_width = tile_line_width
-
-        # limits aesthetic properties
-        if not limits:
-            limits = [[float("-inf"), float("inf")] for _ in range(3)]
-        self.limits_line_width = limits_line_width
-        self.limits_color = limits_color
-        self.limits_opacity = limits_opacity
+        # merged tiles drawn instead of tile grid when tiles are too small to see individually
+        self.tile_lod = GLTileGridItem(width=tile_line_width, glOptions="additive")
+        self.tile_lod.setVisible(False)
+        self.addItem(self.tile_lod)
 
         # position data set externally since tiles are assumed out of order
         self.path = GLPathItem(
@@ -135,9 +130,6 @@ class VolumeModel(GLOrthoViewWidget):
         )
         self.addItem(self.path)
 
-        # initialize dict of fov_images
-        self.fov_images = {}
-
         # initialize fov
         self.fov_view = GLShadedBoxItem(
             width=fov_line_width,
@@ -147,6 +139,42 @@ class VolumeModel(GLOrthoViewWidget):
             opacity=fov_opacity,
             glOptions="additive",
         )
+        self.move_fov_view()
+        self.addItem(self.fov_view)
+
+        # highlight tile under mouse
+        self.hover_view = GLShadedBoxItem(
+            width=tile_line_width,
+            pos=np.zeros((1, 1, 3)),
+            size=np.array(self.fov_dimensions),
+            color=hover_tile_color,
+            opacity=hover_tile_opacity,
+            glOptions="additive",
+        )
+        self.hover_view.setVisible(False)
+        self.addItem(self.hover_view)
+        self.setMouseTracking(True)
+
+        if self.limits_box() is not None:
+            pos, size = self.limits_box()
+            stage_limits = GLShadedBoxItem(
+                width=self.limits_line_width,
+                pos=pos.reshape(1, 1, 3),
+                size=size,
+                color=self.limits_color,
+                opacity=self.limits_opacity,
+                glOptions="additive",
+            )
+            self.addItem(stage_limits)
+
+        self._update_opts()
+
+        # Add widgets for toggling view plane, path visibility, and halt stage
+        self.widgets = self.create_widgets()
+
+    def move_fov_view(self) -> None:
+        """Move fov box to fov position"""
+
         self.fov_view.setTransform(
             QMatrix4x4(
                 1,
@@ -167,228 +195,38 @@ class VolumeModel(GLOrthoViewWidget):
                 1,
             )
         )
-        self.addItem(self.fov_view)
-
-        if limits != [[float("-inf"), float("inf")], [float("-inf"), float("inf")], [float("-inf"), float("inf")]]:
-            size = [((max(limits[i]) - min(limits[i])) + self.fov_dimensions[i]) for i in range(3)]
-            pos = np.array(
-                [
-                    [
-                        [
-                            min([x * self.polarity[0] for x in limits[0]]),
-                            min([y * self.polarity[1] for y in limits[1]]),
-                            min([z * self.polarity[2] for z in limits[2]]),
-                        ]
-                    ]
-                ]
-            )
-            stage_limits = GLShadedBoxItem(
-                width=self.limits_line_width,
-                pos=np.array(
-                    [
-                        [
-                            [
-                                min([x * self.polarity[0] for x in limits[0]]),
-                                min([y * self.polarity[1] for y in limits[1]]),
-                                min([z * self.polarity[2] for z in limits[2]]),
-                            ]
-                        ]
-                    ]
-                ),
-                size=np.array(size),
-                color=self.limits_color,
-                opacity=self.limits_opacity,
-                glOptions="additive",
-            )
-            self.addItem(stage_limits)
-
-        self.valueChanged[str].connect(self.update_model)
-        self.resized.connect(self._update_opts)
-
-        self._update_opts()
-
-        # Add widgets for toggling view plane, path visibility, and halt stage
-        self.widgets = QWidget()
-        layout = QGridLayout()
-
-        path_show = QCheckBox("Show Path")
-        path_show.setChecked(True)
-        path_show.toggled.connect(self.path.setVisible)
-        layout.addWidget(path_show, 0, 0)
-
-        layout.addWidget(QLabel("Plane View: "), 0, 1)
-        view_plane = QButtonGroup()
-        for i, view in enumerate(
-            [
-                f"({self.coordinate_plane[0]}, {self.coordinate_plane[2]})",
-                f"({self.coordinate_plane[2]}, {self.coordinate_plane[1]})",
-                f"({self.coordinate_plane[0]}, {self.coordinate_plane[1]})",
-            ]
-        ):
-            button = QRadioButton(view)
-            button.clicked.connect(lambda clicked, b=button: self.toggle_view_plane(b))
-            view_plane.addButton(button)
-            button.setChecked(True)
-            layout.addWidget(button, 0, i + 2)
-
-        halt = QPushButton("HALT STAGE")
-        halt.pressed.connect(self.fovHalt.emit)
-        layout.addWidget(halt, 1, 0, 1, 5)
-
-        self.widgets.setLayout(layout)
-        self.widgets.setMaximumHeight(70)
-        self.widgets.show()
-
-    def update_model(self, attribute_name) -> None:
-        """Update attributes of grid
-        :param attribute_name: name of attribute to update"""
-
-        # update color of tiles based on z position
-        flat_coords = self.grid_coords.reshape([-1, 3])  # flatten array
-        flat_dims = self.scan_volumes.flatten()  # flatten array
-        coords = np.concatenate((flat_coords, [[x, y, (z + sz)] for (x, y, z), sz in zip(flat_coords, flat_dims)]))
-        extrema = [
-            [min(coords[:, 0]), max(coords[:, 0])],
-            [min(coords[:, 1]), max(coords[:, 1])],
-            [min(coords[:, 2]), max(coords[:, 2])],
-        ]
-        in_grid = not any(
-            [pos > pos_max or pos < pos_min for (pos_min, pos_max), pos in zip(extrema, self.fov_position)]
-        )
-
-        if attribute_name == "fov_position":
-            # update fov_pos
-            self.fov_view.setTransform(
-                QMatrix4x4(
-                    1,
-                    0,
-                    0,
-                    self.fov_position[0] * self.polarity[0],
-                    0,
-                    1,
-                    0,
-                    self.fov_position[1] * self.polarity[1],
-                    0,
-                    0,
-                    1,
-                    self.fov_position[2] * self.polarity[2],
-                    0,
-                    0,
-                    0,
-                    1,
-                )
-            )
 
-            color = self.grid_box_items[0].color() if len(self.grid_box_items) != 0 else None
-            if (not in_grid and color != self.inactive_tile_color) or (in_grid and color != self.active_tile_color):
-                new_color = self.inactive_tile_color if not in_grid else self.active_tile_color
-                for box in self.grid_box_items:
-                    box.setColor(color=new_color)
+    def size_fov_view(self) -> None:
+        """Resize fov box to fov dimensions"""
 
-        else:
-            self.fov_view.setSize(x=self.fov_dimensions[0], y=self.fov_dimensions[1], z=0.0)
-
-            # faster to remove every box than parse which ones have changes
-            for box in self.grid_box_items:
-                self.removeItem(box)
-            self.grid_box_items = []
-
-            total_rows = len(self.grid_coords)
-            total_columns = len(self.grid_coords[0])
-
-            # determine middle x coordinate
-            center_line = np.mean(coords[:, 0])
-
-            for row in range(total_rows):
-                for column in range(total_columns):
-
-                    coord = [x * pol for x, pol in zip(self.grid_coords[row][column], self.polarity)]
-                    size = [*self.fov_dimensions[:2], self.scan_volumes[row, column]]
-
-                    # determine color
-                    if in_grid:
-                        color = self.active_tile_color if coord[0] < center_line or not self.dual_sided else self.dual_active_tile_color
-                        opacity = self.active_tile_opacity if coord[0] < center_line or not self.dual_sided else self.dual_active_tile_opacity
-                    else:
-                        color = self.inactive_tile_color
-                        opacity = self.inactive_tile_opacity
-
-                    # if coord[0] < center_line and in_grid:
-                    #     color = self.active_tile_color
-                    #     opacity = self.active_tile_opacity
-                    # elif coord[0] >= center_line and in_grid:
-                    #     if self.dual_sided:
-                    #         color = self.dual_active_tile_color
-                    #         opacity = self.dual_active_tile_opacity
-                    #     else:
-                    #         color = self.active_tile_color
-                    #         opacity = self.active_tile_opacity
-                    # else:
-                    #     color = self.inactive_tile_color
-                    #     opacity = self.inactive_tile_opacity
-
-                    # scale opacity for viewing
-                    if self.view_plane == (self.coordinate_plane[2], self.coordinate_plane[1]):
-                        opacity = opacity / total_columns
-                    elif self.view_plane != (self.coordinate_plane[0], self.coordinate_plane[1]):
-                        opacity = opacity / total_rows
-
-                    box = GLShadedBoxItem(
-                        width=self.tile_line_width,
-                        pos=np.array([[coord]]),
-                        size=np.array(size),
-                        color=color,
-                        opacity=opacity,
-                        glOptions="additive",
-                    )
-                    box.setVisible(self.tile_visibility[row, column])
-                    self.addItem(box)
-                    self.grid_box_items.append(box)
-
-        self._update_opts()
+        self.fov_view.setSize(x=self.fov_dimensions[0], y=self.fov_dimensions[1], z=0.0)
 
-    def toggle_view_plane(self, button) -> None:
+    def view_size(self) -> tuple[float, float]:
         """
-        Update view plane optics
-        :param button: button pressed to change view
+        Size of area shown by widget in view coordinates
+        :return: horizontal and vertical size
         """
 
-        view_plane = tuple(x for x in button.text() if x.isalpha())
-        self.view_plane = view_plane
-
-    def set_path_pos(self, coord_order: list) -> None:
-        """Set the pos of path in correct order
-        :param coord_order: ordered list of coords for path"""
-
-        path = np.array(
-            [
-                [
-                    ((coord[i] * pol) + (0.5 * fov))
-                    for i, fov, pol, x in zip([0, 1, 2], self.fov_dimensions, self.polarity, self.coordinate_plane)
-                ]
-                for coord in coord_order
-            ]
-        )
-        self.path.setData(pos=path)
+        width = 2 * (self.opts["distance"] / tan(radians(self.opts["fov"]))) / 1200
+        return width, width * self.size().height() / self.size().width()
 
-    def add_fov_image(self, image: np.ndarray, levels: list[float]) -> None:
-        """add image to model assuming image has same fov dimensions and orientation
-        :param image: numpy array of image to display in model
-        :param levels: levels for passed in image"""
-
-        image_rgba = makeRGBA(image, levels=levels)
-        image_rgba[0][:, :, 3] = 200
+    def _add_fov_image_item(self, handle: int) -> None:
+        """
+        Create image item showing snapshot at position it was taken
+        :param handle: handle of snapshot in fov_mosaic
+        """
 
-        gl_image = GLImageItem(image_rgba[0], glOptions="additive")
-        x, y, z = self.fov_position
+        tile = self.fov_mosaic.get(handle)
+        gl_image = GLImageItem(tile.texture, glOptions="additive")
+        x, y, z = tile.position
         gl_image.setTransform(
             QMatrix4x4(
-                self.fov_dimensions[0] / image.shape[0],
+                self.fov_dimensions[0] / tile.data.shape[0],
                 0,
                 0,
                 x * self.polarity[0],
                 0,
-                self.fov_dimensions[1] / image.shape[1],
+                self.fov_dimensions[1] / tile.data.shape[1],
                 0,
                 y * self.polarity[1],
                 0,
@@ -402,41 +240,48 @@ class VolumeModel(GLOrthoViewWidget):
             )
         )
         self.addItem(gl_image)
-        self.fov_images[image.tobytes()] = gl_image
+        self.fov_images[handle] = gl_image
+        self.image_index = None
 
         if self.view_plane != (self.coordinate_plane[0], self.coordinate_plane[1]):
             gl_image.setVisible(False)
 
+    def _remove_fov_image_item(self, handle: int) -> None:
+        """
+        Remove image item of snapshot
+        :param handle: handle of snapshot in fov_mosaic
+        """
+
+        self.removeItem(self.fov_images.pop(handle))
+        self.image_index = None
+
     def adjust_glimage_contrast(self, image: np.ndarray, contrast_levels: list[float]) -> None:
         """
         Adjust image in model contrast levels
-        :param image: numpy array of image key in fov_images
+        :param image: numpy array of image snapshot was taken from
         :param contrast_levels: levels for passed in image
         """
 
-        if image.tobytes() in self.fov_images.keys():  # check if image has been deleted
-            glimage = self.fov_images[image.tobytes()]
-            coords = [glimage.transform()[i, 3] / pol for i, pol in zip(range(3), self.polarity)]
-            self.removeItem(glimage)
-            self.add_fov_image(image, contrast_levels)
-
-    def toggle_fov_image_visibility(self, visible: bool) -> None:
-        """Function to hide all fov_images
-        :param visible: boolean for if fov_images should be visible"""
-
-        for image in self.fov_images.values():
-            image.setVisible(visible)
+        handle = self.fov_mosaic.find(image)
+        if handle is not None:  # check if image has been deleted
+            tile = self.fov_mosaic.set_levels(handle, contrast_levels)
+            self.fov_images[handle].setData(tile.texture)  # same buffer so item only uploads texture again
 
     def _update_opts(self) -> None:
         """Update view of widget. Note that x/y notation refers to horizontal/vertical dimensions of grid view"""
 
         view_plane = self.view_plane
-        view_pol = [
-            self.polarity[self.coordinate_plane.index(view_plane[0])],
-            self.polarity[self.coordinate_plane.index(view_plane[1])],
-        ]
+        fov_position = tuple(float(x) for x in self.fov_position)
+        framing_key = (view_plane, fov_position, tuple(self.fov_dimensions), self.width(), self.height(),
+                       self.opts["fov"])
+        if framing_key == self.framing_key:
+            self.update_lod()  # tiles may have changed
+            return  # view is already framed for these inputs
+        self.framing_key = framing_key
+
+        axes = [self.coordinate_plane.index(view_plane[0]), self.coordinate_plane.index(view_plane[1])]
+        view_pol = [self.polarity[axes[0]], self.polarity[axes[1]]]
         coords = self.grid_coords.reshape([-1, 3])  # flatten array
-        dimensions = self.scan_volumes.flatten()  # flatten array
 
         # set rotation
         root = sqrt(2.0) / 2.0
@@ -449,39 +294,18 @@ class VolumeModel(GLOrthoViewWidget):
                 else QQuaternion(-root, root, 0, 0)
             )
             # take into account end of tile and account for difference in size if z included in view
-            coords = np.concatenate((coords, [[x, y, (z + sz)] for (x, y, z), sz in zip(coords, dimensions)]))
+            coords = np.concatenate((coords, coords + np.outer(self.scan_volumes.flatten(), [0, 0, 1])))
 
-        extrema = {
-            f"{self.coordinate_plane[0]}_min": min(coords[:, 0]),
-            f"{self.coordinate_plane[0]}_max": max(coords[:, 0]),
-            f"{self.coordinate_plane[1]}_min": min(coords[:, 1]),
-            f"{self.coordinate_plane[1]}_max": max(coords[:, 1]),
-            f"{self.coordinate_plane[2]}_min": min(coords[:, 2]),
-            f"{self.coordinate_plane[2]}_max": max(coords[:, 2]),
-        }
+        low, high = self.grid_extents[self.view_extents()]
+        extrema = {}
+        for axis, axis_min, axis_max in zip(self.coordinate_plane, low, high):
+            extrema[f"{axis}_min"], extrema[f"{axis}_max"] = axis_min, axis_max
 
         fov = {plane: fov for plane, fov in zip(self.coordinate_plane, self.fov_dimensions)}
-        pos = {axis: dim for axis, dim in zip(self.coordinate_plane, self.fov_position)}
-        distances = {
-            self.coordinate_plane[0]
-            + self.coordinate_plane[1]: [
-                sqrt((pos[view_plane[0]] - x) ** 2 + (pos[view_plane[1]] - y) ** 2) for x, y, z in coords
-            ],
-            self.coordinate_plane[0]
-            + self.coordinate_plane[2]: [
-                sqrt((pos[view_plane[0]] - x) ** 2 + (pos[view_plane[1]] - z) ** 2) for x, y, z in coords
-            ],
-            self.coordinate_plane[2]
-            + self.coordinate_plane[1]: [
-                sqrt((pos[view_plane[0]] - z) ** 2 + (pos[view_plane[1]] - y) ** 2) for x, y, z in coords
-            ],
-        }
-        max_index = distances["".join(view_plane)].index(max(distances["".join(view_plane)], key=abs))
-        furthest_tile = {
-            self.coordinate_plane[0]: coords[max_index][0],
-            self.coordinate_plane[1]: coords[max_index][1],
-            self.coordinate_plane[2]: coords[max_index][2],
-        }
+        pos = {axis: dim for axis, dim in zip(self.coordinate_plane, fov_position)}
+        # distance from fov to tiles in view plane
+        distances = np.hypot(pos[view_plane[0]] - coords[:, axes[0]], pos[view_plane[1]] - coords[:, axes[1]])
+        furthest_tile = dict(zip(self.coordinate_plane, coords[np.argmax(distances)]))
         center = {}
 
         # Horizontal sizing, if fov_position is within grid or farthest distance is between grid tiles
@@ -522,126 +346,43 @@ class VolumeModel(GLOrthoViewWidget):
             center.get(self.coordinate_plane[1], 0),
             center.get(self.coordinate_plane[2], 0),
         )
+        self.fov_framed_inside = self.fov_in_extents(self.view_extents(), view_plane)
+        self.update_lod()
 
         self.update()
 
-    def move_fov_query(self, new_fov_pos: list[float]) -> [int, bool]:
-        """Message box asking if user wants to move fov position
-        :param new_fov_pos: position to move the fov to in um
-        :return: user reply to pop up and whether to move to the tile nearest the new_fov_pos
+    def view_point(self, x: float, y: float) -> np.ndarray:
+        """
+        Translate widget position into view coordinates, where positions are multiplied by polarity. The dimension
+        out of view plane is taken from fov position
+        :param x: horizontal position in widget
+        :param y: vertical position in widget
+        :return: position in view coordinates
         """
 
-        msgBox = QMessageBox()
-        msgBox.setIcon(QMessageBox.Question)
-        msgBox.setText(
-            f"Do you want to move the field of view from "
-            f"{[round(x, 2) for x in self.fov_position]} [{self.unit}] to "
-            f"{[round(x, 2) for x in new_fov_pos]} [{self.unit}]?"
-        )
-        msgBox.setWindowTitle("Moving FOV")
-        msgBox.setStandardButtons(QMessageBox.Ok | QMessageBox.Cancel)
-
-        checkbox = QCheckBox("Move to nearest tile")
-        checkbox.setChecked(True)
-        msgBox.setCheckBox(checkbox)
-
-        return msgBox.exec(), checkbox.isChecked()
-
-    def delete_fov_image_query(self, fov_image_pos: list[float]) -> int:
-        """Message box asking if user wants to move fov position
-        :param fov_image_pos: coordinates of fov image
-        :return: user reply to deleting image"""
-
-        msgBox = QMessageBox()
-        msgBox.setIcon(QMessageBox.Question)
-        msgBox.setText(f"Do you want to delete image at {fov_image_pos} [{self.unit}]?")
-        msgBox.setWindowTitle("Deleting FOV Image")
-        msgBox.setStandardButtons(QMessageBox.Ok | QMessageBox.Cancel)
-
-        return msgBox.exec()
-
-    def mousePressEvent(self, event) -> None:
-        """Override mouseMoveEvent so user can't change view
-        and allow user to move fov easier
-        :param event: QMouseEvent of users mouse"""
-
-        plane = list(self.view_plane) + [ax for ax in self.coordinate_plane if ax not in self.view_plane]
-        view_pol = [
-            self.polarity[self.coordinate_plane.index(plane[0])],
-            self.polarity[self.coordinate_plane.index(plane[1])],
-            self.polarity[self.coordinate_plane.index(plane[2])],
-        ]
-        # Translate mouseclick x, y into view widget coordinate plane.
-        horz_dist = (self.opts["distance"] / tan(radians(self.opts["fov"]))) / 1200
-        vert_dist = (
-            self.opts["distance"] / tan(radians(self.opts["fov"])) * (self.size().height() / self.size().width())
-        ) / 1200
-        horz_scale = (event.x() * 2 * horz_dist) / self.size().width()
-        vert_scale = (event.y() * 2 * vert_dist) / self.size().height()
-
-        # create dictionaries of from fov and pos
-        fov = {axis: fov for axis, fov in zip(self.coordinate_plane, self.fov_dimensions)}
-        pos = {axis: dim for axis, dim in zip(self.coordinate_plane, self.fov_position)}
-
-        center = {
-            self.coordinate_plane[0]: self.opts["center"].x(),
-            self.coordinate_plane[1]: self.opts["center"].y(),
-            self.coordinate_plane[2]: self.opts["center"].z(),
-        }
-        h_ax = self.view_plane[0]
-        v_ax = self.view_plane[1]
-
-        new_pos = {
-            plane[0]: ((center[h_ax] - horz_dist + horz_scale) - 0.5 * fov[plane[0]]) * view_pol[0],
-            plane[1]: ((center[v_ax] + vert_dist - vert_scale) - 0.5 * fov[plane[1]]) * view_pol[1],
-            plane[2]: pos[plane[2]] * view_pol[2],
-        }
-        move_to = [new_pos[ax] for ax in self.coordinate_plane]
-        if event.button() == Qt.LeftButton:
-            return_value, checkbox = self.move_fov_query(move_to)
-
-            if return_value == QMessageBox.Ok:
-                if not checkbox:  # Move to exact location
-                    pos = move_to
-                else:  # move to the nearest tile
-                    flattened = self.grid_coords.reshape([-1, 3])
-                    tree = spatial.KDTree(self.grid_coords.reshape([-1, 3]))
-                    distance, index = tree.query(move_to)
-                    tile = flattened[index]
-                    pos = [tile[0], tile[1], tile[2]]
-                self.fovMove.emit(pos)
-
-            else:
-                return
-
-        elif event.button() == Qt.RightButton:
-            delete_key = None
-            for key, image in self.fov_images.items():
-                coords = [image.transform()[i, 3] for i in range(3)]
-                if (
-                    coords[0] - self.fov_dimensions[0] <= coords[0] <= coords[0] + self.fov_dimensions[0]
-                    and coords[1] - self.fov_dimensions[1] <= coords[1] <= coords[1] + self.fov_dimensions[1]
-                ):
-                    return_value = self.delete_fov_image_query(coords)
-                    if return_value == QMessageBox.Ok:
-                        self.removeItem(image)
-                        delete_key = key
-                    break
-            if delete_key is not None:
-                del self.fov_images[delete_key]
-
-    def mouseMoveEvent(self, event):
-        """Override mouseMoveEvent so user can't change view"""
-        pass
-
-    def wheelEvent(self, event):
-        """Override wheelEvent so user can't change view"""
-        pass
-
-    def keyPressEvent(self, event):
-        """Override keyPressEvent so user can't change view"""
-        pass
-
-    def keyReleaseEvent(self, event):
-        """Override keyPressEvent so user can't change view"""
-        pass
+        horz_dist, vert_dist = [span / 2 for span in self.view_size()]
+        center = [self.opts["center"].x(), self.opts["center"].y(), self.opts["center"].z()]
+        h_ax, v_ax = [self.coordinate_plane.index(axis) for axis in self.view_plane]
+
+        point = np.array(self.fov_position, dtype=float) * self.polarity
+        point[h_ax] = center[h_ax] - horz_dist + (x * 2 * horz_dist) / self.size().width()
+        point[v_ax] = center[v_ax] + vert_dist - (y * 2 * vert_dist) / self.size().height()
+        return point
+
+    def hover_tile(self, index: int or None) -> None:
+        """
+        Highlight tile under mouse
+        :param index: index of tile in flattened grid or None to remove highlight
+        """
+
+        if index == self.hovered_tile:
+            return
+        self.hovered_tile = index
+        if index is None:
+            self.hover_view.setVisible(False)
+            return
+        x, y, z = self.tile_grid.tileSizes()[index]
+        self.hover_view.setSize(x=x, y=y, z=z)
+        self.hover_view.resetTransform()
+        self.hover_view.translate(*self.tile_grid.tilePositions()[index])
+        self.hover_view.setVisible(True)
@@ -0,0 +1,302 @@
+from pyqtgraph import PlotWidget, ImageItem
+from qtpy.QtCore import Signal, QPoint, QRectF
+from qtpy.QtGui import QPainter
+import numpy as np
+from view.widgets.acquisition_widgets.volume_model_base import VolumeModelBase
+from view.widgets.miscellaneous_widgets.plot_path_item import PlotPathItem
+from view.widgets.miscellaneous_widgets.plot_tile_grid_item import PlotTileGridItem, convert_color
+
+
+class VolumeModel2D(VolumeModelBase, PlotWidget):
+    """Widget to display configured acquisition grid on a 2D scene instead of an OpenGL scene. The model only ever
+    shows one of three orthographic planes, so tiles, fov and path are drawn as rectangles and lines projected onto
+    the view plane and widget positions map to stage positions through the view box transform. Starts faster than
+    VolumeModel and works with software rendering. Note that the x and y refer to the tiling dimensions and z is the
+    scanning dimension"""
+
+    valueChanged = Signal((str))
+    fovMove = Signal((list))
+    fovHalt = Signal()
+    resized = Signal()
+
+    def __init__(
+        self,
+        unit: str = "mm",
+        limits: list[[float, float], [float, float], [float, float]] = None,
+        fov_dimensions: list[float, float, float] = None,
+        fov_position: list[float, float, float] = None,
+        coordinate_plane: list[str, str, str] = None,
+        fov_color: str = "yellow",
+        fov_line_width: int = 2,
+        fov_opacity: float = 0.15,
+        path_line_width: int = 2,
+        path_arrow_size: float = 6.0,
+        path_arrow_aspect_ratio: int = 4,
+        path_start_color: str = "yellow",
+        path_end_color: str = "green",
+        active_tile_color: str = "cyan",
+        active_tile_opacity: float = 0.075,
+        dual_active_tile_color: str = "magenta",
+        dual_active_tile_opacity: float = 0.075,
+        inactive_tile_color: str = "red",
+        inactive_tile_opacity: float = 0.025,
+        tile_line_width: int = 2,
+        limits_line_width: int = 2,
+        limits_color: str = "white",
+        limits_opacity: float = 0.1,
+        hover_tile_color: str = "white",
+        hover_tile_opacity: float = 0.1,
+        dual_sided: bool = True,
+        lod_tile_pixels: float = 4,
+        max_fps: float = 60,
+        fov_image_max_texels: int = 512 * 512,
+        fov_image_memory_mb: float = 512,
+        fov_image_spill_directory: str = None,
+    ):
+        """
+        Takes the same arguments as VolumeModel so either can be configured with the same init arguments
+
+        :param fov_color: color of fov
+        :param fov_line_width: width of fov outline in pixels
+        :param fov_opacity: opacity of fov face where 1 is fully opaque
+        :param path_line_width: width of path line in pixels
+        :param path_arrow_size: size of arrow at the end of path as a percentage of the field of view
+        :param path_arrow_aspect_ratio: aspect ratio of arrow
+        :param path_start_color: start color of path
+        :param path_end_color: end color of path
+        :param hover_tile_color: color of tile under mouse
+        :param hover_tile_opacity: opacity of tile under mouse where 1 is fully opaque
+        The remaining arguments are described in VolumeModelBase.setup_model
+        """
+
+        super().__init__(background="k")
+        self.setup_model(
+            unit=unit,
+            limits=limits,
+            fov_dimensions=fov_dimensions,
+            fov_position=fov_position,
+            coordinate_plane=coordinate_plane,
+            active_tile_color=active_tile_color,
+            active_tile_opacity=active_tile_opacity,
+            dual_active_tile_color=dual_active_tile_color,
+            dual_active_tile_opacity=dual_active_tile_opacity,
+            inactive_tile_color=inactive_tile_color,
+            inactive_tile_opacity=inactive_tile_opacity,
+            tile_line_width=tile_line_width,
+            limits_line_width=limits_line_width,
+            limits_color=limits_color,
+            limits_opacity=limits_opacity,
+            dual_sided=dual_sided,
+            lod_tile_pixels=lod_tile_pixels,
+            max_fps=max_fps,
+            fov_image_max_texels=fov_image_max_texels,
+            fov_image_memory_mb=fov_image_memory_mb,
+            fov_image_spill_directory=fov_image_spill_directory,
+        )
+
+        # view is framed by model so user can't pan, zoom or open menus
+        plot_item = self.getPlotItem()
+        plot_item.hideAxis("left")
+        plot_item.hideAxis("bottom")
+        plot_item.hideButtons()
+        plot_item.setMenuEnabled(False)
+        self.view_box = plot_item.getViewBox()
+        self.view_box.setMouseEnabled(x=False, y=False)
+        self.view_box.setAspectLocked(True)
+        self.view_box.disableAutoRange()
+
+        if self.limits_box() is not None:
+            pos, size = self.limits_box()
+            self.stage_limits = PlotTileGridItem(width=limits_line_width)
+            self.stage_limits.setData(pos=pos, size=size, colors=convert_color(limits_color, limits_opacity))
+            self.view_box.addItem(self.stage_limits)
+        else:
+            self.stage_limits = None
+
+        # all tiles are drawn by one item
+        self.tile_grid = PlotTileGridItem(width=tile_line_width)
+        self.view_box.addItem(self.tile_grid)
+
+        # merged tiles drawn instead of tile grid when tiles are too small to see individually
+        self.tile_lod = PlotTileGridItem(width=tile_line_width)
+        self.tile_lod.setVisible(False)
+        self.view_box.addItem(self.tile_lod)
+
+        # position data set externally since tiles are assumed out of order
+        self.path = PlotPathItem(
+            width=path_line_width,
+            arrow_size=path_arrow_size,
+            arrow_aspect_ratio=path_arrow_aspect_ratio,
+            path_start_color=path_start_color,
+            path_end_color=path_end_color,
+        )
+        self.path.setZValue(1)  # drawn above snapshots
+        self.view_box.addItem(self.path)
+
+        # initialize fov
+        self.fov_view = PlotTileGridItem(width=fov_line_width)
+        self.fov_view.setData(
+            pos=np.multiply(self.fov_position, self.polarity),
+            size=self.fov_dimensions,
+            colors=convert_color(fov_color, fov_opacity),
+        )
+        self.fov_view.setZValue(2)
+        self.view_box.addItem(self.fov_view)
+
+        # highlight tile under mouse
+        self.hover_view = PlotTileGridItem(width=tile_line_width)
+        self.hover_view.setData(pos=np.zeros(3), size=self.fov_dimensions, colors=convert_color(
+            hover_tile_color, hover_tile_opacity))
+        self.hover_view.setZValue(2)
+        self.hover_view.setVisible(False)
+        self.view_box.addItem(self.hover_view)
+        self.setMouseTracking(True)
+
+        self.set_view_axes()
+        self._update_opts()
+
+        # Add widgets for toggling view plane, path visibility, and halt stage
+        self.widgets = self.create_widgets()
+
+    def resizeEvent(self, event) -> None:
+        """Emit resized so view is reframed for new size"""
+
+        super().resizeEvent(event)
+        self.resized.emit()
+
+    def render_model(self) -> None:
+        """Project items onto new view plane before applying changes"""
+
+        if "view_plane" in self.dirty:
+            self.set_view_axes()
+        super().render_model()
+
+    def set_view_axes(self) -> None:
+        """Project items onto view plane. Snapshots are only shown in the plane of the tiling dimensions"""
+
+        axes = [self.coordinate_plane.index(axis) for axis in self.view_plane]
+        for item in (self.stage_limits, self.tile_grid, self.tile_lod, self.path, self.fov_view, self.hover_view):
+            if item is not None:
+                item.setAxes(*axes)
+        for image in self.fov_images.values():
+            image.setVisible(self.view_plane == (self.coordinate_plane[0], self.coordinate_plane[1]))
+
+    def move_fov_view(self) -> None:
+        """Move fov box to fov position"""
+
+        self.fov_view.updateTiles([0], pos=np.multiply(self.fov_position, self.polarity))
+
+    def size_fov_view(self) -> None:
+        """Resize fov box to fov dimensions"""
+
+        self.fov_view.updateTiles([0], size=[self.fov_dimensions[0], self.fov_dimensions[1], 0.0])
+
+    def view_size(self) -> tuple[float, float]:
+        """
+        Size of area shown by widget in view coordinates
+        :return: horizontal and vertical size
+        """
+
+        (left, right), (bottom, top) = self.view_box.viewRange()
+        return right - left, top - bottom
+
+    def _add_fov_image_item(self, handle: int) -> None:
+        """
+        Create image item showing snapshot at position it was taken
+        :param handle: handle of snapshot in fov_mosaic
+        """
+
+        tile = self.fov_mosaic.get(handle)
+        image = ImageItem(tile.texture, autoLevels=False)
+        image.setCompositionMode(QPainter.CompositionMode_Plus)
+        x, y, z = tile.position
+        image.setRect(QRectF(x * self.polarity[0], y * self.polarity[1], self.fov_dimensions[0],
+                             self.fov_dimensions[1]))
+        self.view_box.addItem(image)
+        self.fov_images[handle] = image
+        self.image_index = None
+
+        if self.view_plane != (self.coordinate_plane[0], self.coordinate_plane[1]):
+            image.setVisible(False)
+
+    def _remove_fov_image_item(self, handle: int) -> None:
+        """
+        Remove image item of snapshot
+        :param handle: handle of snapshot in fov_mosaic
+        """
+
+        self.view_box.removeItem(self.fov_images.pop(handle))
+        self.image_index = None
+
+    def adjust_glimage_contrast(self, image: np.ndarray, contrast_levels: list[float]) -> None:
+        """
+        Adjust image in model contrast levels
+        :param image: numpy array of image snapshot was taken from
+        :param contrast_levels: levels for passed in image
+        """
+
+        handle = self.fov_mosaic.find(image)
+        if handle is not None:  # check if image has been deleted
+            tile = self.fov_mosaic.set_levels(handle, contrast_levels)
+            self.fov_images[handle].setImage(tile.texture, autoLevels=False)
+
+    def _update_opts(self) -> None:
+        """Frame view on tiles and fov. Note that x/y notation refers to horizontal/vertical dimensions of grid view"""
+
+        view_plane = self.view_plane
+        fov_position = tuple(float(x) for x in self.fov_position)
+        framing_key = (view_plane, fov_position, tuple(self.fov_dimensions), self.width(), self.height())
+        if framing_key == self.framing_key:
+            self.update_lod()  # tiles may have changed
+            return  # view is already framed for these inputs
+        self.framing_key = framing_key
+
+        # bounds of tiles and fov in view coordinates padded by half a fov
+        axes = [self.coordinate_plane.index(view_plane[0]), self.coordinate_plane.index(view_plane[1])]
+        fov_low = np.multiply(fov_position, self.polarity)
+        low, high = fov_low, fov_low + self.fov_dimensions
+        if self.tile_grid.tileCount():
+            low = np.minimum(low, self.tile_grid.tilePositions().min(axis=0))
+            high = np.maximum(high, (self.tile_grid.tilePositions() + self.tile_grid.tileSizes()).max(axis=0))
+        padding = max(self.fov_dimensions[:2]) / 2
+        self.view_box.setRange(
+            xRange=(low[axes[0]] - padding, high[axes[0]] + padding),
+            yRange=(low[axes[1]] - padding, high[axes[1]] + padding),
+            padding=0,
+        )
+        self.fov_framed_inside = self.fov_in_extents(self.view_extents(), view_plane)
+        self.update_lod()
+
+    def view_point(self, x: float, y: float) -> np.ndarray:
+        """
+        Translate widget position into view coordinates, where positions are multiplied by polarity. The dimension
+        out of view plane is taken from fov position
+        :param x: horizontal position in widget
+        :param y: vertical position in widget
+        :return: position in view coordinates
+        """
+
+        h_ax, v_ax = [self.coordinate_plane.index(axis) for axis in self.view_plane]
+        position = self.view_box.mapSceneToView(self.mapToScene(QPoint(int(x), int(y))))
+
+        point = np.array(self.fov_position, dtype=float) * self.polarity
+        point[h_ax] = position.x()
+        point[v_ax] = position.y()
+        return point
+
+    def hover_tile(self, index: int or None) -> None:
+        """
+        Highlight tile under mouse
+        :param index: index of tile in flattened grid or None to remove highlight
+        """
+
+        if index == self.hovered_tile:
+            return
+        self.hovered_tile = index
+        if index is None:
+            self.hover_view.setVisible(False)
+            return
+        self.hover_view.updateTiles(
+            [0], pos=self.tile_grid.tilePositions()[index], size=self.tile_grid.tileSizes()[index]
+        )
+        self.hover_view.setVisible(True)
@@ -0,0 +1,634 @@
+from qtpy.QtWidgets import QMessageBox, QCheckBox, QGridLayout, QButtonGroup, QLabel, QRadioButton, QPushButton, QWidget
+from qtpy.QtCore import Qt, QTimer
+from time import monotonic
+import numpy as np
+from scipy.spatial import cKDTree
+from view.fov_mosaic import FovMosaic
+from view.spatial_index import points_in_box
+from view.widgets.miscellaneous_widgets.plot_tile_grid_item import convert_color
+
+
+class SignalChangeVar:
+
+    def __set_name__(self, owner, name):
+        self.name = f"_{name}"
+
+    def __set__(self, instance, value):
+        setattr(instance, self.name, value)  # initially setting attr
+        instance.valueChanged.emit(self.name[1:])
+
+    def __get__(self, instance, value):
+        return getattr(instance, self.name)
+
+
+class VolumeModelBase:
+    """Part of the volume model shared by its renderers. Keeps state of grid, fov and snapshots, decides which changes
+    need tiles synced or view reframed and picks tiles and images under the mouse. Renderers mix this class into their
+    view widget, define the valueChanged, fovMove, fovHalt and resized signals and create tile_grid, tile_lod, path,
+    fov_view and hover_view items. Note that the x and y refer to the tiling dimensions and z is the scanning
+    dimension"""
+
+    fov_dimensions = SignalChangeVar()
+    fov_position = SignalChangeVar()
+    grid_coords = SignalChangeVar()
+    view_plane = SignalChangeVar()
+    scan_volumes = SignalChangeVar()
+    tile_visibility = SignalChangeVar()
+
+    def setup_model(
+        self,
+        unit: str = "mm",
+        limits: list[[float, float], [float, float], [float, float]] = None,
+        fov_dimensions: list[float, float, float] = None,
+        fov_position: list[float, float, float] = None,
+        coordinate_plane: list[str, str, str] = None,
+        active_tile_color: str = "cyan",
+        active_tile_opacity: float = 0.075,
+        dual_active_tile_color: str = "magenta",
+        dual_active_tile_opacity: float = 0.075,
+        inactive_tile_color: str = "red",
+        inactive_tile_opacity: float = 0.025,
+        tile_line_width: int = 2,
+        limits_line_width: int = 2,
+        limits_color: str = "white",
+        limits_opacity: float = 0.1,
+        dual_sided: bool = True,
+        lod_tile_pixels: float = 4,
+        max_fps: float = 60,
+        fov_image_max_texels: int = 512 * 512,
+        fov_image_memory_mb: float = 512,
+        fov_image_spill_directory: str = None,
+    ) -> None:
+        """
+        Initialize state of model. Called by renderers before they create their items
+        :param unit: unit of the volume model.
+        :param limits: list of limits ordered in [tile_dim[0], tile_dim[1], scan_dim[0]]
+        :param fov_dimensions: dimensions of field of view in coordinate plane
+        :param fov_position: position of fov
+        :param coordinate_plane: coordinate plane displayed on widget.
+        :param active_tile_color: color of tiles when fov is within tile grid
+        :param active_tile_opacity: opacity of active tile grid faces where 1 is fully opaque
+        :param dual_active_tile_color: color of active tiles right of center of grid on dual sided instruments
+        :param dual_active_tile_opacity: opacity of dual active tile faces where 1 is fully opaque
+        :param inactive_tile_color: color of tiles when fov is outside of tile grid
+        :param inactive_tile_opacity: opacity of inactive tile grid faces where 1 is fully opaque
+        :param tile_line_width: width of tiles
+        :param limits_line_width: width of limits box
+        :param limits_color: color of limits box
+        :param limits_opacity: opacity of limits box
+        :param dual_sided: whether tiles right of center of grid use the dual active color
+        :param lod_tile_pixels: size of tiles in pixels below which neighbouring tiles are drawn merged
+        :param max_fps: maximum number of times per second model is updated. 0 means changes are applied as soon as
+        control returns to event loop
+        :param fov_image_max_texels: maximum number of texels of each snapshot placed in model
+        :param fov_image_memory_mb: memory budget of snapshots placed in model. Least recently used are removed first
+        :param fov_image_spill_directory: directory to keep full resolution snapshots in as memory mapped files
+        """
+
+        # initialize attributes
+        self.unit = unit
+        self.coordinate_plane = [x.replace("-", "") for x in coordinate_plane] if coordinate_plane else ["x", "y", "z"]
+        self.polarity = [1 if "-" not in x else -1 for x in coordinate_plane]
+        self.fov_dimensions = fov_dimensions[:2] + [0] if fov_dimensions else [1.0, 1.0, 0]  # add 0 in the scanning dim
+        self.fov_position = fov_position if fov_position else [0.0, 0.0, 0.0]
+        self.view_plane = (self.coordinate_plane[0], self.coordinate_plane[1])  # plane currently being viewed
+
+        self.scan_volumes = np.zeros([1, 1])  # 2d list detailing volume of tiles
+        self.grid_coords = np.zeros([1, 1, 3])  # 2d list detailing start position of tiles
+        self.start_tile_coord = np.zeros([1, 1, 3])
+        self.end_tile_coord = np.zeros([1, 1, 3])
+        self.tile_visibility = np.array([[True]])  # 2d list detailing visibility of tiles
+        self.grid_extents = {}  # min and max corner of tile starts and of whole scan volume, cached for fov moves
+        self.update_grid_extents()
+
+        # tile aesthetic properties
+        self.dual_sided = dual_sided
+        self.active_tile_color = active_tile_color
+        self.active_tile_opacity = active_tile_opacity
+        self.dual_active_tile_color = dual_active_tile_color
+        self.dual_active_tile_opacity = dual_active_tile_opacity
+        self.inactive_tile_color = inactive_tile_color
+        self.inactive_tile_opacity = inactive_tile_opacity
+        self.tile_line_width = tile_line_width
+        self.tiles_in_grid = None  # whether fov was in grid when tiles were last colored
+        self.fov_framed_inside = False  # whether fov was within grid extents of view plane when view was last framed
+        self.framing_key = None  # inputs view was last framed for
+
+        # merged tiles drawn instead of tile grid when tiles are too small to see individually
+        self.lod_tile_pixels = lod_tile_pixels
+        self.lod_key = None  # level of detail and view plane tile_lod was last built for
+
+        # limits aesthetic properties
+        if not limits:
+            limits = [[float("-inf"), float("inf")] for _ in range(3)]
+        self.limits = limits
+        self.limits_line_width = limits_line_width
+        self.limits_color = limits_color
+        self.limits_opacity = limits_opacity
+
+        # snapshots are stored downsampled in mosaic and drawn by one image item each
+        self.fov_mosaic = FovMosaic(
+            max_texels=fov_image_max_texels,
+            max_bytes=int(fov_image_memory_mb * 1024**2),
+            spill_directory=fov_image_spill_directory,
+            alpha=200,
+            evicted=self._remove_fov_image_item,
+        )
+        self.fov_images = {}  # handle of snapshot to image item
+
+        # spatial indexes for picking, built when first needed after tiles or images change
+        self.tile_index = None
+        self.tile_plane_index = None
+        self.image_index = None
+        self.image_handles = []  # handle of each point in image_index
+        self.hovered_tile = None  # tile highlighted under mouse
+
+        # changes are collected and applied at most once per frame
+        self.max_fps = max_fps
+        self.dirty = set()  # names of attributes changed since last render
+        self.last_render = float("-inf")
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(self.render_model)
+        self.valueChanged[str].connect(self.update_model)
+        self.resized.connect(lambda: self.update_model("size"))
+
+    def limits_box(self) -> tuple[np.ndarray, np.ndarray] or None:
+        """
+        Box fov can move within in view coordinates
+        :return: lower corner and size of box or None if stages have no limits
+        """
+
+        if self.limits == [[float("-inf"), float("inf")] for _ in range(3)]:
+            return None
+        size = np.array([(max(self.limits[i]) - min(self.limits[i])) + self.fov_dimensions[i] for i in range(3)])
+        pos = np.array([min(x * polarity for x in limit) for limit, polarity in zip(self.limits, self.polarity)])
+        return pos, size
+
+    def create_widgets(self) -> QWidget:
+        """
+        Create widgets for toggling view plane, path visibility, and halt stage
+        :return: widget holding controls of model
+        """
+
+        widgets = QWidget()
+        layout = QGridLayout()
+
+        path_show = QCheckBox("Show Path")
+        path_show.setChecked(True)
+        path_show.toggled.connect(self.path.setVisible)
+        layout.addWidget(path_show, 0, 0)
+
+        layout.addWidget(QLabel("Plane View: "), 0, 1)
+        view_plane = QButtonGroup()
+        for i, view in enumerate(
+            [
+                f"({self.coordinate_plane[0]}, {self.coordinate_plane[2]})",
+                f"({self.coordinate_plane[2]}, {self.coordinate_plane[1]})",
+                f"({self.coordinate_plane[0]}, {self.coordinate_plane[1]})",
+            ]
+        ):
+            button = QRadioButton(view)
+            button.clicked.connect(lambda clicked, b=button: self.toggle_view_plane(b))
+            view_plane.addButton(button)
+            button.setChecked(True)
+            layout.addWidget(button, 0, i + 2)
+
+        halt = QPushButton("HALT STAGE")
+        halt.pressed.connect(self.fovHalt.emit)
+        layout.addWidget(halt, 1, 0, 1, 5)
+
+        widgets.setLayout(layout)
+        widgets.setMaximumHeight(70)
+        widgets.show()
+        return widgets
+
+    def update_model(self, attribute_name: str) -> None:
+        """Mark attribute as changed and schedule a render. All changes within a frame are applied by one render
+        :param attribute_name: name of attribute to update"""
+
+        self.dirty.add(attribute_name)
+        if not self.render_timer.isActive():
+            wait = self.last_render + 1 / self.max_fps - monotonic() if self.max_fps else 0
+            self.render_timer.start(int(max(0.0, wait) * 1000))
+
+    def render_model(self) -> None:
+        """Apply all changes marked since last render"""
+
+        self.render_timer.stop()
+        changed, self.dirty = self.dirty, set()
+        self.last_render = monotonic()
+        if not changed:
+            return
+
+        if "fov_position" in changed:
+            self.move_fov_view()
+
+        reframe = "size" in changed
+        if changed - {"fov_position", "size"}:  # grid or view plane changed
+            self.update_grid_extents()
+            self.tile_index = None
+            self.tile_plane_index = None
+            self.hover_tile(None)
+            self.size_fov_view()
+            geometry_changed = self.sync_tiles(self.fov_in_extents("volume"))
+            # view only depends on tile positions
+            reframe |= geometry_changed or bool(changed - {"fov_position", "size", "tile_visibility"})
+        else:
+            # update color of tiles based on whether fov is in grid
+            in_grid = self.fov_in_extents("volume")
+            if in_grid != self.tiles_in_grid:
+                self.sync_tiles(in_grid)
+
+        # view is framed on grid alone while fov stays within it
+        if "fov_position" in changed:
+            reframe |= not (self.fov_framed_inside and self.fov_in_extents(self.view_extents(), self.view_plane))
+
+        if reframe:
+            self._update_opts()
+        else:
+            self.update_lod()
+
+    def update_grid_extents(self) -> None:
+        """Cache min and max corner of tile start positions and of whole scan volume including end of tiles"""
+
+        flat_coords = self.grid_coords.reshape([-1, 3])  # flatten array
+        ends = flat_coords + np.outer(self.scan_volumes.flatten(), [0, 0, 1])
+        tiles_min, tiles_max = flat_coords.min(axis=0), flat_coords.max(axis=0)
+        self.grid_extents = {
+            "tiles": (tiles_min, tiles_max),
+            "volume": (np.minimum(tiles_min, ends.min(axis=0)), np.maximum(tiles_max, ends.max(axis=0))),
+        }
+        self.framing_key = None  # grid changed so view needs to be reframed
+
+    def view_extents(self) -> str:
+        """
+        Key of grid extents used to frame view plane. End of tiles are only included if scanning dimension is in view
+        :return: key of grid_extents
+        """
+
+        return "tiles" if self.view_plane == (self.coordinate_plane[0], self.coordinate_plane[1]) else "volume"
+
+    def fov_in_extents(self, extents: str = "volume", axes: list[str] = None) -> bool:
+        """
+        Check if fov position is within cached grid extents
+        :param extents: key of grid_extents to check
+        :param axes: axes to check. Defaults to all axes
+        :return: whether fov is within extents along axes
+        """
+
+        indices = [self.coordinate_plane.index(axis) for axis in axes] if axes else [0, 1, 2]
+        low, high = self.grid_extents[extents]
+        pos = np.asarray(self.fov_position)[indices]
+        return bool(np.all((low[indices] <= pos) & (pos <= high[indices])))
+
+    def sync_tiles(self, in_grid: bool) -> bool:
+        """
+        Compare wanted state of every tile with what tile grid is drawing and patch only tiles that changed. Tile grid
+        is only rebuilt if the number of tiles changed
+        :param in_grid: whether fov is within grid
+        :return: whether position or size of any tile changed
+        """
+
+        flat_coords = self.grid_coords.reshape([-1, 3])
+        pos = flat_coords * self.polarity
+        size = np.zeros((len(flat_coords), 3))
+        size[:, :2] = self.fov_dimensions[:2]
+        size[:, 2] = self.scan_volumes.flatten()
+        colors = self.tile_colors(in_grid)
+        visible = self.tile_visibility if self.tile_visibility.shape == self.grid_coords.shape[:2] else True
+        visible = np.broadcast_to(visible, self.grid_coords.shape[:2]).flatten()
+        self.tiles_in_grid = in_grid
+
+        if self.tile_grid.tileCount() != len(pos):
+            self.tile_grid.setData(pos=pos, size=size, colors=colors, visible=visible)
+            self.lod_key = None
+            return True
+
+        moved = np.any(self.tile_grid.tilePositions() != pos, axis=1)
+        moved |= np.any(self.tile_grid.tileSizes() != size, axis=1)
+        recolored = np.any(self.tile_grid.tileColors() != colors, axis=1) | (self.tile_grid.tileVisibility() != visible)
+        if moved.any():
+            indices = np.flatnonzero(moved)
+            self.tile_grid.updateTiles(indices, pos=pos[indices], size=size[indices])
+        if recolored.any():
+            indices = np.flatnonzero(recolored)
+            self.tile_grid.updateTiles(indices, colors=colors[indices], visible=visible[indices])
+        if moved.any() or recolored.any():
+            self.lod_key = None
+        return bool(moved.any())
+
+    def lod_level(self) -> tuple[int, int] or None:
+        """
+        Number of neighbouring tiles merged along horizontal and vertical axis of view plane so merged tiles are at
+        least lod_tile_pixels wide on screen. Tiles are never merged along the scanning dimension
+        :return: tiles merged along each axis or None if tiles are large enough to draw individually
+        """
+
+        axes = [self.coordinate_plane.index(axis) for axis in self.view_plane]
+        pixels = [
+            self.fov_dimensions[axis] / span * length if span > 0 else float("inf")
+            for axis, span, length in zip(axes, self.view_size(), (self.size().width(), self.size().height()))
+        ]
+        tiling = [axis != 2 for axis in axes]
+        if all(pixel >= self.lod_tile_pixels for pixel, tiled in zip(pixels, tiling) if tiled):
+            return None
+        return tuple(
+            int(np.ceil(self.lod_tile_pixels / pixel)) if tiled and pixel > 0 else 1
+            for pixel, tiled in zip(pixels, tiling)
+        )
+
+    def update_lod(self) -> None:
+        """Draw merged tiles instead of tile grid when tiles are too small on screen. In side views, tiles stacked
+        along the viewing direction are merged too. Merged tiles cover bounding box of their visible tiles with the
+        average color, so the number of boxes drawn is bounded by the size of the widget instead of the grid"""
+
+        rows, columns = self.grid_coords.shape[:2]
+        if self.tile_grid.tileCount() != rows * columns:
+            return  # tile grid hasn't been synced with grid yet
+        level = self.lod_level()
+        key = (level, self.view_plane)
+        if key == self.lod_key:
+            return
+        self.lod_key = key
+        self.tile_grid.setVisible(level is None)
+        self.tile_lod.setVisible(level is not None)
+        if level is None:
+            return
+
+        # group tiles by block of grid in view plane. Grid axes not in view plane are merged whole
+        row, column = np.divmod(np.arange(rows * columns), columns)
+        block = {0: np.zeros_like(row), 1: np.zeros_like(row)}  # block index along tiling dimensions
+        for axis, merged in zip(self.view_plane, level):
+            index = self.coordinate_plane.index(axis)
+            if index != 2:
+                block[index] = (column if index == 0 else row) // merged
+        groups, group = np.unique(block[0] * rows + block[1], return_inverse=True)
+        group = group.reshape(-1)
+
+        # merged boxes keep average brightness of the tiles they replace. Tiles stacked along the viewing direction
+        # already have opacity divided by their number so their opacities add up
+        visible = self.tile_grid.tileVisibility()
+        colors = self.tile_grid.tileColors()
+        out_of_plane = 3 - sum(self.coordinate_plane.index(axis) for axis in self.view_plane)
+        depth = {0: columns, 1: rows, 2: 1}[out_of_plane]  # number of tiles stacked along viewing direction
+        alpha = colors[:, 3] * visible
+        alpha_sum = np.bincount(group, weights=alpha, minlength=len(groups))
+        slots = np.bincount(group, minlength=len(groups)) / depth
+        merged_colors = np.zeros((len(groups), 4))
+        for channel in range(3):
+            merged_colors[:, channel] = np.bincount(group, weights=colors[:, channel] * alpha, minlength=len(groups))
+        merged_colors[:, :3] /= np.maximum(alpha_sum, 1e-12)[:, np.newaxis]
+        merged_colors[:, 3] = alpha_sum / slots
+
+        # bounding box of visible tiles in each group
+        low, high = np.zeros((len(groups), 3)), np.zeros((len(groups), 3))
+        order = np.flatnonzero(visible)[np.argsort(group[visible], kind="stable")]
+        shown_groups, starts = np.unique(group[order], return_index=True)
+        shown = np.zeros(len(groups), dtype=bool)
+        shown[shown_groups] = True
+        if len(order):
+            pos = self.tile_grid.tilePositions()[order]
+            low[shown_groups] = np.minimum.reduceat(pos, starts)
+            high[shown_groups] = np.maximum.reduceat(pos + self.tile_grid.tileSizes()[order], starts)
+        if self.tile_lod.tileCount() != len(groups):
+            self.tile_lod.setData(pos=low, size=high - low, colors=merged_colors, visible=shown)
+            return
+        changed = np.any(self.tile_lod.tilePositions() != low, axis=1)
+        changed |= np.any(self.tile_lod.tileSizes() != high - low, axis=1)
+        changed |= np.any(self.tile_lod.tileColors() != merged_colors, axis=1)
+        changed |= self.tile_lod.tileVisibility() != shown
+        indices = np.flatnonzero(changed)
+        self.tile_lod.updateTiles(
+            indices, pos=low[indices], size=(high - low)[indices], colors=merged_colors[indices], visible=shown[indices]
+        )
+
+    def tile_colors(self, in_grid: bool) -> np.ndarray:
+        """
+        Color of every tile. Tiles are active if the fov is within the grid, and on dual sided instruments tiles
+        right of the center of the grid use the dual active color. Opacity is scaled down by the number of tiles
+        stacked in view
+        :param in_grid: whether fov is within grid
+        :return: rgbF color of each tile, shape (tiles, 4)
+        """
+
+        total_rows, total_columns = self.grid_coords.shape[:2]
+        flat_coords = self.grid_coords.reshape([-1, 3])
+        if in_grid:
+            active = convert_color(self.active_tile_color, self.active_tile_opacity)
+            dual_active = convert_color(self.dual_active_tile_color, self.dual_active_tile_opacity)
+            center_line = np.mean(flat_coords[:, 0])
+            dual = (flat_coords[:, 0] * self.polarity[0] >= center_line) & self.dual_sided
+            colors = np.where(dual[:, np.newaxis], dual_active, active)
+        else:
+            colors = np.tile(convert_color(self.inactive_tile_color, self.inactive_tile_opacity), (len(flat_coords), 1))
+
+        # scale opacity for viewing
+        if self.view_plane == (self.coordinate_plane[2], self.coordinate_plane[1]):
+            colors[:, 3] /= total_columns
+        elif self.view_plane != (self.coordinate_plane[0], self.coordinate_plane[1]):
+            colors[:, 3] /= total_rows
+        return colors
+
+    def toggle_view_plane(self, button) -> None:
+        """
+        Update view plane optics
+        :param button: button pressed to change view
+        """
+
+        view_plane = tuple(x for x in button.text() if x.isalpha())
+        self.view_plane = view_plane
+
+    def set_path_pos(self, coord_order: list) -> None:
+        """Set the pos of path in correct order
+        :param coord_order: ordered list of coords for path"""
+
+        path = np.asarray(coord_order, dtype=float).reshape(-1, 3) * self.polarity
+        path += 0.5 * np.asarray(self.fov_dimensions)
+        self.path.setData(pos=path)
+
+    def add_fov_image(self, image: np.ndarray, levels: list[float]) -> int:
+        """add image to model assuming image has same fov dimensions and orientation
+        :param image: numpy array of image to display in model
+        :param levels: levels for passed in image
+        :return: handle of image in fov_mosaic"""
+
+        handle = self.fov_mosaic.add(image, levels, self.fov_position)
+        self._add_fov_image_item(handle)
+        return handle
+
+    def remove_fov_image(self, handle: int) -> None:
+        """
+        Remove snapshot from model
+        :param handle: handle of snapshot in fov_mosaic
+        """
+
+        self.fov_mosaic.remove(handle)
+        self._remove_fov_image_item(handle)
+
+    def clear_fov_images(self) -> None:
+        """
+        Remove all snapshots from model and delete their spilled originals
+        """
+
+        for handle in list(self.fov_mosaic.tiles):
+            self.remove_fov_image(handle)
+
+    def toggle_fov_image_visibility(self, visible: bool) -> None:
+        """Function to hide all fov_images
+        :param visible: boolean for if fov_images should be visible"""
+
+        for image in self.fov_images.values():
+            image.setVisible(visible)
+
+    def move_fov_query(self, new_fov_pos: list[float]) -> [int, bool]:
+        """Message box asking if user wants to move fov position
+        :param new_fov_pos: position to move the fov to in um
+        :return: user reply to pop up and whether to move to the tile nearest the new_fov_pos
+        """
+
+        msgBox = QMessageBox()
+        msgBox.setIcon(QMessageBox.Question)
+        msgBox.setText(
+            f"Do you want to move the field of view from "
+            f"{[round(x, 2) for x in self.fov_position]} [{self.unit}] to "
+            f"{[round(x, 2) for x in new_fov_pos]} [{self.unit}]?"
+        )
+        msgBox.setWindowTitle("Moving FOV")
+        msgBox.setStandardButtons(QMessageBox.Ok | QMessageBox.Cancel)
+
+        checkbox = QCheckBox("Move to nearest tile")
+        checkbox.setChecked(True)
+        msgBox.setCheckBox(checkbox)
+
+        return msgBox.exec(), checkbox.isChecked()
+
+    def delete_fov_image_query(self, fov_image_pos: list[float]) -> int:
+        """Message box asking if user wants to move fov position
+        :param fov_image_pos: coordinates of fov image
+        :return: user reply to deleting image"""
+
+        msgBox = QMessageBox()
+        msgBox.setIcon(QMessageBox.Question)
+        msgBox.setText(f"Do you want to delete image at {fov_image_pos} [{self.unit}]?")
+        msgBox.setWindowTitle("Deleting FOV Image")
+        msgBox.setStandardButtons(QMessageBox.Ok | QMessageBox.Cancel)
+
+        return msgBox.exec()
+
+    def tile_spatial_index(self) -> cKDTree:
+        """k-d tree of tile start positions in view coordinates, rebuilt if grid changed"""
+
+        if self.tile_index is None:
+            self.tile_index = cKDTree(self.grid_coords.reshape([-1, 3]) * self.polarity)
+        return self.tile_index
+
+    def tile_plane_spatial_index(self) -> cKDTree:
+        """k-d tree of tile start positions projected onto view plane, rebuilt if grid or view plane changed"""
+
+        if self.tile_plane_index is None:
+            axes = [self.coordinate_plane.index(axis) for axis in self.view_plane]
+            self.tile_plane_index = cKDTree(self.tile_spatial_index().data[:, axes])
+        return self.tile_plane_index
+
+    def image_spatial_index(self) -> cKDTree:
+        """k-d tree of fov image positions in tiling plane in view coordinates, rebuilt if images were added or
+        removed"""
+
+        if self.image_index is None:
+            self.image_handles = list(self.fov_images)
+            positions = [self.fov_mosaic.tiles[handle].position for handle in self.image_handles]
+            self.image_index = cKDTree((np.reshape(positions, (-1, 3)) * self.polarity)[:, :2])
+        return self.image_index
+
+    def tile_at(self, point: np.ndarray) -> int or None:
+        """
+        Find visible tile containing point in view plane
+        :param point: position in view coordinates
+        :return: index of tile in flattened grid or None if no tile contains point
+        """
+
+        axes = [self.coordinate_plane.index(axis) for axis in self.view_plane]
+        sizes = self.tile_grid.tileSizes()
+        if len(sizes) != self.tile_spatial_index().n:
+            return None  # tile grid hasn't been synced with grid yet
+        index = self.tile_plane_spatial_index()
+        candidates = points_in_box(index, point[axes] - sizes[:, axes].max(axis=0), point[axes])
+        inside = np.all(index.data[candidates] + sizes[candidates][:, axes] >= point[axes], axis=1)
+        inside &= self.tile_grid.tileVisibility()[candidates]
+        return int(candidates[inside][0]) if inside.any() else None
+
+    def image_at(self, point: np.ndarray) -> int or None:
+        """
+        Find fov image containing point. Images are only shown in the plane of the tiling dimensions
+        :param point: position in view coordinates
+        :return: handle of most recent image containing point or None if no image contains point
+        """
+
+        high = np.array(point[:2], dtype=float)
+        hits = points_in_box(self.image_spatial_index(), high - self.fov_dimensions[:2], high)
+        return max(self.image_handles[i] for i in hits) if len(hits) else None
+
+    def mousePressEvent(self, event) -> None:
+        """Override mouseMoveEvent so user can't change view
+        and allow user to move fov easier
+        :param event: QMouseEvent of users mouse"""
+
+        point = self.view_point(event.x(), event.y())
+        if event.button() == Qt.LeftButton:
+            # fov is centered on clicked position
+            move_to = point.copy()
+            for axis in self.view_plane:
+                index = self.coordinate_plane.index(axis)
+                move_to[index] -= 0.5 * self.fov_dimensions[index]
+            move_to = list(move_to * self.polarity)
+            return_value, checkbox = self.move_fov_query(move_to)
+
+            if return_value == QMessageBox.Ok:
+                if not checkbox:  # Move to exact location
+                    pos = move_to
+                else:  # move to the nearest tile
+                    index = self.tile_spatial_index().query(np.asarray(move_to) * self.polarity)[1]
+                    tile = self.grid_coords.reshape([-1, 3])[index]
+                    pos = [tile[0], tile[1], tile[2]]
+                self.fovMove.emit(pos)
+
+            else:
+                return
+
+        elif event.button() == Qt.RightButton:
+            if self.view_plane != (self.coordinate_plane[0], self.coordinate_plane[1]):
+                return  # images are hidden in other view planes
+            handle = self.image_at(point)
+            if handle is not None:
+                coords = list(self.fov_mosaic.get(handle).position)
+                if self.delete_fov_image_query(coords) == QMessageBox.Ok:
+                    self.remove_fov_image(handle)
+
+    def mouseMoveEvent(self, event):
+        """Override mouseMoveEvent so user can't change view and highlight tile under mouse"""
+
+        self.hover_tile(self.tile_at(self.view_point(event.x(), event.y())))
+
+    def leaveEvent(self, event):
+        """Remove highlight when mouse leaves widget"""
+
+        self.hover_tile(None)
+        super().leaveEvent(event)
+
+    def wheelEvent(self, event):
+        """Override wheelEvent so user can't change view"""
+        pass
+
+    def keyPressEvent(self, event):
+        """Override keyPressEvent so user can't change view"""
+        pass
+
+    def keyReleaseEvent(self, event):
+        """Override keyPressEvent so user can't change view"""
+        pass
+
+    def closeEvent(self, event):
+        """Override closeEvent to delete snapshot files spilled to disk"""
+        self.clear_fov_images()
+        super().closeEvent(event)
@@ -604,7 +604,7 @@ class VolumePlanWidget(QMainWindow):
         """
         if type(value) is not list and len(value) != 2:
             raise ValueError
-        self.fov_dimensions = value
+        self._fov_dimensions = value
         self._on_change()
 
     @property
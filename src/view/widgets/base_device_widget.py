@@ -15,14 +15,19 @@ from qtpy.QtWidgets import (
 )
 from inspect import currentframe
 from importlib import import_module
+import contextlib
 import enum
+import functools
+import json
 import types
+import typing
 import re
 import logging
 import inflection
 from view.widgets.miscellaneous_widgets.q_scrollable_line_edit import QScrollableLineEdit
 from view.widgets.miscellaneous_widgets.q_scrollable_float_slider import QScrollableFloatSlider
 import inspect
+import sys
 from schema import Schema, SchemaError
 from typing import Literal
 
@@ -46,6 +51,7 @@ class BaseDeviceWidget(QMainWindow):
             if hasattr(self.device_type, "__module__")
             else types.SimpleNamespace()
         )  # dummy driver if object is dictionary
+        self.path_registry = PathRegistry(self.__dict__)  # compiled accessors for nested property names
         self.create_property_widgets(properties, "property")
 
         widget = create_widget("V", **self.property_widgets)
@@ -129,6 +135,18 @@ class BaseDeviceWidget(QMainWindow):
         property to inform input widget type and values
         :param name: name of property to search for"""
 
+        module_name = getattr(self.device_driver, "__name__", None)
+        if module_name is None:  # dummy driver
+            return self._search_driver_variables(name)
+        key = f"{module_name}:{name}"
+        if key not in _driver_options:
+            _driver_options[key] = self._search_driver_variables(name)
+        return _driver_options[key]
+
+    def _search_driver_variables(self, name: str):
+        """Search variables of device driver for options of property
+        :param name: name of property to search for"""
+
         driver_vars = self.device_driver.__dict__
         for variable in driver_vars:
             search_name = inflection.pluralize(name.replace(".", "_"))
@@ -167,15 +185,12 @@ class BaseDeviceWidget(QMainWindow):
         :return:
         """
 
-        name_lst = name.split(".")
-        parent_attr = pathGet(self.__dict__, name_lst[0:-1])
-        value = getattr(self, name + "_widget").text()
+        accessor = self.path_registry.accessor(name)
         value_type = type(getattr(self, name + "_schema").schema())
-        if dict in type(parent_attr).__mro__:  # name is a dictionary
-            parent_attr[name_lst[-1]] = value_type(value)
-        elif list in type(parent_attr).__mro__:
-            parent_attr[int(name_lst[-1])] = value_type(value)
-        setattr(self, name, value_type(value))
+        value = type_coercer(value_type)(getattr(self, name + "_widget").text())
+        if isinstance(accessor.parent, (dict, list)):  # name is in a dictionary or list
+            accessor.set(value)
+        setattr(self, name, value)
         self.ValueChangedInside.emit(name)
 
     def create_check_box(self, name, value: bool) -> QCheckBox:
@@ -197,12 +212,9 @@ class BaseDeviceWidget(QMainWindow):
         :return:
         """
 
-        name_lst = name.split(".")
-        parent_attr = pathGet(self.__dict__, name_lst[0:-1])
-        if dict in type(parent_attr).__mro__:  # name is a dictionary
-            parent_attr[name_lst[-1]] = state
-        elif list in type(parent_attr).__mro__:
-            parent_attr[int(name_lst[-1])] = state
+        accessor = self.path_registry.accessor(name)
+        if isinstance(accessor.parent, (dict, list)):  # name is in a dictionary or list
+            accessor.set(state)
         setattr(self, name, state)
         self.ValueChangedInside.emit(name)
 
@@ -227,17 +239,11 @@ class BaseDeviceWidget(QMainWindow):
         :return:
         """
 
-        name_lst = name.split(".")
-
-        parent_attr = pathGet(self.__dict__, name_lst[0:-1])
-        value_type = type(getattr(self, name + "_schema").schema())
-
-        if dict in type(parent_attr).__mro__:  # name is a dict
-            parent_attr[str(name_lst[-1])] = value_type(value)
-        elif list in type(parent_attr).__mro__:  # name is a list
-
-            parent_attr[int(name_lst[-1])] = value_type(value)
-        setattr(self, name, value_type(value))
+        accessor = self.path_registry.accessor(name)
+        value = type_coercer(type(getattr(self, name + "_schema").schema()))(value)
+        if isinstance(accessor.parent, (dict, list)):  # name is in a dictionary or list
+            accessor.set(value)
+        setattr(self, name, value)
         self.ValueChangedInside.emit(name)
 
     @Slot(str)
@@ -404,23 +410,245 @@ def pathGet(iterable: dict or list, path: list):
     return iterable
 
 
+class PathAccessor:
+    """Direct accessor to the value at a nested path holding onto the parent container and key"""
+
+    __slots__ = ("root_key", "root", "parent", "key")
+
+    def __init__(self, root_key, root, parent, key):
+        """
+        :param root_key: top level key of path
+        :param root: top level object the path was resolved from. Used to check if accessor is still valid
+        :param parent: container holding the value
+        :param key: key or index of value in parent
+        """
+        self.root_key = root_key
+        self.root = root
+        self.parent = parent
+        self.key = key
+
+    def get(self):
+        """Value at path"""
+        return self.parent[self.key]
+
+    def set(self, value) -> None:
+        """Set value at path
+        :param value: new value"""
+        self.parent[self.key] = value
+
+
+class PathRegistry:
+    """Registry compiling nested paths like 'tasks.ao_task.ports' into PathAccessors once. Accessors are recompiled
+    when the top level object of the path has been replaced in the container"""
+
+    def __init__(self, container: dict):
+        """
+        :param container: dictionary paths are resolved from
+        """
+        self.container = container
+        self._accessors = {}
+
+    def accessor(self, path: str or tuple) -> PathAccessor:
+        """
+        Return accessor for path, compiling it if not done already or if top level object has been replaced
+        :param path: dotted string or tuple of keys
+        :return: accessor of path
+        """
+
+        accessor = self._accessors.get(path, None)
+        if accessor is not None and (
+            accessor.root is self.container or self.container.get(accessor.root_key, None) is accessor.root
+        ):
+            return accessor
+
+        keys = path.split(".") if isinstance(path, str) else list(path)
+        parent = pathGet(self.container, keys[:-1])
+        key = int(keys[-1]) if isinstance(parent, list) else keys[-1]
+        root = self.container[keys[0]] if len(keys) > 1 else self.container
+        accessor = PathAccessor(keys[0], root, parent, key)
+        self._accessors[path] = accessor
+        return accessor
+
+    def invalidate(self, root_key: str = None) -> None:
+        """
+        Drop compiled accessors. Needed if a container within a path is replaced below the top level
+        :param root_key: top level key of paths to drop. If None, all accessors are dropped
+        """
+
+        if root_key is None:
+            self._accessors.clear()
+        else:
+            for path in [p for p, a in self._accessors.items() if a.root_key == root_key]:
+                del self._accessors[path]
+
+
+# properties read ahead of widget construction, keyed by id of device. Set with property_snapshot
+_property_snapshots = {}
+
+
+@contextlib.contextmanager
+def property_snapshot(snapshot: dict):
+    """Context manager within which scan_for_properties returns prefetched values instead of reading devices
+    :param snapshot: dictionary mapping id of device to dictionary of its properties
+    """
+
+    _property_snapshots.update(snapshot)
+    try:
+        yield
+    finally:
+        for key in snapshot:
+            _property_snapshots.pop(key, None)
+
+
 def scan_for_properties(device):
     """Scan for properties with setters and getters in class and return dictionary
     :param device: object to scan through for properties
     """
 
+    if id(device) in _property_snapshots:
+        return dict(_property_snapshots[id(device)])  # copy since widgets modify their properties
+
     prop_dict = {}
-    for attr_name in dir(device):
+    for attr_name in property_names(type(device)):
         try:
-            attr = getattr(type(device), attr_name, None)
-            if isinstance(attr, property) or isinstance(inspect.unwrap(attr), property):
-                prop_dict[attr_name] = getattr(device, attr_name, None)
+            prop_dict[attr_name] = getattr(device, attr_name, None)
         except ValueError:  # Some attributes in processes raise ValueError if not started
             pass
 
     return prop_dict
 
 
+# introspection results that can be persisted between launches with export_introspection and load_introspection
+_property_names = {}  # class to list of property names
+_loaded_property_names = {}  # qualified class name to list of property names loaded from a previous launch
+_driver_options = {}  # module name and property name joined by : to options found in driver
+
+
+def qualified_name(cls: type) -> str:
+    """Name of class including module
+    :param cls: class
+    :return: qualified name"""
+
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def property_names(device_type: type) -> list[str]:
+    """Names of properties of a class. Class is only introspected once
+    :param device_type: class to find properties of
+    :return: list of property names"""
+
+    if device_type not in _property_names:
+        if qualified_name(device_type) in _loaded_property_names:
+            _property_names[device_type] = _loaded_property_names[qualified_name(device_type)]
+        else:
+            names = []
+            for attr_name in dir(device_type):
+                try:
+                    attr = getattr(device_type, attr_name, None)
+                    if isinstance(attr, property) or isinstance(inspect.unwrap(attr), property):
+                        names.append(attr_name)
+                except ValueError:
+                    pass
+            _property_names[device_type] = names
+    return _property_names[device_type]
+
+
+def export_introspection() -> dict:
+    """Introspection results that can be serialized to json
+    :return: dictionary of property names of classes and options found in drivers"""
+
+    def serializable(value) -> bool:
+        try:
+            return json.loads(json.dumps(value)) == value
+        except (TypeError, ValueError):
+            return False
+
+    return {
+        "property_names": {
+            **_loaded_property_names,
+            **{qualified_name(cls): names for cls, names in _property_names.items()},
+        },
+        "driver_options": {key: value for key, value in _driver_options.items() if serializable(value)},
+    }
+
+
+def load_introspection(introspection: dict) -> None:
+    """Load introspection results of previous launch from export_introspection
+    :param introspection: dictionary of property names of classes and options found in drivers"""
+
+    _loaded_property_names.update(introspection.get("property_names", {}))
+    for key, value in introspection.get("driver_options", {}).items():
+        _driver_options.setdefault(key, value)
+
+
+@functools.lru_cache(maxsize=None)
+def setter_input_type(owner: type, name: str):
+    """Find annotated input type of a property setter. Cached so introspection happens once per descriptor
+    :param owner: class the property belongs to
+    :param name: name of property
+    :return: annotated type of setter input or None if setter isn't annotated"""
+
+    descriptor = getattr(owner, name)
+    fset = getattr(inspect.unwrap(descriptor), "fset", None)
+    if fset is None:
+        raise TypeError(f"{name} of {owner} does not have a setter")
+    input_type = list(inspect.signature(fset).parameters.values())[-1].annotation
+    if isinstance(input_type, str):  # postponed annotations
+        try:
+            input_type = typing.get_type_hints(fset).get(list(inspect.signature(fset).parameters)[-1], None)
+        except (NameError, TypeError):
+            input_type = None
+    if input_type == inspect.Parameter.empty or not isinstance(input_type, type):  # typing constructs aren't callable
+        return None
+    return input_type
+
+
+@functools.lru_cache(maxsize=None)
+def type_coercer(input_type: type = None):
+    """Create function to convert a value to input_type. Yaml (ruamel) and numpy scalars are converted to builtin
+    types and enums can be built from their name or value
+    :param input_type: type to convert to. If None, value is only converted to builtin types
+    :return: function that takes in a value and returns converted value"""
+
+    def builtin(value):
+        if type(value) in (bool, int, float, str):
+            return value
+        numpy = sys.modules.get("numpy")  # numpy values can only exist if numpy has been imported
+        if numpy is not None and isinstance(value, numpy.generic):  # scalars only, arrays are passed on as is
+            return value.item()
+        for base in (int, float, str):  # ruamel scalars subclass builtin types
+            if isinstance(value, base):
+                return base(value)
+        return value
+
+    if input_type is None:
+        return builtin
+    elif issubclass(input_type, enum.Enum):
+
+        def to_enum(value):
+            if isinstance(value, input_type):
+                return value
+            value = builtin(value)
+            try:
+                return input_type[value]
+            except KeyError:
+                return input_type(value)
+
+        return to_enum
+    elif input_type is bool:
+        return lambda value: value.lower() in ["true", "1", "yes"] if isinstance(value, str) else bool(builtin(value))
+    return lambda value: input_type(builtin(value))
+
+
+def setter_coercer(owner: type, name: str):
+    """Function converting values to the annotated input type of a property setter
+    :param owner: class the property belongs to
+    :param name: name of property
+    :return: function that takes in a value and returns converted value"""
+
+    return type_coercer(setter_input_type(owner, name))
+
+
 def disable_button(button, pause=1000):
     """Function to disable button clicks for a period of time to avoid crashing gui"""
 
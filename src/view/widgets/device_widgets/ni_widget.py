@@ -146,15 +146,13 @@ class NIWidget(BaseDeviceWidget):
         :param value: new value to update
         :param name: name of parameter """
 
-        name_lst = name.split('.')
         if hasattr(self, f'{name}_slider'):  # value is included in exposed branches
             textbox = getattr(self, f'{name}_widget')
             slider = getattr(self, f'{name}_slider')
             value = round(value, 0) if 'time' in name else round(value, 3)
             textbox.setText(str(value))
             slider.setValue(value)
-        dictionary = pathGet(self.__dict__, name_lst[0:-1])
-        dictionary.__setitem__(name_lst[-1], value)
+        self.path_registry.accessor(name).set(value)
         setattr(self, name, value)
         self.ValueChangedInside.emit(name)
 
@@ -234,8 +232,7 @@ class NIWidget(BaseDeviceWidget):
 
             slider.sliderMoved.connect(lambda value: textbox.setText(str(value)))
             slider.sliderMoved.connect(lambda value: setattr(self, name, float(value)))
-            slider.sliderMoved.connect(lambda value:
-                                       pathGet(self.__dict__, path[0:-1]).__setitem__(path[-1], value))
+            slider.sliderMoved.connect(lambda value: self.path_registry.accessor(name).set(value))
             slider.sliderMoved.connect(lambda: self.ValueChangedInside.emit(name))
             slider.sliderMoved.connect(lambda: self.update_waveform(name))
         setattr(self, f'{name}_slider', slider)
@@ -340,7 +337,7 @@ class NIWidget(BaseDeviceWidget):
         slider.setValue(float(value))
         self.ValueChangedInside.emit(name)
         setattr(self, name, value)
-        pathGet(self.__dict__, name_lst[0:-1]).__setitem__(name_lst[-1], value)
+        self.path_registry.accessor(name).set(value)
         self.update_waveform(name)
 
     def textbox_fixup(self, value: float or str, name: str) -> None:
@@ -1,8 +1,11 @@
 from pyqtgraph.opengl import GLLinePlotItem
-from OpenGL.GL import *  # noqa
 import numpy as np
 from qtpy.QtGui import QColor
 
+# arrowhead outline as offsets across and along the last segment, scaled by arrow size
+ARROW_ACROSS = np.array([-1, 1, 0, -1])
+ARROW_ALONG = np.array([0, 0, 1, 0])
+
 
 class GLPathItem(GLLinePlotItem):
     """ Subclass of GLLinePlotItem that creates arrow at end of path"""
@@ -17,91 +20,66 @@ class GLPathItem(GLLinePlotItem):
         self.path_end_color = kwds.get('path_end_color', 'green')
         self.width = kwds.get('width', 1)
 
+    @property
+    def path_start_color(self) -> str:
+        """Color at start of path"""
+        return self._path_start_color
+
+    @path_start_color.setter
+    def path_start_color(self, color: str) -> None:
+        self._path_start_color = color
+        self._start_rgbf = np.array(QColor(color).getRgbF())
+
+    @property
+    def path_end_color(self) -> str:
+        """Color at end of path and of arrow"""
+        return self._path_end_color
+
+    @path_end_color.setter
+    def path_end_color(self, color: str) -> None:
+        self._path_end_color = color
+        self._end_rgbf = np.array(QColor(color).getRgbF())
+
+    def arrow(self, path: np.ndarray) -> np.ndarray:
+        """
+        Outline of arrowhead at end of path pointing along last segment. Segments along y take precedence over x
+        :param path: positions of path, shape (points, 3)
+        :return: positions of arrowhead outline, shape (4, 3)
+        """
+
+        vector = path[-1] - path[-2]
+        axis = 1 if vector[1] != 0 else 0  # axis arrow points along
+        sign = -1 if vector[axis] < 0 else 1
+        arrow_size = abs(vector[axis]) * self.arrow_size_percent / 100
+        offsets = np.zeros((4, 3))
+        offsets[:, 1 - axis] = ARROW_ACROSS * sign * arrow_size
+        offsets[:, axis] = ARROW_ALONG * sign * arrow_size * self.arrow_aspect_ratio
+        return path[-1] + offsets
+
+    def gradient(self, num_tiles: int) -> np.ndarray:
+        """
+        Colors blending linearly from start to end color
+        :param num_tiles: number of positions in path
+        :return: rgbF color of each position, shape (num_tiles, 4)
+        """
+
+        weights = (np.arange(num_tiles) / max(num_tiles, 1))[:, np.newaxis]
+        return (1 - weights) * self._start_rgbf + weights * self._end_rgbf
+
     def setData(self, **kwds):
         """Rewrite to draw arrow at end of path"""
 
         kwds['width'] = self.width
 
         if 'pos' in kwds.keys():
-            path = kwds['pos']
-            # draw the end arrow
-            # determine last line segment direction and draw arrowhead correctly
+            path = np.asarray(kwds['pos'], dtype=float).reshape(-1, 3)
+            path_gradient = self.gradient(len(path))
+            # draw the end arrow in color of last position
             if len(path) > 1:
-                vector = path[-1] - path[-2]
-                if vector[1] > 0:
-                    # calculate arrow size based on vector
-                    arrow_size = abs(vector[1])*self.arrow_size_percent / 100
-                    x = np.array([path[-1, 0] - arrow_size,
-                                  path[-1, 0] + arrow_size,
-                                  path[-1, 0],
-                                  path[-1, 0] - arrow_size])
-                    y = np.array([path[-1, 1],
-                                  path[-1, 1],
-                                  path[-1, 1] + arrow_size * self.arrow_aspect_ratio,
-                                  path[-1, 1]])
-                    z = np.array([path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2]])
-                elif vector[1] < 0:
-                    # calculate arrow size based on vector
-                    arrow_size = abs(vector[1])*self.arrow_size_percent / 100
-                    x = np.array([path[-1, 0] + arrow_size,
-                                  path[-1, 0] - arrow_size,
-                                  path[-1, 0],
-                                  path[-1, 0] + arrow_size])
-                    y = np.array([path[-1, 1],
-                                  path[-1, 1],
-                                  path[-1, 1] - arrow_size * self.arrow_aspect_ratio,
-                                  path[-1, 1]])
-                    z = np.array([path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2]])
-                elif vector[0] < 0:
-                    # calculate arrow size based on vector
-                    arrow_size = abs(vector[0])*self.arrow_size_percent / 100
-                    x = np.array([path[-1, 0],
-                                  path[-1, 0],
-                                  path[-1, 0] - arrow_size * self.arrow_aspect_ratio,
-                                  path[-1, 0]])
-                    y = np.array([path[-1, 1] + arrow_size,
-                                  path[-1, 1] - arrow_size,
-                                  path[-1, 1],
-                                  path[-1, 1] + arrow_size])
-                    z = np.array([path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2]])
-                else:
-                    # calculate arrow size based on vector
-                    arrow_size = abs(vector[0])*self.arrow_size_percent / 100
-                    x = np.array([path[-1, 0],
-                                  path[-1, 0],
-                                  path[-1, 0] + arrow_size * self.arrow_aspect_ratio,
-                                  path[-1, 0]])
-                    y = np.array([path[-1, 1] - arrow_size,
-                                  path[-1, 1] + arrow_size,
-                                  path[-1, 1],
-                                  path[-1, 1] - arrow_size])
-                    z = np.array([path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2],
-                                  path[-1, 2]])
-                xyz = np.transpose(np.array([x, y, z]))
-                kwds['pos'] = np.concatenate((path, xyz), axis=0)
-
-            num_tiles = len(path)
-            path_gradient = np.zeros((num_tiles, 4))
-            # create gradient rgba for each position
-            for tile in range(0, num_tiles):
-                # fill in (rgb)a first with linear weighted average
-                start = QColor(self.path_start_color).getRgbF()
-                end = QColor(self.path_end_color).getRgbF()
-                path_gradient[tile, :] = \
-                    (num_tiles - tile) / num_tiles * np.array(start) + \
-                    (tile / num_tiles) * np.array(end)
-            colors = np.repeat([path_gradient[-1, :]], repeats=4, axis=0)
-            kwds['color'] = np.concatenate((path_gradient, colors), axis=0)
+                path = np.concatenate((path, self.arrow(path)), axis=0)
+                path_gradient = np.concatenate((path_gradient, np.repeat(path_gradient[-1:], 4, axis=0)), axis=0)
+            # float32 buffers are handed to line item without copying
+            kwds['pos'] = path.astype(np.float32)
+            kwds['color'] = path_gradient.astype(np.float32)
 
         super().setData(**kwds)
@@ -1,7 +1,20 @@
-from pyqtgraph.opengl import GLMeshItem
+from pyqtgraph.opengl import GLMeshItem, GLLinePlotItem
 import numpy as np
 from qtpy.QtGui import QColor
-from OpenGL.GL import *  # noqa
+
+# corners of unit cube where index is 4*x + 2*y + z
+CUBE_VERTEXES = np.mgrid[0:2, 0:2, 0:2].reshape(3, 8).transpose()
+CUBE_FACES = np.array([
+    [0, 1, 2], [3, 2, 1],
+    [4, 5, 6], [7, 6, 5],
+    [0, 1, 4], [5, 4, 1],
+    [2, 3, 6], [7, 6, 3],
+    [0, 2, 4], [6, 4, 2],
+    [1, 3, 5], [7, 5, 3]])
+CUBE_EDGES = np.array([
+    [0, 4], [1, 5], [2, 6], [3, 7],  # along x
+    [0, 2], [1, 3], [4, 6], [5, 7],  # along y
+    [0, 1], [2, 3], [4, 5], [6, 7]])  # along z
 
 
 class GLShadedBoxItem(GLMeshItem):
@@ -24,37 +37,36 @@ class GLShadedBoxItem(GLMeshItem):
         self._width = width
         self._opacity = opacity
         self._color = color
-        colors = np.array([self._convert_color(color) for i in range(12)])
-
         self._pos = pos
-        self._vertexes, self._faces = self._create_box(pos, size)
+        colors = np.array([self._convert_color(color) for i in range(12 * int(np.prod(pos.shape[:-1])))])
+
+        self._vertexes, self._faces, self._edges = self._create_box(pos, size)
 
         super().__init__(vertexes=self._vertexes, faces=self._faces, faceColors=colors,
                          drawEdges=True, edgeColor=(0, 0, 0, 1), *args, **kwargs)
 
-    def _create_box(self, pos: np.ndarray, size: np.ndarray) -> (np.ndarray, np.ndarray):
+        # outline is drawn from a buffer by a child line item so it moves and hides with the box
+        self.outline = GLLinePlotItem(parentItem=self, mode='lines', pos=self._edges, width=width,
+                                      color=self._convert_color(color), antialias=False,
+                                      glOptions=kwargs.get('glOptions', 'additive'))
+
+    def _create_box(self, pos: np.ndarray, size: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray):
         """
-        Convenience method create the vertexes and faces of box to draw
-        :param pos: position of upper right corner of box
-        :param size: x,y,z size of box
-        :return:
+        Convenience method create the vertexes, faces and outline of boxes to draw
+        :param pos: position of lower corner of each box, shape (..., 3)
+        :param size: x,y,z size of boxes, shape (3,) or same shape as pos
+        :return: vertexes, faces and pairs of outline vertexes of all boxes
         """
 
-        nCubes = np.prod(pos.shape[:-1])
-        cubeVerts = np.mgrid[0:2, 0:2, 0:2].reshape(3, 8).transpose().reshape(1, 8, 3)
-        cubeFaces = np.array([
-            [0, 1, 2], [3, 2, 1],
-            [4, 5, 6], [7, 6, 5],
-            [0, 1, 4], [5, 4, 1],
-            [2, 3, 6], [7, 6, 3],
-            [0, 2, 4], [6, 4, 2],
-            [1, 3, 5], [7, 5, 3]]).reshape(1, 12, 3)
-        size = size.reshape((nCubes, 1, 3))
+        nCubes = int(np.prod(pos.shape[:-1]))
+        size = np.broadcast_to(np.asarray(size, dtype=float).reshape(-1, 3), (nCubes, 3)).reshape((nCubes, 1, 3))
         pos = pos.reshape((nCubes, 1, 3))
-        vertexes = (cubeVerts * size + pos)[0]
-        faces = (cubeFaces + (np.arange(nCubes) * 8).reshape(nCubes, 1, 1))[0]
+        corners = CUBE_VERTEXES[np.newaxis] * size + pos
+        vertexes = corners.reshape(-1, 3)
+        faces = (CUBE_FACES[np.newaxis] + (np.arange(nCubes) * 8).reshape(nCubes, 1, 1)).reshape(-1, 3)
+        edges = corners[:, CUBE_EDGES.reshape(-1)].reshape(-1, 3)
 
-        return vertexes, faces
+        return vertexes, faces, edges
 
     def color(self) -> str or list[float, float, float, float]:
         """Color of box and outline"""
@@ -62,8 +74,9 @@ class GLShadedBoxItem(GLMeshItem):
 
     def setColor(self, color: str or list[float, float, float, float]) -> None:
         self._color = color
-        colors = np.array([self._convert_color(self._color) for i in range(12)])
+        colors = np.array([self._convert_color(self._color) for i in range(len(self._faces))])
         self.setMeshData(vertexes=self._vertexes, faces=self._faces, faceColors=colors)
+        self.outline.setData(color=self._convert_color(self._color))
 
     def _convert_color(self, color: str) -> list[float, float, float, float]:
         """
@@ -88,52 +101,9 @@ class GLShadedBoxItem(GLMeshItem):
         """
 
         self._size = np.array([x, y, z])
-        self._vertexes, self._faces = self._create_box(self._pos, self._size)
-        colors = np.array([self._convert_color(self._color) for i in range(12)])
+        self._vertexes, self._faces, self._edges = self._create_box(self._pos, self._size)
+        colors = np.array([self._convert_color(self._color) for i in range(len(self._faces))])
         self.setMeshData(vertexes=self._vertexes,
                          faces=self._faces,
                          faceColors=colors)
-
-    def paint(self) -> None:
-        """Overwriting to include box outline"""
-
-        super().paint()
-
-        self.setupGLState()
-        glLineWidth(self._width)  # added line for thickness setting
-
-        glBegin(GL_LINES)
-
-        glColor4f(*self._convert_color(self._color))
-
-        x, y, z = [self._pos[0, 0, i] + x for i, x in enumerate(self.size())]
-        x_pos, y_pos, z_pos = self._pos[0, 0, :]
-
-        glVertex3f(x_pos, y_pos, z_pos)
-        glVertex3f(x_pos, y_pos, z)
-        glVertex3f(x, y_pos, z_pos)
-        glVertex3f(x, y_pos, z)
-        glVertex3f(x_pos, y, z_pos)
-        glVertex3f(x_pos, y, z)
-        glVertex3f(x, y, z_pos)
-        glVertex3f(x, y, z)
-
-        glVertex3f(x_pos, y_pos, z_pos)
-        glVertex3f(x_pos, y, z_pos)
-        glVertex3f(x, y_pos, z_pos)
-        glVertex3f(x, y, z_pos)
-        glVertex3f(x_pos, y_pos, z)
-        glVertex3f(x_pos, y, z)
-        glVertex3f(x, y_pos, z)
-        glVertex3f(x, y, z)
-
-        glVertex3f(x_pos, y_pos, z_pos)
-        glVertex3f(x, y_pos, z_pos)
-        glVertex3f(x_pos, y, z_pos)
-        glVertex3f(x, y, z_pos)
-        glVertex3f(x_pos, y_pos, z)
-        glVertex3f(x, y_pos, z)
-        glVertex3f(x_pos, y, z)
-        glVertex3f(x, y, z)
-
-        glEnd()
+        self.outline.setData(pos=self._edges)
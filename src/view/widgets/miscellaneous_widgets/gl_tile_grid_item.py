@@ -0,0 +1,171 @@
+from pyqtgraph.opengl import GLMeshItem, GLLinePlotItem
+import numpy as np
+from view.widgets.miscellaneous_widgets.gl_shaded_box_item import CUBE_VERTEXES, CUBE_FACES, CUBE_EDGES
+
+
+class GLTileGridItem(GLMeshItem):
+    """Subclass of GLMeshItem that draws a grid of boxes with outlines. Faces of all boxes share one mesh and outlines
+    share one line item so the whole grid is drawn in two calls no matter how many tiles it has. Color, opacity and
+    visibility of each tile are stored per vertex. Every tile owns a fixed slice of the buffers so single tiles can be
+    patched in place with updateTiles"""
+
+    def __init__(self, width: float = 1, *args, **kwargs):
+        """
+        :param width: width of tile outlines
+        """
+
+        # state of each tile
+        self._pos = np.zeros((0, 3))
+        self._size = np.zeros((0, 3))
+        self._colors = np.zeros((0, 4))
+        self._visible = np.zeros(0, dtype=bool)
+
+        # buffers handed to mesh and line items. 8 vertexes, 12 faces and 24 line ends per tile
+        self._vertexes = np.zeros((0, 3), dtype=np.float32)
+        self._vertex_colors = np.zeros((0, 4), dtype=np.float32)
+        self._faces = np.zeros((0, 3), dtype=np.uint32)
+        self._lines = np.zeros((0, 3), dtype=np.float32)
+        self._line_colors = np.zeros((0, 4), dtype=np.float32)
+
+        kwargs.setdefault('computeNormals', False)  # tiles are flat shaded
+        super().__init__(*args, **kwargs)
+
+        # outlines are a child so they move and hide with faces
+        self.outlines = GLLinePlotItem(parentItem=self, mode='lines', width=width, antialias=False,
+                                       glOptions=kwargs.get('glOptions', 'additive'))
+
+    def tileCount(self) -> int:
+        """Number of tiles in grid"""
+        return len(self._pos)
+
+    def setData(self, pos: np.ndarray, size: np.ndarray, colors: np.ndarray, visible: np.ndarray = None) -> None:
+        """
+        Set all tiles of grid, reallocating buffers
+        :param pos: position of lower corner of each tile, shape (tiles, 3)
+        :param size: size of each tile, shape (tiles, 3) or (3,) if all tiles are the same size
+        :param colors: rgbF color of each tile, shape (tiles, 4) or (4,) if all tiles are the same color
+        :param visible: visibility of each tile, shape (tiles,). Defaults to all visible
+        """
+
+        self._pos = np.array(pos, dtype=float).reshape(-1, 3)
+        tiles = len(self._pos)
+        self._size = np.array(np.broadcast_to(np.asarray(size, dtype=float), (tiles, 3)))
+        self._colors = np.array(np.broadcast_to(np.asarray(colors, dtype=float), (tiles, 4)))
+        visible = True if visible is None else np.asarray(visible, dtype=bool).reshape(-1)
+        self._visible = np.array(np.broadcast_to(visible, tiles))
+
+        self._vertexes = np.zeros((tiles * 8, 3), dtype=np.float32)
+        self._vertex_colors = np.zeros((tiles * 8, 4), dtype=np.float32)
+        offsets = (np.arange(tiles, dtype=np.uint32) * 8)[:, np.newaxis, np.newaxis]
+        self._faces = (CUBE_FACES[np.newaxis].astype(np.uint32) + offsets).reshape(-1, 3)
+        self._lines = np.zeros((tiles * 24, 3), dtype=np.float32)
+        self._line_colors = np.zeros((tiles * 24, 4), dtype=np.float32)
+
+        indices = np.arange(tiles)
+        self._write_geometry(indices)
+        self._write_colors(indices)
+        self.setMeshData(vertexes=self._vertexes, faces=self._faces, vertexColors=self._vertex_colors)
+        # keep arrays mesh data holds so they can be patched in place
+        meshdata = self.opts['meshdata']
+        self._vertexes, self._vertex_colors = meshdata.vertexes(), meshdata.vertexColors()
+        self._upload_lines()
+
+    def updateTiles(self, indices: np.ndarray, pos: np.ndarray = None, size: np.ndarray = None,
+                    colors: np.ndarray = None, visible: np.ndarray = None) -> None:
+        """
+        Patch some tiles in place. Only the slices of the buffers belonging to these tiles are rewritten
+        :param indices: indices of tiles to update
+        :param pos: new position of each tile in indices, shape (len(indices), 3)
+        :param size: new size of each tile in indices, shape (len(indices), 3)
+        :param colors: new rgbF color of each tile in indices, shape (len(indices), 4)
+        :param visible: new visibility of each tile in indices, shape (len(indices),)
+        """
+
+        indices = np.asarray(indices, dtype=int).reshape(-1)
+        if len(indices) == 0:
+            return
+        if pos is not None:
+            self._pos[indices] = pos
+        if size is not None:
+            self._size[indices] = size
+        if colors is not None:
+            self._colors[indices] = colors
+        if visible is not None:
+            self._visible[indices] = visible
+
+        if pos is not None or size is not None:
+            self._write_geometry(indices)
+        if colors is not None or visible is not None:
+            self._write_colors(indices)
+        self.meshDataChanged()
+        self._upload_lines()
+
+    def setColors(self, colors: np.ndarray, visible: np.ndarray = None) -> None:
+        """
+        Set color and visibility of all tiles without rebuilding geometry
+        :param colors: rgbF color of each tile, shape (tiles, 4) or (4,) if all tiles are the same color
+        :param visible: visibility of each tile, shape (tiles,). If None, visibility is unchanged
+        """
+
+        tiles = self.tileCount()
+        colors = np.broadcast_to(np.asarray(colors, dtype=float), (tiles, 4))
+        visible = None if visible is None else np.broadcast_to(np.asarray(visible, dtype=bool).reshape(-1), tiles)
+        self.updateTiles(np.arange(tiles), colors=colors, visible=visible)
+
+    def setTileVisibility(self, visible: np.ndarray) -> None:
+        """
+        Set visibility of all tiles without rebuilding geometry
+        :param visible: visibility of each tile, shape (tiles,)
+        """
+
+        tiles = self.tileCount()
+        self.updateTiles(np.arange(tiles), visible=np.broadcast_to(np.asarray(visible, dtype=bool).reshape(-1), tiles))
+
+    def tilePositions(self) -> np.ndarray:
+        """Position of lower corner of each tile"""
+        return self._pos
+
+    def tileSizes(self) -> np.ndarray:
+        """Size of each tile"""
+        return self._size
+
+    def tileColors(self) -> np.ndarray:
+        """rgbF color of each tile"""
+        return self._colors
+
+    def tileVisibility(self) -> np.ndarray:
+        """Visibility of each tile"""
+        return self._visible
+
+    def _write_geometry(self, indices: np.ndarray) -> None:
+        """
+        Write corners and outlines of tiles into buffers
+        :param indices: indices of tiles to write
+        """
+
+        corners = CUBE_VERTEXES[np.newaxis] * self._size[indices, np.newaxis] + self._pos[indices, np.newaxis]
+        self._vertexes[(indices[:, np.newaxis] * 8 + np.arange(8)).reshape(-1)] = corners.reshape(-1, 3)
+        self._lines[(indices[:, np.newaxis] * 24 + np.arange(24)).reshape(-1)] = \
+            corners[:, CUBE_EDGES.reshape(-1)].reshape(-1, 3)
+
+    def _write_colors(self, indices: np.ndarray) -> None:
+        """
+        Write colors of tiles into buffers. Hidden tiles are fully transparent
+        :param indices: indices of tiles to write
+        """
+
+        rgba = self._colors[indices].copy()
+        rgba[:, 3] *= self._visible[indices]
+        self._vertex_colors[(indices[:, np.newaxis] * 8 + np.arange(8)).reshape(-1)] = np.repeat(rgba, 8, axis=0)
+        self._line_colors[(indices[:, np.newaxis] * 24 + np.arange(24)).reshape(-1)] = np.repeat(rgba, 24, axis=0)
+
+    def _upload_lines(self) -> None:
+        """Hand outline buffers to line item. Buffers are already float32 so they aren't copied"""
+
+        self.outlines.setData(pos=self._lines, color=self._line_colors)
+
+    def paint(self) -> None:
+        """Skip drawing empty grid"""
+
+        if len(self._faces) != 0:
+            super().paint()
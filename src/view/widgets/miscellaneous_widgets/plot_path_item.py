@@ -0,0 +1,147 @@
+from pyqtgraph import GraphicsObject
+import numpy as np
+from qtpy.QtCore import QRectF, QLineF, QPointF
+from qtpy.QtGui import QColor, QPainter, QPen, QPolygonF
+
+# arrowhead outline as offsets across and along the last segment, scaled by arrow size
+ARROW_ACROSS = np.array([-1, 1, 0, -1])
+ARROW_ALONG = np.array([0, 0, 1, 0])
+
+
+class PlotPathItem(GraphicsObject):
+    """2D counterpart of GLPathItem that draws path projected onto two axes with an arrow at its end. The color
+    gradient from start to end is split into bands so each band is drawn with one drawLines call"""
+
+    def __init__(self, axes: tuple[int, int] = (0, 1), bands: int = 32, **kwds):
+        """
+        :param axes: axes of path positions drawn along horizontal and vertical axis
+        :param bands: number of colors gradient is split into
+        """
+
+        super().__init__()
+
+        self.arrow_size_percent = kwds.get('arrow_size', 6.0)
+        self.arrow_aspect_ratio = kwds.get('arrow_aspect_ratio', 4)
+        self.path_start_color = kwds.get('path_start_color', 'magenta')
+        self.path_end_color = kwds.get('path_end_color', 'green')
+        self.width = kwds.get('width', 1)
+        self.bands = bands
+        self._axes = list(axes)
+
+        self.pos = np.zeros((0, 3))
+        self._batches = None  # pen and lines of each band, built on next paint after path changes
+        self._arrow = None  # outline of arrowhead
+        self._bounds = QRectF()
+
+    def setAxes(self, horizontal: int, vertical: int) -> None:
+        """
+        Set axes of path positions drawn along horizontal and vertical axis
+        :param horizontal: axis drawn horizontally
+        :param vertical: axis drawn vertically
+        """
+
+        self._axes = [horizontal, vertical]
+        self._changed()
+
+    def arrow(self, path: np.ndarray) -> np.ndarray:
+        """
+        Outline of arrowhead at end of path pointing along last segment. Segments along vertical axis take
+        precedence over horizontal axis
+        :param path: projected positions of path, shape (points, 2)
+        :return: positions of arrowhead outline, shape (4, 2)
+        """
+
+        vector = path[-1] - path[-2]
+        axis = 1 if vector[1] != 0 else 0  # axis arrow points along
+        sign = -1 if vector[axis] < 0 else 1
+        arrow_size = abs(vector[axis]) * self.arrow_size_percent / 100
+        offsets = np.zeros((4, 2))
+        offsets[:, 1 - axis] = ARROW_ACROSS * sign * arrow_size
+        offsets[:, axis] = ARROW_ALONG * sign * arrow_size * self.arrow_aspect_ratio
+        return path[-1] + offsets
+
+    def setData(self, pos: np.ndarray) -> None:
+        """
+        Set positions of path
+        :param pos: positions of path, shape (points, 3)
+        """
+
+        self.pos = np.asarray(pos, dtype=float).reshape(-1, 3)
+        self._changed()
+
+    def _changed(self) -> None:
+        """Drop lines and recompute bounds after path changed"""
+
+        self._batches = None
+        path = self.pos[:, self._axes]
+        # arrow points along last segment that isn't seen end on
+        moves = np.flatnonzero(np.any(path[1:] != path[:-1], axis=1)) if len(path) > 1 else []
+        self._arrow = self.arrow(path[: moves[-1] + 2]) if len(moves) else None
+        if self._arrow is not None:
+            path = np.concatenate((path, self._arrow))
+        self.prepareGeometryChange()
+        if len(path):
+            low, high = path.min(axis=0), path.max(axis=0)
+            self._bounds = QRectF(low[0], low[1], high[0] - low[0], high[1] - low[1])
+        else:
+            self._bounds = QRectF()
+        self.update()
+
+    def pen(self, color: str or QColor) -> QPen:
+        """
+        Pen drawing path in color
+        :param color: color of pen
+        :return: cosmetic pen with width of path
+        """
+
+        pen = QPen(QColor(color))
+        pen.setWidthF(self.width)
+        pen.setCosmetic(True)  # line width is in pixels
+        return pen
+
+    def _build_batches(self) -> list:
+        """
+        Group segments of path by band of gradient
+        :return: pen and lines of each band
+        """
+
+        path = self.pos[:, self._axes]
+        segments = len(path) - 1
+        if segments < 1:
+            return []
+        start, end = np.array(QColor(self.path_start_color).getRgbF()), np.array(QColor(self.path_end_color).getRgbF())
+        band = np.arange(segments) * self.bands // segments
+        drawn = np.any(path[1:] != path[:-1], axis=1)  # segments along viewing direction project onto a point
+        batches = []
+        for index in np.unique(band[drawn]):
+            weight = index / max(self.bands - 1, 1)
+            pen = self.pen(QColor.fromRgbF(*((1 - weight) * start + weight * end)))
+            lines = [QLineF(*path[i], *path[i + 1]) for i in np.flatnonzero(drawn & (band == index))]
+            batches.append((pen, lines))
+        return batches
+
+    def boundingRect(self) -> QRectF:
+        """Bounds of path and arrow padded by width of line"""
+
+        px, py = self.pixelVectors()
+        if px is None or self._bounds.isNull():
+            return self._bounds
+        pad_x, pad_y = px.length() * self.width, py.length() * self.width
+        return self._bounds.adjusted(-pad_x, -pad_y, pad_x, pad_y)
+
+    def viewTransformChanged(self) -> None:
+        """Padding of bounds depends on size of pixels"""
+
+        self.prepareGeometryChange()
+
+    def paint(self, painter: QPainter, *args) -> None:
+        """Draw segments of each band with one call and arrow in color of end of path"""
+
+        if self._batches is None:
+            self._batches = self._build_batches()
+        for pen, lines in self._batches:
+            painter.setPen(pen)
+            painter.drawLines(lines)
+        if self._arrow is not None:
+            painter.setPen(self.pen(self.path_end_color))
+            painter.drawPolyline(QPolygonF([QPointF(*point) for point in self._arrow]))
@@ -0,0 +1,204 @@
+from pyqtgraph import GraphicsObject
+import numpy as np
+from qtpy.QtCore import QRectF
+from qtpy.QtGui import QColor, QPainter, QPen, QBrush
+
+
+def convert_color(color: str or list[float, float, float, float],
+                  opacity: float = 1) -> list[float, float, float, float]:
+    """
+    Convert color to rgbF values
+    :param color: name of color or rgbF values
+    :param opacity: opacity applied to color names where 1 is fully opaque
+    :return: rgbF values
+    """
+
+    if isinstance(color, str):
+        rgbf = list(QColor(color).getRgbF())
+        color = rgbf[:3] + [opacity * rgbf[3]]
+    return list(color)
+
+
+class PlotTileGridItem(GraphicsObject):
+    """2D counterpart of GLTileGridItem that draws a grid of boxes projected onto two axes as filled rectangles with
+    outlines. Tiles sharing a color are drawn with one drawRects call and the rectangles are only rebuilt when tiles
+    change, so painting costs one call per color no matter how many tiles the grid has. Overlapping tiles are added
+    together like the additive tiles of the opengl grid"""
+
+    def __init__(self, width: float = 1, axes: tuple[int, int] = (0, 1)):
+        """
+        :param width: width of tile outlines in pixels
+        :param axes: axes of tile positions drawn along horizontal and vertical axis
+        """
+
+        super().__init__()
+        self.width = width
+        self._axes = list(axes)
+
+        # state of each tile
+        self._pos = np.zeros((0, 3))
+        self._size = np.zeros((0, 3))
+        self._colors = np.zeros((0, 4))
+        self._visible = np.zeros(0, dtype=bool)
+
+        self._batches = None  # pen, brush and rectangles of each color, built on next paint after tiles change
+        self._bounds = QRectF()
+
+    def tileCount(self) -> int:
+        """Number of tiles in grid"""
+        return len(self._pos)
+
+    def visible(self) -> bool:
+        """Whether grid is visible, named like visible of opengl items so either grid can be used"""
+        return self.isVisible()
+
+    def setAxes(self, horizontal: int, vertical: int) -> None:
+        """
+        Set axes of tile positions drawn along horizontal and vertical axis
+        :param horizontal: axis drawn horizontally
+        :param vertical: axis drawn vertically
+        """
+
+        self._axes = [horizontal, vertical]
+        self._changed()
+
+    def setData(self, pos: np.ndarray, size: np.ndarray, colors: np.ndarray, visible: np.ndarray = None) -> None:
+        """
+        Set all tiles of grid
+        :param pos: position of lower corner of each tile, shape (tiles, 3)
+        :param size: size of each tile, shape (tiles, 3) or (3,) if all tiles are the same size
+        :param colors: rgbF color of each tile, shape (tiles, 4) or (4,) if all tiles are the same color
+        :param visible: visibility of each tile, shape (tiles,). Defaults to all visible
+        """
+
+        self._pos = np.array(pos, dtype=float).reshape(-1, 3)
+        tiles = len(self._pos)
+        self._size = np.array(np.broadcast_to(np.asarray(size, dtype=float), (tiles, 3)))
+        self._colors = np.array(np.broadcast_to(np.asarray(colors, dtype=float), (tiles, 4)))
+        visible = True if visible is None else np.asarray(visible, dtype=bool).reshape(-1)
+        self._visible = np.array(np.broadcast_to(visible, tiles))
+        self._changed()
+
+    def updateTiles(self, indices: np.ndarray, pos: np.ndarray = None, size: np.ndarray = None,
+                    colors: np.ndarray = None, visible: np.ndarray = None) -> None:
+        """
+        Patch some tiles in place
+        :param indices: indices of tiles to update
+        :param pos: new position of each tile in indices, shape (len(indices), 3)
+        :param size: new size of each tile in indices, shape (len(indices), 3)
+        :param colors: new rgbF color of each tile in indices, shape (len(indices), 4)
+        :param visible: new visibility of each tile in indices, shape (len(indices),)
+        """
+
+        indices = np.asarray(indices, dtype=int).reshape(-1)
+        if len(indices) == 0:
+            return
+        if pos is not None:
+            self._pos[indices] = pos
+        if size is not None:
+            self._size[indices] = size
+        if colors is not None:
+            self._colors[indices] = colors
+        if visible is not None:
+            self._visible[indices] = visible
+        self._changed()
+
+    def setColors(self, colors: np.ndarray, visible: np.ndarray = None) -> None:
+        """
+        Set color and visibility of all tiles
+        :param colors: rgbF color of each tile, shape (tiles, 4) or (4,) if all tiles are the same color
+        :param visible: visibility of each tile, shape (tiles,). If None, visibility is unchanged
+        """
+
+        tiles = self.tileCount()
+        colors = np.broadcast_to(np.asarray(colors, dtype=float), (tiles, 4))
+        visible = None if visible is None else np.broadcast_to(np.asarray(visible, dtype=bool).reshape(-1), tiles)
+        self.updateTiles(np.arange(tiles), colors=colors, visible=visible)
+
+    def setTileVisibility(self, visible: np.ndarray) -> None:
+        """
+        Set visibility of all tiles
+        :param visible: visibility of each tile, shape (tiles,)
+        """
+
+        tiles = self.tileCount()
+        self.updateTiles(np.arange(tiles), visible=np.broadcast_to(np.asarray(visible, dtype=bool).reshape(-1), tiles))
+
+    def tilePositions(self) -> np.ndarray:
+        """Position of lower corner of each tile"""
+        return self._pos
+
+    def tileSizes(self) -> np.ndarray:
+        """Size of each tile"""
+        return self._size
+
+    def tileColors(self) -> np.ndarray:
+        """rgbF color of each tile"""
+        return self._colors
+
+    def tileVisibility(self) -> np.ndarray:
+        """Visibility of each tile"""
+        return self._visible
+
+    def _changed(self) -> None:
+        """Drop rectangles and recompute bounds of visible tiles after tiles changed"""
+
+        self._batches = None
+        shown = self._visible & (self._colors[:, 3] > 0)
+        self.prepareGeometryChange()
+        if shown.any():
+            low = self._pos[shown][:, self._axes].min(axis=0)
+            high = (self._pos[shown] + self._size[shown])[:, self._axes].max(axis=0)
+            self._bounds = QRectF(low[0], low[1], high[0] - low[0], high[1] - low[1])
+        else:
+            self._bounds = QRectF()
+        self.update()
+
+    def _build_batches(self) -> list:
+        """
+        Group rectangles of visible tiles by color
+        :return: pen, brush and rectangles of each color
+        """
+
+        shown = np.flatnonzero(self._visible & (self._colors[:, 3] > 0))
+        if len(shown) == 0:
+            return []
+        colors, color_index = np.unique(self._colors[shown], axis=0, return_inverse=True)
+        color_index = color_index.reshape(-1)
+        corners = self._pos[shown][:, self._axes]
+        extents = self._size[shown][:, self._axes]
+        batches = []
+        for index, rgbf in enumerate(colors):
+            color = QColor.fromRgbF(*np.clip(rgbf, 0, 1))
+            pen = QPen(color)
+            pen.setWidthF(self.width)
+            pen.setCosmetic(True)  # outline width is in pixels
+            members = color_index == index
+            rects = [QRectF(*corner, *extent) for corner, extent in zip(corners[members], extents[members])]
+            batches.append((pen, QBrush(color), rects))
+        return batches
+
+    def boundingRect(self) -> QRectF:
+        """Bounds of visible tiles padded by width of outlines"""
+
+        px, py = self.pixelVectors()
+        if px is None or self._bounds.isNull():
+            return self._bounds
+        pad_x, pad_y = px.length() * self.width, py.length() * self.width
+        return self._bounds.adjusted(-pad_x, -pad_y, pad_x, pad_y)
+
+    def viewTransformChanged(self) -> None:
+        """Padding of bounds depends on size of pixels"""
+
+        self.prepareGeometryChange()
+
+    def paint(self, painter: QPainter, *args) -> None:
+        """Draw rectangles of each color with one call"""
+
+        if self._batches is None:
+            self._batches = self._build_batches()
+        painter.setCompositionMode(QPainter.CompositionMode_Plus)
+        for pen, brush, rects in self._batches:
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.drawRects(rects)
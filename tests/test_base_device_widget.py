@@ -1,13 +1,27 @@
 """ testing BaseDeviceWidget """
 
 import unittest
-from view.widgets.base_device_widget import BaseDeviceWidget
+from view.widgets.base_device_widget import (
+    BaseDeviceWidget,
+    PathRegistry,
+    export_introspection,
+    load_introspection,
+    property_names,
+    property_snapshot,
+    scan_for_properties,
+    setter_input_type,
+    setter_coercer,
+    type_coercer,
+)
 from qtpy.QtTest import QTest, QSignalSpy
 from qtpy.QtWidgets import QApplication, QWidget
 from qtpy.QtCore import Qt
 import sys
 from view.widgets.miscellaneous_widgets.q_scrollable_line_edit import QScrollableLineEdit
 from qtpy.QtGui import QIntValidator, QDoubleValidator
+from ruamel.yaml.scalarfloat import ScalarFloat
+from enum import Enum
+import numpy as np
 
 app = QApplication(sys.argv)
 
@@ -188,6 +202,129 @@ class BaseDeviceWidgetTests(unittest.TestCase):
                                                   'directed_to': 'world'})
         self.assertTrue(getattr(widget, 'test_nest_dict.greeting_options.formal') == 'salutations')
 
+    def test_setter_coercion(self):
+        """Test that setter input types are found and values are converted to them"""
+
+        class Mode(Enum):
+            FAST = 'fast'
+            SLOW = 'slow'
+
+        class Device:
+            @property
+            def exposure_time_ms(self):
+                return 1.0
+
+            @exposure_time_ms.setter
+            def exposure_time_ms(self, value: float):
+                pass
+
+            @property
+            def mode(self):
+                return Mode.FAST
+
+            @mode.setter
+            def mode(self, value: Mode):
+                pass
+
+            @property
+            def name(self):
+                return 'device'
+
+            @name.setter
+            def name(self, value):
+                pass
+
+            @property
+            def constant(self):
+                return 0
+
+        self.assertEqual(setter_input_type(Device, 'exposure_time_ms'), float)
+        self.assertEqual(setter_input_type(Device, 'name'), None)
+        self.assertRaises(TypeError, setter_input_type, Device, 'constant')
+
+        coerced = setter_coercer(Device, 'exposure_time_ms')('2.5')
+        self.assertEqual(coerced, 2.5)
+        self.assertIs(type(coerced), float)
+        self.assertIs(setter_coercer(Device, 'mode')('SLOW'), Mode.SLOW)
+        self.assertIs(setter_coercer(Device, 'mode')('fast'), Mode.FAST)
+        self.assertIs(type(setter_coercer(Device, 'name')(ScalarFloat(1.5))), float)
+        self.assertIs(type(type_coercer(None)(np.int64(3))), int)
+        self.assertEqual(type_coercer(bool)('False'), False)
+        self.assertIs(type_coercer(None)(True), True)  # bools are ints but must stay bools
+        self.assertEqual(type_coercer(str)(True), 'True')
+        self.assertIs(type_coercer(None)(np.bool_(False)), False)
+        array = np.arange(3)
+        self.assertIs(type_coercer(None)(array), array)  # arrays aren't scalars so they aren't converted
+        self.assertIs(setter_coercer(Device, 'mode'), setter_coercer(Device, 'mode'))  # cached
+
+    def test_path_registry(self):
+        """Test that nested paths are compiled once and recompiled when the top level object is replaced"""
+
+        container = {'tasks': {'ao_task': {'ports': [{'volts': 1.0}, {'volts': 2.0}]}}}
+        registry = PathRegistry(container)
+
+        accessor = registry.accessor('tasks.ao_task.ports.1.volts')
+        self.assertEqual(accessor.get(), 2.0)
+        accessor.set(3.0)
+        self.assertEqual(container['tasks']['ao_task']['ports'][1]['volts'], 3.0)
+        self.assertIs(registry.accessor('tasks.ao_task.ports.1.volts'), accessor)  # compiled once
+
+        container['tasks'] = {'ao_task': {'ports': [{'volts': 0.0}, {'volts': 5.0}]}}  # replace dictionary
+        accessor = registry.accessor('tasks.ao_task.ports.1.volts')
+        self.assertEqual(accessor.get(), 5.0)
+
+        container['tasks']['ao_task'] = {'ports': [{'volts': 0.0}, {'volts': 7.0}]}  # replace below top level
+        registry.invalidate('tasks')
+        self.assertEqual(registry.accessor('tasks.ao_task.ports.1.volts').get(), 7.0)
+
+    def test_property_snapshot(self):
+        """Test that scan_for_properties returns prefetched values within property_snapshot"""
+
+        class Device:
+            reads = 0
+
+            @property
+            def power(self):
+                Device.reads += 1
+                return 10.0
+
+        device = Device()
+        snapshot = {id(device): scan_for_properties(device)}
+        self.assertEqual(Device.reads, 1)
+
+        with property_snapshot(snapshot):
+            properties = scan_for_properties(device)
+            properties['power'] = 0  # modifying returned properties shouldn't change snapshot
+            self.assertEqual(scan_for_properties(device), {'power': 10.0})
+        self.assertEqual(Device.reads, 1)
+
+        scan_for_properties(device)  # read device once snapshot is gone
+        self.assertEqual(Device.reads, 2)
+
+    def test_introspection_cache(self):
+        """Test that property names loaded from a previous launch are used instead of introspecting class"""
+
+        class CachedDevice:
+            @property
+            def power(self):
+                return 10.0
+
+            @property
+            def current(self):
+                return 1.0
+
+        self.assertEqual(property_names(CachedDevice), ['current', 'power'])
+        exported = export_introspection()
+        self.assertIn(['current', 'power'], exported['property_names'].values())
+
+        class Device:
+            @property
+            def power(self):
+                return 10.0
+
+        load_introspection({'property_names': {f'{Device.__module__}.{Device.__qualname__}': ['power', 'cached']}})
+        self.assertEqual(property_names(Device), ['power', 'cached'])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,89 @@
+""" testing CoalescingWriter """
+
+import threading
+import unittest
+from time import monotonic, sleep
+from view.coalescing_writer import CoalescingWriter
+
+
+class CoalescingWriterTests(unittest.TestCase):
+    """Tests for CoalescingWriter"""
+
+    def setUp(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def record(self, key, value):
+        self.release.wait()
+        self.calls.append((key, value, monotonic()))
+
+    def test_converges_to_last_value(self):
+        """Test that a burst of submissions only writes the first and last value"""
+
+        writer = CoalescingWriter(self.record, max_rate_hz=0)
+        self.release.clear()
+        writer.submit("daq", "daq", 0)
+        sleep(0.05)  # first call is now blocked in function
+        for value in range(1, 100):
+            writer.submit("daq", "daq", value)
+        self.release.set()
+        self.assertTrue(writer.wait(timeout=5))
+        writer.stop()
+
+        self.assertEqual([value for key, value, time in self.calls], [0, 99])
+
+    def test_rate_limit(self):
+        """Test that calls of a key are spaced by the interval"""
+
+        writer = CoalescingWriter(self.record, max_rate_hz=20)
+        for value in range(5):
+            writer.submit("daq", "daq", value)
+            self.assertTrue(writer.wait(timeout=5))
+        writer.stop()
+
+        times = [time for key, value, time in self.calls]
+        self.assertEqual(len(times), 5)
+        for earlier, later in zip(times, times[1:]):
+            self.assertGreaterEqual(later - earlier, writer.interval * 0.9)
+
+    def test_keys_coalesced_separately(self):
+        """Test that pending calls of different keys don't replace each other"""
+
+        writer = CoalescingWriter(self.record, max_rate_hz=0)
+        self.release.clear()
+        writer.submit("blocker", "blocker", None)
+        sleep(0.05)
+        for value in range(10):
+            writer.submit("daq 1", "daq 1", value)
+            writer.submit("daq 2", "daq 2", -value)
+        self.release.set()
+        self.assertTrue(writer.wait(timeout=5))
+        writer.stop()
+
+        last = {key: value for key, value, time in self.calls}
+        self.assertEqual(last["daq 1"], 9)
+        self.assertEqual(last["daq 2"], -9)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_exception_keeps_worker_alive(self):
+        """Test that a failing call doesn't stop later calls"""
+
+        def write(value):
+            if value == "bad":
+                raise RuntimeError("write failed")
+            self.calls.append(value)
+
+        writer = CoalescingWriter(write, max_rate_hz=0)
+        with self.assertLogs("view.coalescing_writer", level="ERROR"):
+            writer.submit("daq", "bad")
+            self.assertTrue(writer.wait(timeout=5))
+        writer.submit("daq", "good")
+        self.assertTrue(writer.wait(timeout=5))
+        writer.stop()
+
+        self.assertEqual(self.calls, ["good"])
+
+
+if __name__ == "__main__":
+    unittest.main()
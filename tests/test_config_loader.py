@@ -0,0 +1,63 @@
+""" testing load_config """
+
+import unittest
+import tempfile
+import os
+from pathlib import Path
+from unittest.mock import patch
+from ruamel.yaml.comments import CommentedMap
+from view import config_loader
+from view.config_loader import load_config
+
+CONFIG = """# instrument
+instrument:
+  devices:
+    488nm:
+      type: laser  # comment
+      settings:
+        power_setpoint_mw: 10.0
+"""
+
+
+class ConfigLoaderTests(unittest.TestCase):
+    """Tests for load_config"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        environment = patch.dict(os.environ, {"VIEW_CACHE_DIR": str(Path(self.directory.name) / "cache")})
+        environment.start()
+        self.addCleanup(environment.stop)
+        self.addCleanup(config_loader._loaded.clear)
+        self.path = Path(self.directory.name) / "instrument.yaml"
+        self.path.write_text(CONFIG)
+
+    def test_modes(self):
+        """Test that plain dictionaries are returned unless round trip is requested"""
+
+        plain = load_config(self.path)
+        self.assertIs(type(plain), dict)
+        self.assertEqual(plain["instrument"]["devices"]["488nm"]["settings"]["power_setpoint_mw"], 10.0)
+
+        round_trip = load_config(self.path, round_trip=True)
+        self.assertIsInstance(round_trip, CommentedMap)
+        self.assertEqual(round_trip, plain)
+
+    def test_cache(self):
+        """Test that cached configs are independent copies and are reparsed when file changes"""
+
+        first = load_config(self.path, round_trip=True)
+        first["instrument"]["devices"]["488nm"]["type"] = "camera"
+        self.assertEqual(load_config(self.path, round_trip=True)["instrument"]["devices"]["488nm"]["type"], "laser")
+
+        config_loader._loaded.clear()  # load from disk like a new launch
+        cached = load_config(self.path, round_trip=True)
+        self.assertEqual(cached["instrument"]["devices"]["488nm"].ca.items["type"][2].value, "# comment\n")
+
+        self.path.write_text(CONFIG.replace("10.0", "120.0"))
+        settings = load_config(self.path)["instrument"]["devices"]["488nm"]["settings"]
+        self.assertEqual(settings["power_setpoint_mw"], 120.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
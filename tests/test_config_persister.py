@@ -0,0 +1,112 @@
+""" testing ConfigPersister """
+
+import unittest
+import tempfile
+from pathlib import Path
+from time import sleep
+from ruamel.yaml import YAML
+from view.config_persister import ConfigPersister, write_yaml_atomic
+
+CONFIG = """# gui config
+instrument_view:
+  livestream_tasks:
+    daq:
+      tasks:
+        ao_task:
+          volts: 1.0  # amplitude
+acquisition_view:
+  unit: mm
+"""
+
+
+class ConfigPersisterTests(unittest.TestCase):
+    """Tests for ConfigPersister"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "gui_config.yaml"
+        self.path.write_text(CONFIG)
+        self.config = YAML().load(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_autosave(self):
+        """Test that changes are debounced into one atomic write that keeps comments"""
+
+        persister = ConfigPersister(self.path, self.config, autosave=True, debounce_s=0.2)
+        for volts in [2.0, 3.0, 4.0]:
+            self.config["instrument_view"]["livestream_tasks"]["daq"]["tasks"]["ao_task"]["volts"] = volts
+            persister.mark_dirty(("instrument_view", "livestream_tasks", "daq", "tasks", "ao_task", "volts"))
+        self.config["acquisition_view"]["unit"] = "um"  # unmarked changes aren't saved
+        sleep(0.6)
+        persister.stop()
+
+        saved = YAML().load(self.path)
+        self.assertEqual(saved["instrument_view"]["livestream_tasks"]["daq"]["tasks"]["ao_task"]["volts"], 4.0)
+        self.assertEqual(saved["acquisition_view"]["unit"], "mm")
+        self.assertIn("# amplitude", self.path.read_text())
+        self.assertFalse(persister.journal_path.exists())
+        self.assertEqual(sorted(p.name for p in Path(self.directory.name).iterdir()), ["gui_config.yaml"])
+
+    def test_recover(self):
+        """Test that journaled changes are recovered after a crash"""
+
+        persister = ConfigPersister(self.path, self.config, autosave=False)
+        self.config["acquisition_view"]["unit"] = "um"
+        persister.mark_dirty(("acquisition_view", "unit"))
+        persister.stop()  # crash before changes are saved
+
+        config = YAML().load(self.path)
+        self.assertEqual(config["acquisition_view"]["unit"], "mm")
+        persister = ConfigPersister(self.path, config, autosave=False)
+        self.assertEqual(persister.recovered, [("acquisition_view", "unit")])
+        self.assertEqual(config["acquisition_view"]["unit"], "um")
+
+        persister.flush()
+        persister.stop()
+        self.assertEqual(YAML().load(self.path)["acquisition_view"]["unit"], "um")
+        self.assertFalse(persister.journal_path.exists())
+
+    def test_plain_data_keeps_comments(self):
+        """Test that changes to config loaded as plain dictionaries are saved without dropping comments"""
+
+        config = YAML(typ="safe", pure=True).load(self.path)
+        persister = ConfigPersister(self.path, config, autosave=False)
+        config["acquisition_view"]["unit"] = "um"
+        persister.mark_dirty(("acquisition_view", "unit"))
+        persister.stop()
+        persister.flush()
+
+        self.assertEqual(YAML().load(self.path)["acquisition_view"]["unit"], "um")
+        self.assertIn("# amplitude", self.path.read_text())
+        self.assertIn("# gui config", self.path.read_text())
+
+    def test_journal_compacted(self):
+        """Test that journal keeps one entry per changed subtree however often it was edited"""
+
+        persister = ConfigPersister(self.path, self.config, autosave=False, journal_delay_s=0.01)
+        tasks = self.config["instrument_view"]["livestream_tasks"]["daq"]["tasks"]
+        for volts in range(100):
+            tasks["ao_task"]["volts"] = float(volts)
+            persister.mark_dirty(("instrument_view", "livestream_tasks", "daq", "tasks", "ao_task", "volts"))
+        persister.mark_dirty(("instrument_view", "livestream_tasks", "daq", "tasks"))  # covers change above
+        persister.stop()
+
+        lines = persister.journal_path.read_text().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn('"volts": 99.0', lines[0])
+        self.assertEqual(YAML().load(self.path)["instrument_view"]["livestream_tasks"]["daq"]["tasks"],
+                         {"ao_task": {"volts": 1.0}})
+
+    def test_atomic_write(self):
+        """Test that a failed write leaves original file and no temporary file"""
+
+        with self.assertRaises(Exception):
+            write_yaml_atomic(self.path, {"unrepresentable": object()})
+        self.assertEqual(self.path.read_text(), CONFIG)
+        self.assertEqual([p.name for p in Path(self.directory.name).iterdir()], ["gui_config.yaml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
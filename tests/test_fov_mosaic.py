@@ -0,0 +1,102 @@
+""" testing FovMosaic """
+
+import unittest
+import tempfile
+import numpy as np
+from pathlib import Path
+from view.fov_mosaic import FovMosaic, fingerprint
+
+
+class FovMosaicTests(unittest.TestCase):
+    """Tests for FovMosaic"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def image(self, shape=(400, 300)):
+        return self.rng.integers(0, 4096, shape, dtype=np.uint16)
+
+    def test_downsample_to_texel_budget(self):
+        """Test that snapshots are downsampled to at most max_texels"""
+
+        mosaic = FovMosaic(max_texels=100 * 100)
+        handle = mosaic.add(self.image(), [0, 4096], [1.0, 2.0, 3.0])
+        tile = mosaic.get(handle)
+        self.assertLessEqual(tile.data.size, 100 * 100)
+        self.assertEqual(tile.texture.shape, tile.data.shape + (4,))
+        self.assertEqual(tile.shape, (400, 300))
+        self.assertEqual(tile.position, [1.0, 2.0, 3.0])
+        self.assertEqual(mosaic.nbytes, tile.data.nbytes + tile.texture.nbytes)
+
+    def test_find_and_set_levels(self):
+        """Test that snapshots are found from original image and retextured with new levels"""
+
+        mosaic = FovMosaic()
+        image = self.image()
+        handle = mosaic.add(image, [0, 4096], [0, 0, 0])
+        self.assertEqual(mosaic.find(image.copy()), handle)
+        self.assertIsNone(mosaic.find(self.image()))
+
+        texture = mosaic.get(handle).texture
+        before = texture.copy()
+        mosaic.set_levels(handle, [0, 100])
+        self.assertEqual(mosaic.get(handle).levels, [0, 100])
+        self.assertIs(mosaic.get(handle).texture, texture)  # rewritten in place
+        self.assertFalse(np.array_equal(before, texture))
+
+    def test_levels_mapping(self):
+        """Test that intensities are mapped linearly between levels for integer and float images"""
+
+        for dtype in (np.uint8, np.uint16, np.float32):
+            mosaic = FovMosaic(alpha=200)
+            handle = mosaic.add(np.array([[0, 50, 100, 150, 200]], dtype=dtype), [50, 150], [0, 0, 0])
+            texture = mosaic.get(handle).texture
+            np.testing.assert_array_equal(texture[0, :, 0], [0, 0, 127, 255, 255])
+            np.testing.assert_array_equal(texture[0, :, 1], texture[0, :, 2])
+            np.testing.assert_array_equal(texture[0, :, 3], 200)
+
+    def test_evict_least_recently_used(self):
+        """Test that least recently used snapshots are evicted when over budget"""
+
+        evicted = []
+        mosaic = FovMosaic(max_texels=50 * 50, evicted=evicted.append)
+        handles = [mosaic.add(self.image(), [0, 4096], [i, 0, 0]) for i in range(3)]
+        mosaic.max_bytes = mosaic.nbytes  # room for three snapshots
+        mosaic.get(handles[0])  # use oldest snapshot
+        handles.append(mosaic.add(self.image(), [0, 4096], [3, 0, 0]))
+
+        self.assertEqual(evicted, [handles[1]])
+        self.assertEqual(list(mosaic.tiles), [handles[2], handles[0], handles[3]])
+        self.assertLessEqual(mosaic.nbytes, mosaic.max_bytes)
+
+    def test_spill_originals(self):
+        """Test that originals are spilled to memory mapped files and deleted with snapshot"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            mosaic = FovMosaic(max_texels=50 * 50, spill_directory=directory)
+            image = self.image()
+            handle = mosaic.add(image, [0, 4096], [0, 0, 0])
+            original = mosaic.original(handle)
+            self.assertIsInstance(original, np.memmap)
+            np.testing.assert_array_equal(original, image)
+            path = mosaic.get(handle).original_path
+            del original
+
+            mosaic.remove(handle)
+            self.assertNotIn(handle, mosaic)
+            self.assertFalse(Path(path).exists())
+            self.assertEqual(mosaic.nbytes, 0)
+
+    def test_fingerprint(self):
+        """Test that fingerprint depends on shape and contents"""
+
+        image = self.image()
+        self.assertEqual(fingerprint(image), fingerprint(image.copy()))
+        self.assertNotEqual(fingerprint(image), fingerprint(image.reshape(300, 400)))
+        changed = image.copy()
+        changed[0, 0] += 1
+        self.assertNotEqual(fingerprint(image), fingerprint(changed))
+
+
+if __name__ == "__main__":
+    unittest.main()
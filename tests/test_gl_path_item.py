@@ -0,0 +1,45 @@
+""" testing GLPathItem """
+
+import unittest
+import sys
+import numpy as np
+from qtpy.QtGui import QColor
+from qtpy.QtWidgets import QApplication
+from view.widgets.miscellaneous_widgets.gl_path_item import GLPathItem
+
+app = QApplication(sys.argv)
+
+
+class GLPathItemTests(unittest.TestCase):
+    """Tests for GLPathItem"""
+
+    def test_gradient(self):
+        """Test that path blends from start to end color and arrow has color of last position"""
+
+        path = GLPathItem(path_start_color="red", path_end_color="blue")
+        path.setData(pos=np.array([[0, 0, 0], [0, 1, 0], [0, 2, 0], [0, 3, 0]]))
+
+        self.assertEqual(path.pos.shape, (8, 3))
+        self.assertEqual(path.color.dtype, np.float32)
+        np.testing.assert_allclose(path.color[0], QColor("red").getRgbF())
+        np.testing.assert_allclose(path.color[2], [0.5, 0, 0.5, 1])
+        np.testing.assert_allclose(path.color[4:], np.repeat(path.color[3:4], 4, axis=0))
+
+        path.path_end_color = "green"
+        path.setData(pos=np.array([[0, 0, 0], [1, 0, 0]]))
+        np.testing.assert_allclose(path.color[1], np.array(QColor("green").getRgbF()) / 2 + [0.5, 0, 0, 0.5])
+
+    def test_arrow(self):
+        """Test that arrow points along last segment"""
+
+        path = GLPathItem(arrow_size=10, arrow_aspect_ratio=2)
+        for end, tip in (([0, -10, 0], [0, -12, 0]), ([-10, 0, 0], [-12, 0, 0]), ([10, 0, 0], [12, 0, 0])):
+            path.setData(pos=np.array([[0, 0, 0], end]))
+            np.testing.assert_allclose(path.pos[-2], tip)
+
+        path.setData(pos=np.array([[0, 0, 0], [0, 10, 0]]))
+        np.testing.assert_allclose(path.pos[2:], [[-1, 10, 0], [1, 10, 0], [0, 12, 0], [-1, 10, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
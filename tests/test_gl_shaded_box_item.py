@@ -0,0 +1,45 @@
+""" testing GLShadedBoxItem """
+
+import unittest
+import sys
+import numpy as np
+from qtpy.QtWidgets import QApplication
+from view.widgets.miscellaneous_widgets.gl_shaded_box_item import GLShadedBoxItem
+
+app = QApplication(sys.argv)
+
+
+class GLShadedBoxItemTests(unittest.TestCase):
+    """Tests for GLShadedBoxItem"""
+
+    def test_outline(self):
+        """Test that outline is precomputed as the 12 edges of the box and follows size changes"""
+
+        box = GLShadedBoxItem(pos=np.array([[[1, 2, 3]]]), size=np.array([1, 1, 0]), color="yellow", width=3)
+        edges = box.outline.pos.reshape(-1, 2, 3)
+
+        self.assertEqual(len(edges), 12)
+        self.assertEqual(box.outline.width, 3)
+        self.assertEqual(box.outline.mode, "lines")
+        np.testing.assert_array_equal(box.outline.pos.min(axis=0), [1, 2, 3])
+        np.testing.assert_array_equal(box.outline.pos.max(axis=0), [2, 3, 3])
+
+        box.setSize(x=4, y=5, z=6)
+        np.testing.assert_array_equal(box.outline.pos.max(axis=0), [5, 7, 9])
+
+        box.setColor("red")
+        np.testing.assert_allclose(box.outline.color, [1, 0, 0, 1])
+
+    def test_batched_boxes(self):
+        """Test that an array of positions creates a box and outline for each position"""
+
+        pos = np.array([[[0, 0, 0], [2, 0, 0]], [[0, 2, 0], [2, 2, 0]]])
+        box = GLShadedBoxItem(pos=pos, size=np.array([1, 1, 1]))
+
+        self.assertEqual(len(box.opts["meshdata"].faces()), 4 * 12)
+        self.assertEqual(len(box.outline.pos), 4 * 24)
+        np.testing.assert_array_equal(box.outline.pos.max(axis=0), [3, 3, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+""" testing GLTileGridItem """
+
+import unittest
+import sys
+import numpy as np
+from qtpy.QtWidgets import QApplication
+from view.widgets.miscellaneous_widgets.gl_tile_grid_item import GLTileGridItem
+from view.widgets.miscellaneous_widgets.plot_tile_grid_item import convert_color
+
+app = QApplication(sys.argv)
+
+
+class GLTileGridItemTests(unittest.TestCase):
+    """Tests for GLTileGridItem"""
+
+    def test_geometry(self):
+        """Test that every tile gets a box of faces and outlines in shared buffers"""
+
+        grid = GLTileGridItem()
+        pos = np.array([[0, 0, 0], [2, 0, 0], [0, 2, 0]])
+        grid.setData(pos=pos, size=np.array([1, 1, 3]), colors=np.array([convert_color("cyan", 0.5)]))
+
+        self.assertEqual(grid.tileCount(), 3)
+        mesh = grid.opts["meshdata"]
+        self.assertEqual(len(mesh.vertexes()), 3 * 8)
+        self.assertEqual(len(mesh.faces()), 3 * 12)
+        np.testing.assert_array_equal(mesh.vertexes().min(axis=0), [0, 0, 0])
+        np.testing.assert_array_equal(mesh.vertexes().max(axis=0), [3, 3, 3])
+        self.assertEqual(len(grid.outlines.pos), 3 * 24)
+
+        # every outline is an edge of a box along a single axis
+        segments = grid.outlines.pos.reshape(-1, 2, 3)
+        self.assertTrue(np.all(np.count_nonzero(segments[:, 0] != segments[:, 1], axis=1) == 1))
+
+    def test_colors_and_visibility(self):
+        """Test that color and visibility are applied per tile without rebuilding geometry"""
+
+        grid = GLTileGridItem()
+        grid.setData(pos=np.zeros((2, 3)), size=np.ones(3), colors=np.array([[1, 0, 0, 0.5], [0, 1, 0, 0.5]]))
+        vertexes = grid.opts["meshdata"].vertexes()
+
+        grid.setTileVisibility(np.array([True, False]))
+        vertex_colors = grid.opts["meshdata"].vertexColors()
+        np.testing.assert_allclose(vertex_colors[:8, 3], 0.5)
+        np.testing.assert_allclose(vertex_colors[8:, 3], 0)  # hidden tile is transparent
+        np.testing.assert_allclose(grid.outlines.color[24:, 3], 0)
+
+        grid.setColors(np.array([[0, 0, 1, 1]]))
+        np.testing.assert_allclose(grid.opts["meshdata"].vertexColors()[:8], [[0, 0, 1, 1]] * 8)
+        np.testing.assert_array_equal(grid.tileVisibility(), [True, False])  # visibility is kept
+        np.testing.assert_array_equal(grid.opts["meshdata"].vertexes(), vertexes)
+
+    def test_update_tiles(self):
+        """Test that patching a tile only rewrites its slice of the buffers in place"""
+
+        grid = GLTileGridItem()
+        grid.setData(pos=np.arange(12).reshape(4, 3), size=np.ones(3), colors=np.array([1, 0, 0, 1]))
+        meshdata = grid.opts["meshdata"]
+        vertexes = meshdata.vertexes().copy()
+        lines = grid.outlines.pos.copy()
+
+        grid.updateTiles([2], pos=np.array([[100, 100, 100]]), visible=np.array([False]))
+
+        self.assertIs(grid.opts["meshdata"], meshdata)  # patched, not rebuilt
+        changed = np.any(meshdata.vertexes() != vertexes, axis=1)
+        np.testing.assert_array_equal(np.flatnonzero(changed), np.arange(16, 24))
+        np.testing.assert_array_equal(meshdata.vertexes()[16], [100, 100, 100])
+        changed = np.any(grid.outlines.pos != lines, axis=1)
+        np.testing.assert_array_equal(np.flatnonzero(changed), np.arange(48, 72))
+        np.testing.assert_array_equal(grid.tileVisibility(), [True, True, False, True])
+        np.testing.assert_allclose(meshdata.vertexColors()[:, 3], np.repeat([1, 1, 0, 1], 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
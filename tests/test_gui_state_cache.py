@@ -0,0 +1,62 @@
+""" testing GuiStateCache """
+
+import os
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from view.gui_state_cache import GuiStateCache
+
+
+class GuiStateCacheTests(unittest.TestCase):
+    """Tests for GuiStateCache"""
+
+    def setUp(self):
+        # keep caches written without an explicit directory out of ~/.cache/view
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        environment = patch.dict(os.environ, {"VIEW_CACHE_DIR": directory.name})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def test_warm_start(self):
+        """Test that cache is reloaded when inputs are unchanged and discarded when a config changes"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            config = Path(directory) / "gui_config.yaml"
+            config.write_text("instrument_view: {}")
+            cache_directory = Path(directory) / "cache"
+
+            cache = GuiStateCache(config, [config], ["json"], cache_directory)
+            self.assertFalse(cache.warm)
+            cache.set("introspection", {"property_names": {"Laser": ["power_mw"]}})
+            cache.save()
+
+            cache = GuiStateCache(config, [config], ["json"], cache_directory)
+            self.assertTrue(cache.warm)
+            self.assertEqual(cache.get("introspection"), {"property_names": {"Laser": ["power_mw"]}})
+
+            config.write_text("instrument_view: {device_widgets: {}}")
+            cache = GuiStateCache(config, [config], ["json"], cache_directory)
+            self.assertFalse(cache.warm)
+            self.assertIsNone(cache.get("introspection"))
+
+    def test_default_directory(self):
+        """Test that cache without config files or modules is stored in VIEW_CACHE_DIR"""
+
+        cache = GuiStateCache("gui_config.yaml")
+        self.assertEqual(cache.path.parent, Path(os.environ["VIEW_CACHE_DIR"]))
+        self.assertEqual(cache.key, GuiStateCache.compute_key([], []))
+        cache.set("dock_state", "state")
+        cache.save()
+        self.assertTrue(GuiStateCache("gui_config.yaml").warm)
+
+    def test_module_version(self):
+        """Test that key changes with driver modules"""
+
+        self.assertNotEqual(GuiStateCache.compute_key([], ["json"]), GuiStateCache.compute_key([], ["logging"]))
+        self.assertEqual(GuiStateCache.compute_key([], ["json"]), GuiStateCache.compute_key([], ["json"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
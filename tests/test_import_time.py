@@ -0,0 +1,34 @@
+""" testing that light modules don't import heavy dependencies """
+
+import unittest
+import subprocess
+import sys
+
+
+def imported_modules(module: str, candidates: list[str]) -> list[str]:
+    """Import module in fresh interpreter and return which candidates were loaded along with it"""
+
+    code = f"import sys; import {module}; print(','.join(m for m in {candidates!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return [name for name in output.strip().split(",") if name]
+
+
+class ImportTimeTests(unittest.TestCase):
+    """Tests for deferred imports"""
+
+    def test_base_device_widget(self):
+        """Test that base device widget doesn't pull in napari or OpenGL"""
+
+        self.assertEqual(imported_modules("view.widgets.base_device_widget", ["napari", "OpenGL", "pint"]), [])
+
+    def test_channel_plan_widget(self):
+        """Test that channel plan widget only loads pint when built"""
+
+        self.assertEqual(
+            imported_modules("view.widgets.acquisition_widgets.channel_plan_widget", ["napari", "OpenGL", "pint"]),
+            [],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
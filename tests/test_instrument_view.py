@@ -0,0 +1,336 @@
+""" testing InstrumentView """
+
+import unittest
+from view.instrument_view import InstrumentView
+from view.headless_viewer import HeadlessViewer
+from view.config_loader import load_config
+from view.coalescing_writer import CoalescingWriter
+from view.profile_manager import ProfileSwitchError
+from qtpy.QtWidgets import QApplication
+from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from pathlib import Path
+import numpy as np
+import threading
+import tempfile
+import sys
+import os
+
+app = QApplication(sys.argv)
+
+
+class SlowDevice:
+    """Device that blocks on reads like a device on a slow serial link"""
+
+    def __init__(self, barrier: threading.Barrier = None):
+        """
+        :param barrier: barrier reads wait at until devices read concurrently reach it too
+        """
+
+        self.threads = set()
+        self.barrier = barrier
+
+    @property
+    def power(self):
+        self.threads.add(threading.get_ident())
+        if self.barrier is not None:
+            self.barrier.wait()  # raises if the other device isn't read at the same time
+        return 1.0
+
+
+class SimulatedCamera:
+    """Camera that returns random frames"""
+
+    def __init__(self):
+        self._exposure_time_ms = 10.0
+
+    @property
+    def exposure_time_ms(self) -> float:
+        return self._exposure_time_ms
+
+    @exposure_time_ms.setter
+    def exposure_time_ms(self, value: float) -> None:
+        self._exposure_time_ms = value
+
+    def grab_frame(self) -> np.ndarray:
+        return np.random.random((64, 64))
+
+
+class SimulatedFilterWheel:
+    """Filter wheel that rejects filters it doesn't have"""
+
+    def __init__(self):
+        self._filter = "BP488"
+
+    @property
+    def filter(self) -> str:
+        return self._filter
+
+    @filter.setter
+    def filter(self, value: str) -> None:
+        if value not in ["BP488", "BP561"]:
+            raise ValueError(f"{value} is not in filter wheel")
+        self._filter = value
+
+
+class SimulatedDaq:
+    """Daq that keeps its tasks"""
+
+    def __init__(self):
+        self._tasks = {}
+        self.ao_task = None
+        self.do_task = None
+
+    @property
+    def tasks(self) -> dict:
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, value: dict) -> None:
+        self._tasks = value
+
+
+class InstrumentViewTests(unittest.TestCase):
+    """Tests for InstrumentView"""
+
+    def test_prefetch_device_properties(self):
+        """Test that devices are read concurrently but devices in the same lock group are read on one thread"""
+
+        # 488 and 561 are in different lock groups so they're only read if they reach the barrier together
+        barrier = threading.Barrier(2, timeout=5)
+        lasers = {name: SlowDevice(barrier) for name in ["488", "561"]}
+        lasers.update({name: SlowDevice() for name in ["639", "subdevice"]})
+        view = MagicMock()
+        view.instrument.lasers = lasers
+        view.instrument.config = {
+            "instrument": {
+                "devices": {
+                    "488": {"type": "laser", "subdevices": {"subdevice": {"type": "laser"}}},
+                    "561": {"type": "laser"},
+                    "639": {"type": "laser"},
+                }
+            }
+        }
+        view.config = {
+            "instrument_view": {"device_widgets": {"639": {"lock_group": "488"}, "subdevice": {"lock_group": "561"}}}
+        }
+
+        snapshot = InstrumentView.prefetch_device_properties(view)
+
+        self.assertEqual(snapshot, {id(device): {"power": 1.0} for device in lasers.values()})
+        # 488, its subdevice and 639 share a lock group so they're read on one thread. 561 is read in parallel
+        self.assertEqual(lasers["488"].threads, lasers["subdevice"].threads)
+        self.assertEqual(lasers["488"].threads, lasers["639"].threads)
+        self.assertNotEqual(lasers["488"].threads, lasers["561"].threads)
+
+    def test_waveform_writes_wait_for_daq_setup(self):
+        """Test that waveform writer only drives daqs while livestream is set up and gui thread isn't using them"""
+
+        view = MagicMock()
+        view.daq_lock = threading.Lock()
+        view.daqs_live = False
+        daq = MagicMock()
+
+        InstrumentView.write_waveforms(view, daq)
+        daq.generate_waveforms.assert_not_called()  # tasks aren't set up
+
+        view.daqs_live = True
+        with view.daq_lock:  # gui thread is rebuilding tasks
+            writer = threading.Thread(target=InstrumentView.write_waveforms, args=(view, daq))
+            writer.start()
+            writer.join(0.1)
+            self.assertTrue(writer.is_alive())
+            daq.generate_waveforms.assert_not_called()
+        writer.join(5)
+        daq.write_ao_waveforms.assert_called_once_with(rereserve_buffer=False)
+
+    def test_change_channel_write_timeout(self):
+        """Test that lasers of new channel aren't enabled if waveforms aren't written in time"""
+
+        release = threading.Event()
+        view = MagicMock()
+        view.waveform_writer = CoalescingWriter(lambda daq: release.wait(), 0)
+        view.waveform_write_timeout_s = 0.05
+        view.livestream_channel = "488"
+        view.channels = {"488": {"lasers": ["488 nm"]}, "561": {"lasers": ["561 nm"]}}
+        view.instrument.daqs = {"daq": MagicMock()}
+        view.instrument.lasers = {"488 nm": MagicMock(), "561 nm": MagicMock()}
+
+        InstrumentView.change_channel(view, True, "561")
+        release.set()
+        view.waveform_writer.stop()
+
+        view.instrument.lasers["488 nm"].disable.assert_called_once()
+        view.instrument.lasers["561 nm"].enable.assert_not_called()
+        self.assertEqual(view.livestream_channel, "561")
+
+    def test_headless(self):
+        """Test that view can be built without napari and records layer updates"""
+
+        with tempfile.TemporaryDirectory() as directory, patch.dict(os.environ, {"VIEW_CACHE_DIR": directory}):
+            config_path = Path(directory) / "gui_config.yaml"
+            config_path.write_text("instrument_view:\n  device_widgets: {}\nacquisition_view: {}\n")
+            instrument = SimpleNamespace(
+                config={"instrument": {"channels": {"488": {}}, "devices": {"camera": {"type": "camera"}}}},
+                config_path=config_path,
+                daqs={},
+                cameras={"camera": SimulatedCamera()},
+            )
+
+            view = InstrumentView(instrument, config_path, headless=True)
+            self.assertIsInstance(view.viewer, HeadlessViewer)
+            self.assertIn("camera", view.camera_widgets)
+
+            for _ in range(3):
+                view.update_layer((instrument.cameras["camera"].grab_frame(), "camera"))
+            layer = view.viewer.layers["camera 488"]
+            self.assertEqual(layer.updates, 2)  # first frame creates layer
+            self.assertEqual(len(view.viewer.updates), 3)
+
+    def test_close_keeps_unsaved_changes(self):
+        """Test that an instrument without a config file is supported and unsaved gui changes are kept in journal"""
+
+        with tempfile.TemporaryDirectory() as directory, patch.dict(os.environ, {"VIEW_CACHE_DIR": directory}):
+            config_path = Path(directory) / "gui_config.yaml"
+            config_path.write_text("instrument_view:\n  device_widgets: {}\nacquisition_view: {}\n")
+            instrument = SimpleNamespace(
+                config={"instrument": {"channels": {"488": {}}, "devices": {}}},
+                daqs={},
+                close=lambda: None,
+            )
+
+            view = InstrumentView(instrument, config_path, headless=True)
+            self.assertIsNone(view.instrument_persister)
+
+            view.config["instrument_view"]["device_widgets"] = {"camera": {}}
+            view.config_persister.mark_dirty(("instrument_view", "device_widgets"))
+            self.assertTrue(view.config_persister.dirty)
+            view.close()
+
+            # autosave is off and no one was asked to save, so changes are recovered on next launch
+            self.assertTrue(view.config_persister.journal_path.exists())
+            self.assertEqual(load_config(config_path)["instrument_view"]["device_widgets"], {})
+
+    def test_switch_profile(self):
+        """Test that a profile is applied as a diff, keeping widgets and devices"""
+
+        with tempfile.TemporaryDirectory() as directory, patch.dict(os.environ, {"VIEW_CACHE_DIR": directory}):
+            config_path = Path(directory) / "gui_config.yaml"
+            config_path.write_text("instrument_view:\n  device_widgets: {}\nacquisition_view: {}\n")
+            instrument_config = (
+                "instrument:\n  channels:\n{channels}"
+                "  devices:\n    camera:\n      type: camera\n      settings:\n        exposure_time_ms: {exposure}\n"
+            )
+            instrument_path = Path(directory) / "instrument.yaml"
+            instrument_path.write_text(instrument_config.format(channels="    '488': {}\n", exposure=10.0))
+            new_instrument_path = Path(directory) / "new_instrument.yaml"
+            new_instrument_path.write_text(
+                instrument_config.format(channels="    '488': {}\n    '561': {}\n", exposure=20.0)
+            )
+            camera = SimulatedCamera()
+            instrument = SimpleNamespace(
+                config=load_config(instrument_path),
+                config_path=instrument_path,
+                daqs={},
+                cameras={"camera": camera},
+                close=lambda: None,
+            )
+
+            view = InstrumentView(instrument, config_path, headless=True)
+            camera_widget = view.camera_widgets["camera"]
+            diffs = []
+            view.profileChanged.connect(diffs.append)
+
+            diff = view.switch_profile(instrument_config_path=new_instrument_path)
+
+            self.assertEqual(diffs, [diff])
+            self.assertEqual(diff.channels, {"561"})
+            self.assertEqual(camera.exposure_time_ms, 20.0)
+            self.assertIs(view.camera_widgets["camera"], camera_widget)
+            self.assertEqual(camera_widget.exposure_time_ms, 20.0)
+            self.assertEqual(list(view.channels), ["488", "561"])
+            self.assertEqual(view.channel_button_group.checkedButton().text(), view.livestream_channel)
+            self.assertEqual(instrument.config_path, new_instrument_path)
+            view.close()
+
+    def test_switch_profile_rejected(self):
+        """Test that a setting rejected by a device leaves devices, configs and persisters on the current profile"""
+
+        with tempfile.TemporaryDirectory() as directory, patch.dict(os.environ, {"VIEW_CACHE_DIR": directory}):
+            config_path = Path(directory) / "gui_config.yaml"
+            config_path.write_text("instrument_view:\n  device_widgets: {}\nacquisition_view: {}\n")
+            instrument_config = (
+                "instrument:\n  channels: {{}}\n  devices:\n"
+                "    camera:\n      type: camera\n      settings:\n        exposure_time_ms: {exposure}\n"
+                "    wheel:\n      type: filter_wheel\n      settings:\n        filter: {filter}\n"
+            )
+            instrument_path = Path(directory) / "instrument.yaml"
+            instrument_path.write_text(instrument_config.format(exposure=10.0, filter="BP488"))
+            new_instrument_path = Path(directory) / "new_instrument.yaml"
+            new_instrument_path.write_text(instrument_config.format(exposure=20.0, filter="BP000"))
+            camera, wheel = SimulatedCamera(), SimulatedFilterWheel()
+            instrument = SimpleNamespace(
+                config=load_config(instrument_path),
+                config_path=instrument_path,
+                daqs={},
+                cameras={"camera": camera},
+                filter_wheels={"wheel": wheel},
+                close=lambda: None,
+            )
+
+            view = InstrumentView(instrument, config_path, headless=True)
+            persister = view.instrument_persister
+            with self.assertRaises(ProfileSwitchError):
+                view.switch_profile(instrument_config_path=new_instrument_path)
+
+            self.assertEqual(camera.exposure_time_ms, 10.0)  # restored after filter wheel rejected its setting
+            self.assertEqual(wheel.filter, "BP488")
+            self.assertEqual(instrument.config["instrument"]["devices"]["camera"]["settings"]["exposure_time_ms"], 10.0)
+            self.assertEqual(instrument.config_path, instrument_path)
+            self.assertIs(view.instrument_persister, persister)
+            view.close()
+
+    def test_switch_profile_daq_widgets(self):
+        """Test that daq widgets show tasks of new profile so edits after a switch don't bring back old tasks"""
+
+        with tempfile.TemporaryDirectory() as directory, patch.dict(os.environ, {"VIEW_CACHE_DIR": directory}):
+            gui_config = (
+                "instrument_view:\n  device_widgets: {{}}\n  livestream_tasks:\n    daq:\n      tasks:\n"
+                "        ao_task:\n          volts: {volts}\n          offset: {offset}\n"
+                "acquisition_view:\n  data_acquisition_tasks:\n    daq:\n      tasks:\n        ao_task:\n"
+                "          volts: {volts}\n"
+            )
+            config_path = Path(directory) / "gui_config.yaml"
+            config_path.write_text(gui_config.format(volts=1.0, offset=0.1))
+            new_config_path = Path(directory) / "new_gui_config.yaml"
+            new_config_path.write_text(gui_config.format(volts=1.5, offset=0.2))
+            instrument = SimpleNamespace(
+                config={"instrument": {"channels": {"488": {}}, "devices": {"daq": {"type": "daq"}}}},
+                daqs={"daq": SimulatedDaq()},
+                close=lambda: None,
+            )
+
+            view = InstrumentView(instrument, config_path, headless=True)
+            cache_path = view.state_cache.path
+            view.switch_profile(config_path=new_config_path)
+
+            self.assertEqual(view.config_persister.path, new_config_path)
+            self.assertNotEqual(view.state_cache.path, cache_path)
+            widget = view.daq_widgets["daq"]
+            self.assertEqual(getattr(widget, "tasks.ao_task.volts"), 1.5)
+
+            getattr(widget, "tasks.ao_task.volts_widget").setText("2.0")
+            widget.textbox_edited("tasks.ao_task.volts")
+            view.apply_config_waveforms()
+
+            self.assertEqual(
+                view.config["instrument_view"]["livestream_tasks"]["daq"]["tasks"],
+                {"ao_task": {"volts": 2.0, "offset": 0.2}},
+            )
+            acquisition_tasks = view.config["acquisition_view"]["data_acquisition_tasks"]["daq"]["tasks"]
+            self.assertEqual(acquisition_tasks["ao_task"]["volts"], 2.0)
+            view.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
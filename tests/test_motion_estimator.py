@@ -0,0 +1,74 @@
+""" testing MotionEstimator """
+
+import unittest
+import numpy as np
+from view.motion_estimator import MotionEstimator
+
+
+class MotionEstimatorTests(unittest.TestCase):
+    """Tests for MotionEstimator"""
+
+    def setUp(self):
+        self.now = 0.0
+        self.estimator = MotionEstimator([10.0, 10.0, 1.0], [20.0, 20.0, 2.0], clock=lambda: self.now)
+        self.estimator.add_sample([0.0, 0.0, 0.0])
+
+    def test_trapezoidal_move(self):
+        """Test that move to target accelerates, cruises and brakes onto target without overshooting"""
+
+        self.estimator.set_target([10.0, -0.1, 0.0])
+        # x accelerates for 0.5 s over 2.5, cruises for 0.5 s over 5 and brakes for 0.5 s over 2.5
+        np.testing.assert_allclose(self.estimator.predict(0.25)[0], 0.625)
+        np.testing.assert_allclose(self.estimator.predict(0.75)[0], 5.0)
+        np.testing.assert_allclose(self.estimator.predict(1.25)[0], 9.375)
+        np.testing.assert_allclose(self.estimator.predict(2.0), [10.0, -0.1, 0.0])
+
+        positions = np.array([self.estimator.predict(t) for t in np.linspace(0, 2, 201)])
+        self.assertTrue(np.all(np.diff(positions[:, 0]) >= 0))
+        self.assertTrue(np.all(positions[:, 1] >= -0.1))
+        self.assertTrue(self.estimator.moving(1.0))
+        self.assertFalse(self.estimator.moving(2.0))
+
+    def test_samples_correct_prediction(self):
+        """Test that measured positions correct prediction and targets are dropped once reached"""
+
+        self.estimator.set_target([10.0, 0.0, 0.0])
+        self.now = 0.5
+        self.estimator.add_sample([2.0, 0.0, 0.0])  # stage is slower than predicted
+        np.testing.assert_allclose(self.estimator.velocity, [4.0, 0.0, 0.0])
+        self.assertEqual(self.estimator.predict()[0], 2.0)
+        self.assertGreater(self.estimator.predict(0.6)[0], 2.4)
+
+        self.now = 3.0
+        self.estimator.add_sample([10.0, 0.0, 0.0])
+        self.assertTrue(np.all(np.isnan(self.estimator.target)))
+
+    def test_stop(self):
+        """Test that stopped axes brake from measured velocity and axes without target don't move"""
+
+        self.now = 0.5
+        self.estimator.add_sample([5.0, 0.0, 0.0])  # moving at max velocity without commanded target
+        np.testing.assert_allclose(self.estimator.predict(0.75), [6.875, 0.0, 0.0])
+        np.testing.assert_allclose(self.estimator.predict(5.0), [7.5, 0.0, 0.0])
+
+        self.estimator.set_target([100.0, 0.0, 0.0])
+        self.estimator.stop()
+        np.testing.assert_allclose(self.estimator.predict(5.0), [7.5, 0.0, 0.0])
+        self.assertFalse(self.estimator.moving(5.0))
+
+    def test_stalled_axis(self):
+        """Test that target is dropped when axis stands still for a whole poll after move was commanded"""
+
+        self.now = 0.1
+        self.estimator.set_target([10.0, 0.0, 0.0])
+        self.now = 0.2
+        self.estimator.add_sample([0.0, 0.0, 0.0])  # previous sample was taken before move was commanded
+        self.assertEqual(self.estimator.target[0], 10.0)
+        self.now = 0.3
+        self.estimator.add_sample([0.0, 0.0, 0.0])
+        self.assertTrue(np.isnan(self.estimator.target[0]))
+        self.assertFalse(self.estimator.moving())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+""" testing PlotPathItem """
+
+import unittest
+import sys
+import numpy as np
+from qtpy.QtWidgets import QApplication
+from view.widgets.miscellaneous_widgets.plot_path_item import PlotPathItem
+
+app = QApplication(sys.argv)
+
+
+class PlotPathItemTests(unittest.TestCase):
+    """Tests for PlotPathItem"""
+
+    def test_bands(self):
+        """Test that segments are grouped into bands of gradient and segments seen end on are skipped"""
+
+        path = PlotPathItem(bands=2, path_start_color="red", path_end_color="blue")
+        path.setData(pos=np.array([[0, 0, 0], [0, 1, 0], [0, 2, 0], [0, 3, 0], [0, 4, 0]]))
+        batches = path._build_batches()
+        self.assertEqual([len(lines) for pen, lines in batches], [2, 2])
+        self.assertEqual(batches[0][0].color().name(), "#ff0000")
+        self.assertEqual(batches[1][0].color().name(), "#0000ff")
+
+        path.setAxes(2, 0)  # path runs along viewing direction
+        self.assertEqual(path._build_batches(), [])
+        self.assertIsNone(path._arrow)
+
+    def test_arrow(self):
+        """Test that arrow points along last segment that isn't seen end on"""
+
+        path = PlotPathItem(arrow_size=10, arrow_aspect_ratio=2, axes=(0, 2))
+        path.setData(pos=np.array([[0, 0, 0], [10, 0, 0], [10, 5, 0]]))
+        np.testing.assert_allclose(path._arrow, [[10, -1], [10, 1], [12, 0], [10, -1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
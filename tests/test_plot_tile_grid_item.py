@@ -0,0 +1,44 @@
+""" testing PlotTileGridItem """
+
+import unittest
+import sys
+import numpy as np
+from qtpy.QtWidgets import QApplication
+from view.widgets.miscellaneous_widgets.plot_tile_grid_item import PlotTileGridItem, convert_color
+
+app = QApplication(sys.argv)
+
+
+class PlotTileGridItemTests(unittest.TestCase):
+    """Tests for PlotTileGridItem"""
+
+    def test_batches(self):
+        """Test that visible tiles are grouped into one batch of rectangles per color"""
+
+        grid = PlotTileGridItem()
+        colors = np.array([convert_color("cyan", 0.5), convert_color("red"), convert_color("cyan", 0.5)])
+        grid.setData(pos=np.array([[0, 0, 0], [2, 0, 0], [0, 2, 0]]), size=np.array([1, 1, 3]), colors=colors)
+
+        batches = grid._build_batches()
+        self.assertEqual(sorted(len(rects) for pen, brush, rects in batches), [1, 2])
+        self.assertEqual(grid._bounds.getRect(), (0, 0, 3, 3))
+
+        grid.updateTiles([1], visible=[False])
+        self.assertEqual([len(rects) for pen, brush, rects in grid._build_batches()], [2])
+        self.assertEqual(grid._bounds.getRect(), (0, 0, 1, 3))
+
+    def test_axes(self):
+        """Test that tiles are projected onto axes of view"""
+
+        grid = PlotTileGridItem(axes=(2, 1))
+        grid.setData(pos=np.array([[5, 1, 2]]), size=np.array([1, 1, 3]), colors=convert_color("cyan"))
+        ((pen, brush, (rect,)),) = grid._build_batches()
+        self.assertEqual(rect.getRect(), (2, 1, 3, 1))
+
+        grid.setAxes(0, 2)
+        ((pen, brush, (rect,)),) = grid._build_batches()
+        self.assertEqual(rect.getRect(), (5, 2, 1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from view.profile_manager import MISSING, diff_config, apply_changes, ProfileDiff, ProfileManager, ProfileSwitchError
+
+
+class ProfileManagerTests(unittest.TestCase):
+    """Tests for profile diffs"""
+
+    def test_diff_config(self):
+        """Test that only changed values are found and lists are compared as a whole"""
+
+        old = {"a": {"b": 1, "c": [1, 2]}, "d": 1}
+        new = {"a": {"b": 2, "c": [1, 2]}, "e": {"f": 1}}
+        changes = diff_config(old, new)
+
+        self.assertEqual(changes, {("a", "b"): (1, 2), ("d",): (1, MISSING), ("e",): (MISSING, {"f": 1})})
+
+        apply_changes(old, changes)
+        self.assertEqual(old, new)
+
+    def test_sort_changes(self):
+        """Test that changes are sorted by how they are applied"""
+
+        old_instrument = {
+            "instrument": {
+                "channels": {"488": {"lasers": ["488 nm"]}},
+                "devices": {
+                    "camera": {"type": "camera", "driver": "a", "settings": {"exposure_time_ms": 10}},
+                    "tiger": {"type": "stage", "subdevices": {"x": {"type": "stage", "settings": {"speed": 1}}}},
+                },
+            }
+        }
+        new_instrument = {
+            "instrument": {
+                "channels": {"488": {"lasers": ["488 nm"]}, "561": {"lasers": ["561 nm"]}},
+                "devices": {
+                    "camera": {"type": "camera", "driver": "a", "settings": {"exposure_time_ms": 20}},
+                    "tiger": {"type": "stage", "subdevices": {"x": {"type": "stage", "settings": {"speed": 2}}}},
+                },
+            }
+        }
+        diff = ProfileDiff(
+            diff_config(
+                {"instrument_view": {"livestream_tasks": {"daq": 1}}},
+                {"instrument_view": {"livestream_tasks": {"daq": 2}}},
+            ),
+            diff_config(old_instrument, new_instrument),
+        )
+
+        self.assertEqual(diff.channels, {"561"})
+        self.assertEqual(diff.livestream_tasks, {"daq"})
+        self.assertEqual(
+            diff.device_settings,
+            {
+                ("instrument", "devices", "camera"): {"exposure_time_ms"},
+                ("instrument", "devices", "tiger", "subdevices", "x"): {"speed"},
+            },
+        )
+        self.assertEqual(diff.restart, [])
+
+    def test_restart_needed(self):
+        """Test that configs aren't changed if a device would need to be reconnected"""
+
+        instrument = {"instrument": {"devices": {"camera": {"type": "camera", "driver": "a"}}}}
+        new_instrument = {"instrument": {"devices": {"camera": {"type": "camera", "driver": "b"}}}}
+        manager = ProfileManager({}, instrument)
+        diff = ProfileDiff({}, diff_config(instrument, new_instrument))
+
+        self.assertEqual(diff.restart, ["instrument.devices.camera.driver"])
+        with self.assertRaises(ProfileSwitchError):
+            manager.apply(diff)
+        self.assertEqual(instrument["instrument"]["devices"]["camera"]["driver"], "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
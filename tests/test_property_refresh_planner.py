@@ -0,0 +1,75 @@
+""" testing PropertyRefreshPlanner """
+
+import unittest
+from view.property_refresh_planner import PropertyRefreshPlanner
+
+
+class PropertyRefreshPlannerTests(unittest.TestCase):
+    """Tests for PropertyRefreshPlanner"""
+
+    def test_learning(self):
+        """Test that first edit refreshes everything and later edits only refresh observed changes"""
+
+        planner = PropertyRefreshPlanner()
+        candidates = ['exposure_time_ms', 'frame_time_ms', 'binning', 'pixel_type']
+
+        names, full = planner.plan('exposure_time_ms', candidates)
+        self.assertTrue(full)
+        self.assertEqual(names, candidates)
+        for name in candidates:
+            planner.observe('exposure_time_ms', name, name in ['exposure_time_ms', 'frame_time_ms'])
+        planner.finish('exposure_time_ms')
+
+        names, full = planner.plan('exposure_time_ms', candidates)
+        self.assertFalse(full)
+        self.assertEqual(names, ['exposure_time_ms', 'frame_time_ms'])
+
+    def test_declared(self):
+        """Test that declared dependencies are always refreshed"""
+
+        planner = PropertyRefreshPlanner({'binning': ['width_px']})
+        candidates = ['binning', 'width_px', 'height_px']
+        planner.plan('binning', candidates)
+        planner.finish('binning')  # nothing observed changing
+
+        names, full = planner.plan('binning', candidates)
+        self.assertFalse(full)
+        self.assertEqual(names, ['binning', 'width_px'])
+
+        planner.declare('binning', ['height_px'])
+        names, full = planner.plan('binning', candidates)
+        self.assertEqual(names, candidates)
+
+    def test_overlapping_refreshes(self):
+        """Test that a second full refresh started before the first finishes doesn't lose observations"""
+
+        planner = PropertyRefreshPlanner()
+        candidates = ['exposure_time_ms', 'frame_time_ms', 'line_interval_us']
+
+        planner.plan('exposure_time_ms', candidates)
+        planner.plan('exposure_time_ms', candidates)  # edited again while first refresh is running
+        planner.observe('exposure_time_ms', 'frame_time_ms', True)
+        planner.finish('exposure_time_ms')
+        planner.observe('exposure_time_ms', 'line_interval_us', True)
+        planner.finish('exposure_time_ms')
+
+        names, full = planner.plan('exposure_time_ms', candidates)
+        self.assertFalse(full)
+        self.assertEqual(names, candidates)
+
+    def test_relearn(self):
+        """Test that a full refresh is done every relearn_interval edits"""
+
+        planner = PropertyRefreshPlanner(relearn_interval=3)
+        candidates = ['a', 'b']
+        fulls = []
+        for _ in range(7):
+            names, full = planner.plan('a', candidates)
+            if full:
+                planner.finish('a')
+            fulls.append(full)
+        self.assertEqual(fulls, [True, False, False, True, False, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+""" testing spatial_index """
+
+import unittest
+import numpy as np
+from scipy.spatial import cKDTree
+from view.spatial_index import points_in_box
+
+
+class SpatialIndexTests(unittest.TestCase):
+    """Tests for spatial_index"""
+
+    def test_points_in_box(self):
+        """Test that points within box match brute force search, including boxes that aren't cubes"""
+
+        rng = np.random.default_rng(0)
+        points = rng.uniform(-100, 100, (1000, 2))
+        tree = cKDTree(points)
+        for corner in rng.uniform(-100, 100, (20, 2)):
+            low, high = corner, corner + [5, 40]
+            expected = np.flatnonzero(np.all((low <= points) & (points <= high), axis=1))
+            np.testing.assert_array_equal(points_in_box(tree, low, high), expected)
+
+        self.assertEqual(len(points_in_box(cKDTree(np.zeros((0, 2))), [-1, -1], [1, 1])), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
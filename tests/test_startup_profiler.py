@@ -0,0 +1,48 @@
+""" testing StartupProfiler """
+
+import unittest
+import tempfile
+from pathlib import Path
+from view.startup_profiler import StartupProfiler
+
+
+class StartupProfilerTests(unittest.TestCase):
+    """Tests for StartupProfiler"""
+
+    def test_tree(self):
+        """Test that nested sections build a tree and are written as folded stacks"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = StartupProfiler("view", enabled=True, output_directory=directory)
+            with profiler.section("create_device_widgets"):
+                for name in ["camera", "laser", "camera"]:
+                    with profiler.section(name):
+                        with profiler.section("read"):
+                            pass
+                        with profiler.section("build"):
+                            pass
+            path = profiler.finish()
+
+            devices = profiler.root.children["create_device_widgets"]
+            self.assertEqual(list(devices.children.keys()), ["camera", "laser"])
+            self.assertEqual(devices.children["camera"].calls, 2)
+            self.assertGreaterEqual(profiler.root.total, devices.total)
+
+            lines = Path(path).read_text().splitlines()
+            stacks = [line.rsplit(" ", 1)[0] for line in lines]
+            self.assertIn("view;create_device_widgets;camera;read", stacks)
+            self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in lines))
+            self.assertIn("create_device_widgets", profiler.summary())
+
+    def test_disabled(self):
+        """Test that disabled profiler records nothing"""
+
+        profiler = StartupProfiler("view", enabled=False)
+        with profiler.section("setup_daqs"):
+            pass
+        self.assertEqual(profiler.root.children, {})
+        self.assertIsNone(profiler.finish())
+
+
+if __name__ == "__main__":
+    unittest.main()
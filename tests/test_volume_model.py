@@ -0,0 +1,214 @@
+""" testing VolumeModel """
+
+import unittest
+import sys
+import numpy as np
+from unittest.mock import patch
+from qtpy.QtWidgets import QApplication, QMessageBox
+from qtpy.QtCore import QEvent, QPointF, Qt
+from qtpy.QtGui import QMouseEvent
+from view.widgets.acquisition_widgets.volume_model import VolumeModel
+
+app = QApplication(sys.argv)
+
+
+class VolumeModelTests(unittest.TestCase):
+    """Tests for VolumeModel"""
+
+    def setUp(self):
+        self.model = VolumeModel(limits=[[0, 100], [0, 100], [0, 10]], coordinate_plane=["x", "y", "z"])
+        rows, columns = np.meshgrid(np.arange(10), np.arange(10), indexing="ij")
+        self.model.grid_coords = np.stack([columns * 1.0, rows * 1.0, np.zeros((10, 10))], axis=-1)
+        self.model.scan_volumes = np.ones((10, 10))
+        self.model.tile_visibility = np.ones((10, 10), dtype=bool)
+        self.model.render_model()
+
+    def test_toggle_tile_visibility(self):
+        """Test that hiding a tile only patches that tile"""
+
+        visibility = np.ones((10, 10), dtype=bool)
+        visibility[3, 4] = False
+        with patch.object(self.model.tile_grid, "updateTiles", wraps=self.model.tile_grid.updateTiles) as update, \
+                patch.object(self.model.tile_grid, "setData") as set_data:
+            self.model.tile_visibility = visibility
+            self.model.render_model()
+
+        set_data.assert_not_called()
+        update.assert_called_once()
+        np.testing.assert_array_equal(update.call_args.args[0], [34])
+        self.assertFalse(self.model.tile_grid.tileVisibility()[34])
+        self.assertEqual(self.model.tile_grid.tileVisibility().sum(), 99)
+
+    def test_move_tiles(self):
+        """Test that tiles are patched when grid moves and rebuilt when number of tiles changes"""
+
+        coords = self.model.grid_coords.copy()
+        coords[0, 0] = [50, 50, 0]
+        self.model.grid_coords = coords
+        self.model.render_model()
+        np.testing.assert_array_equal(self.model.tile_grid.tilePositions()[0], [50, 50, 0])
+
+        self.model.grid_coords = np.zeros((2, 3, 3))
+        self.model.scan_volumes = np.ones((2, 3))
+        self.model.tile_visibility = np.ones((2, 3), dtype=bool)
+        self.model.render_model()
+        self.assertEqual(self.model.tile_grid.tileCount(), 6)
+
+    def test_fov_leaves_grid(self):
+        """Test that tiles are recolored when fov leaves grid"""
+
+        self.model.fov_position = [500.0, 500.0, 0.0]
+        self.model.render_model()
+        inactive = self.model.tile_colors(False)
+        np.testing.assert_allclose(self.model.tile_grid.tileColors(), inactive)
+
+    def test_fov_moves_within_grid(self):
+        """Test that moving fov within grid only moves fov and doesn't reframe view"""
+
+        self.model.fov_position = [5.0, 5.0, 0.0]
+        self.model.render_model()
+        with patch.object(self.model, "_update_opts") as update_opts, \
+                patch.object(self.model, "sync_tiles") as sync_tiles:
+            self.model.fov_position = [2.0, 7.0, 0.5]
+            self.model.render_model()
+        update_opts.assert_not_called()
+        sync_tiles.assert_not_called()
+        self.assertEqual(self.model.fov_view.transform()[0, 3], 2.0)
+
+        with patch.object(self.model, "_update_opts") as update_opts:
+            self.model.fov_position = [50.0, 7.0, 0.0]
+            self.model.render_model()
+        update_opts.assert_called_once()
+
+    def test_grid_extents(self):
+        """Test that grid extents are cached when grid changes"""
+
+        coords = self.model.grid_coords.copy()
+        coords[0, 0] = [-5, 20, 3]
+        self.model.grid_coords = coords
+        self.model.render_model()
+        np.testing.assert_array_equal(self.model.grid_extents["tiles"][0], [-5, 0, 0])
+        np.testing.assert_array_equal(self.model.grid_extents["tiles"][1], [9, 20, 3])
+        np.testing.assert_array_equal(self.model.grid_extents["volume"][1], [9, 20, 4])
+
+    def test_framing_skipped_when_unchanged(self):
+        """Test that view is only reframed when inputs of framing change"""
+
+        self.model.fov_position = [50.0, 50.0, 0.0]
+        self.model.render_model()
+        self.model.opts["distance"] = 0
+        self.model._update_opts()
+        self.assertEqual(self.model.opts["distance"], 0)
+
+        self.model.view_plane = ("x", "z")
+        self.model.render_model()
+        self.assertNotEqual(self.model.opts["distance"], 0)
+
+    def test_fov_images(self):
+        """Test that snapshots are placed where they were taken and removed with their image item"""
+
+        self.model.fov_position = [2.0, 3.0, 0.0]
+        self.model.render_model()
+        image = np.random.default_rng(0).integers(0, 255, (64, 48), dtype=np.uint8)
+        handle = self.model.add_fov_image(image, [0, 255])
+        self.model.fov_position = [5.0, 5.0, 0.0]
+        self.model.render_model()
+        item = self.model.fov_images[handle]
+        self.model.adjust_glimage_contrast(image, [0, 100])
+        self.assertIs(self.model.fov_images[handle], item)  # contrast changes don't rebuild image item
+        self.assertEqual(item.transform()[0, 3], 2.0)
+        self.assertEqual(self.model.fov_mosaic.get(handle).levels, [0, 100])
+
+        self.model.fov_mosaic.max_bytes = 0
+        newest = self.model.add_fov_image(image[::-1], [0, 255])
+        self.assertEqual(list(self.model.fov_images), [newest])
+        self.assertNotIn(item, self.model.items)
+
+    def test_pick_tiles(self):
+        """Test that tiles are picked in view plane and nearest tile is found"""
+
+        self.assertEqual(self.model.tile_at(np.array([3.5, 4.5, 0.0])), 43)
+        self.assertIsNone(self.model.tile_at(np.array([30.0, 4.5, 0.0])))
+        self.assertEqual(self.model.tile_spatial_index().query([6.2, 1.9, 5.0])[1], 26)
+
+        self.model.hover_tile(43)
+        self.assertTrue(self.model.hover_view.visible())
+        self.assertEqual(self.model.hover_view.transform()[1, 3], 4.0)
+        visibility = np.ones((10, 10), dtype=bool)
+        visibility[4, 3] = False
+        self.model.tile_visibility = visibility
+        self.model.render_model()
+        self.assertIsNone(self.model.tile_at(np.array([3.5, 4.5, 0.0])))
+
+    def test_pick_fov_images(self):
+        """Test that right clicking removes image under mouse"""
+
+        image = np.zeros((16, 16), dtype=np.uint8)
+        handles = []
+        for position in ([0.0, 0.0, 0.0], [5.0, 5.0, 0.0], [5.5, 5.5, 0.0]):
+            self.model.fov_position = position
+            self.model.render_model()
+            handles.append(self.model.add_fov_image(image + len(handles), [0, 255]))
+
+        self.assertEqual(self.model.image_at(np.array([0.5, 0.5, 0.0])), handles[0])
+        self.assertEqual(self.model.image_at(np.array([5.7, 5.7, 0.0])), handles[2])  # most recent image on top
+        self.assertEqual(self.model.image_at(np.array([5.2, 5.2, 0.0])), handles[1])
+        self.assertIsNone(self.model.image_at(np.array([3.0, 0.5, 0.0])))
+
+        event = QMouseEvent(QEvent.MouseButtonPress, QPointF(0, 0), Qt.RightButton, Qt.RightButton, Qt.NoModifier)
+        with patch.object(self.model, "view_point", return_value=np.array([5.2, 5.2, 0.0])), \
+                patch.object(self.model, "delete_fov_image_query", return_value=QMessageBox.Ok):
+            self.model.mousePressEvent(event)
+        self.assertEqual(list(self.model.fov_images), [handles[0], handles[2]])
+
+    def test_level_of_detail(self):
+        """Test that tiles too small on screen are drawn merged and keep their brightness"""
+
+        self.model.update_lod()
+        self.assertTrue(self.model.tile_grid.visible())
+        self.assertFalse(self.model.tile_lod.visible())
+
+        self.model.lod_tile_pixels = self.model.width() / 2  # two tiles fit along width
+        self.model.update_lod()
+        self.assertFalse(self.model.tile_grid.visible())
+        self.assertTrue(self.model.tile_lod.visible())
+        self.assertLess(self.model.tile_lod.tileCount(), 100)
+        np.testing.assert_allclose(self.model.tile_lod.tileColors()[0, 3], self.model.tile_grid.tileColors()[0, 3])
+
+        self.model.view_plane = ("x", "z")  # rows are stacked along viewing direction
+        self.model.render_model()
+        self.assertLessEqual(self.model.tile_lod.tileCount(), 10)
+        np.testing.assert_allclose(self.model.tile_lod.tileColors()[0, 3], self.model.tile_grid.tileColors()[0, 3] * 10)
+        np.testing.assert_array_equal(self.model.tile_lod.tileSizes()[0, 1:], [10, 1])  # spans stacked rows
+
+        visibility = np.zeros((10, 10), dtype=bool)
+        self.model.tile_visibility = visibility
+        self.model.render_model()
+        self.assertFalse(self.model.tile_lod.tileVisibility().any())
+
+    def test_changes_rendered_once_per_frame(self):
+        """Test that a burst of changes is applied by one render on next frame"""
+
+        with patch.object(self.model, "sync_tiles", wraps=self.model.sync_tiles) as sync_tiles:
+            self.model.grid_coords = self.model.grid_coords + [1, 0, 0]
+            self.model.scan_volumes = np.full((10, 10), 2.0)
+            self.model.tile_visibility = np.ones((10, 10), dtype=bool)
+            self.model.fov_position = [3.0, 3.0, 0.0]
+            sync_tiles.assert_not_called()
+            self.assertEqual(self.model.dirty, {"grid_coords", "scan_volumes", "tile_visibility", "fov_position"})
+
+            while self.model.dirty:
+                app.processEvents()
+        sync_tiles.assert_called_once()
+        np.testing.assert_array_equal(self.model.tile_grid.tilePositions()[0], [1, 0, 0])
+        np.testing.assert_array_equal(self.model.tile_grid.tileSizes()[0], [1, 1, 2])
+
+    def test_set_path_pos(self):
+        """Test that path runs through centers of tiles"""
+
+        self.model.set_path_pos(self.model.grid_coords[[0, 0, 1], [0, 1, 1]])
+        np.testing.assert_allclose(self.model.path.pos[:3], [[0.5, 0.5, 0], [1.5, 0.5, 0], [1.5, 1.5, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+""" testing VolumeModel2D """
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+import numpy as np
+from qtpy.QtWidgets import QApplication
+from qtpy.QtCore import QPointF
+from view.widgets.acquisition_widgets.volume_model_2d import VolumeModel2D
+
+app = QApplication(sys.argv)
+
+
+class VolumeModel2DTests(unittest.TestCase):
+    """Tests for VolumeModel2D"""
+
+    def setUp(self):
+        self.model = VolumeModel2D(limits=[[0, 100], [0, 100], [0, 10]], coordinate_plane=["x", "y", "z"])
+        self.model.resize(800, 600)
+        rows, columns = np.meshgrid(np.arange(10), np.arange(10), indexing="ij")
+        self.model.grid_coords = np.stack([columns * 1.0, rows * 1.0, np.zeros((10, 10))], axis=-1)
+        self.model.scan_volumes = np.ones((10, 10))
+        self.model.tile_visibility = np.ones((10, 10), dtype=bool)
+        self.model.render_model()
+
+    def test_view_point(self):
+        """Test that widget positions map to positions in view plane through view transform"""
+
+        (left, right), (bottom, top) = self.model.view_box.viewRange()
+        self.assertTrue(left < 0 and right > 10 and bottom < 0 and top > 10)  # tiles are framed
+        pixel = self.model.mapFromScene(self.model.view_box.mapViewToScene(QPointF(3.5, 4.5)))
+        point = self.model.view_point(pixel.x(), pixel.y())
+        np.testing.assert_allclose(point[:2], [3.5, 4.5], atol=max(self.model.view_size()) / 400)
+        self.assertEqual(self.model.tile_at(point), 43)
+
+    def test_view_plane(self):
+        """Test that items are projected onto view plane and snapshots are only shown in tiling plane"""
+
+        handle = self.model.add_fov_image(np.zeros((16, 16), dtype=np.uint8), [0, 255])
+        self.model.view_plane = ("x", "z")
+        self.model.render_model()
+        self.assertEqual(self.model.tile_grid._bounds.getRect(), (0, 0, 10, 1))
+        self.assertFalse(self.model.fov_images[handle].isVisible())
+        (bottom, top) = self.model.view_box.viewRange()[1]
+        self.assertTrue(bottom < 0 and top > 1)
+
+        self.model.view_plane = ("x", "y")
+        self.model.render_model()
+        self.assertTrue(self.model.fov_images[handle].isVisible())
+
+    def test_fov_moves_within_grid(self):
+        """Test that moving fov within grid only moves fov box"""
+
+        view_range = self.model.view_box.viewRange()
+        self.model.fov_position = [2.0, 7.0, 0.5]
+        self.model.render_model()
+        np.testing.assert_array_equal(self.model.fov_view.tilePositions()[0], [2.0, 7.0, 0.5])
+        self.assertEqual(self.model.view_box.viewRange(), view_range)
+
+    def test_fov_image_contrast(self):
+        """Test that contrast changes update image item in place"""
+
+        image = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        handle = self.model.add_fov_image(image, [0, 255])
+        item = self.model.fov_images[handle]
+        self.model.adjust_glimage_contrast(image, [0, 100])
+        self.assertIs(self.model.fov_images[handle], item)
+        self.assertEqual(item.image[6, 4, 0], 255)  # intensity 100 is white with new levels
+
+        self.model.remove_fov_image(handle)
+        self.assertNotIn(item, self.model.view_box.addedItems)
+
+    def test_close_deletes_spilled_snapshots(self):
+        """Test that closing model deletes snapshot originals spilled to disk"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            model = VolumeModel2D(
+                limits=[[0, 100], [0, 100], [0, 10]],
+                coordinate_plane=["x", "y", "z"],
+                fov_image_spill_directory=directory,
+            )
+            handle = model.add_fov_image(np.zeros((16, 16), dtype=np.uint8), [0, 255])
+            path = model.fov_mosaic.get(handle).original_path
+            self.assertTrue(Path(path).exists())
+
+            model.close()
+            self.assertEqual(model.fov_images, {})
+            self.assertEqual(list(Path(directory).iterdir()), [])
+
+    def test_level_of_detail(self):
+        """Test that tiles too small on screen are drawn merged"""
+
+        self.model.lod_tile_pixels = self.model.width() / 2
+        self.model.update_lod()
+        self.assertFalse(self.model.tile_grid.isVisible())
+        self.assertTrue(self.model.tile_lod.isVisible())
+        self.assertLess(self.model.tile_lod.tileCount(), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()